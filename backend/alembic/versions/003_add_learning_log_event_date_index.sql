@@ -0,0 +1,10 @@
+-- Migration: Add composite (event_type, date) index on learning_log
+-- Date: 2026-10-17
+-- Description: Lets event-type + date-window lookups (e.g. recent REGIME_SHIFT rows)
+--              seek on one index instead of combining two single-column indexes
+
+CREATE INDEX IF NOT EXISTS idx_learning_log_event_type_date
+    ON learning_log(event_type, date);
+
+-- Rollback command (run this to undo migration):
+-- DROP INDEX IF EXISTS idx_learning_log_event_type_date;
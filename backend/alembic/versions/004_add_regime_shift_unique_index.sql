@@ -0,0 +1,20 @@
+-- Migration: Deduplicate REGIME_SHIFT rows in learning_log
+-- Date: 2026-10-17
+-- Description: Partial unique index used as the ON CONFLICT target when logging
+--              regime shifts, so concurrent workers record each shift once per day
+
+-- Remove existing duplicates, keeping the earliest row
+DELETE FROM learning_log a
+    USING learning_log b
+    WHERE a.event_type = 'REGIME_SHIFT'
+      AND b.event_type = 'REGIME_SHIFT'
+      AND a.date = b.date
+      AND a.metric_name IS NOT DISTINCT FROM b.metric_name
+      AND a.id > b.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uix_learning_log_regime_shift
+    ON learning_log(date, event_type, metric_name)
+    WHERE event_type = 'REGIME_SHIFT';
+
+-- Rollback command (run this to undo migration):
+-- DROP INDEX IF EXISTS uix_learning_log_regime_shift;
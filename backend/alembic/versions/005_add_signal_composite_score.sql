@@ -0,0 +1,30 @@
+-- Migration: Persist SignalRanker composite score on signals
+-- Date: 2026-10-17
+-- Description: Score is computed when a signal is written so the top BUY signals
+--              can be read with an indexed ORDER BY instead of ranking in Python
+
+ALTER TABLE signals ADD COLUMN IF NOT EXISTS composite_score DOUBLE PRECISION;
+
+-- Backfill existing rows with SignalRanker.composite_score
+-- (_expected_return / _risk_factor); keep the two in sync
+UPDATE signals
+SET composite_score = ROUND((
+        confidence / 5.0
+        * CASE
+            WHEN entry_price > 0 AND target_price <> 0
+                THEN (target_price - entry_price) / entry_price
+            ELSE 0.10
+          END
+        / CASE
+            WHEN entry_price > 0 AND stop_loss <> 0
+                THEN GREATEST(1.0, (entry_price - stop_loss) / entry_price * 10)
+            ELSE 1.5
+          END
+    )::numeric, 6)
+WHERE composite_score IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_signals_composite_score ON signals(composite_score);
+
+-- Rollback command (run this to undo migration):
+-- DROP INDEX IF EXISTS ix_signals_composite_score;
+-- ALTER TABLE signals DROP COLUMN IF EXISTS composite_score;
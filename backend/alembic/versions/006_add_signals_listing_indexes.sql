@@ -0,0 +1,15 @@
+-- Migration: Add listing indexes on signals
+-- Date: 2026-10-17
+-- Description: Composite index for get_signals (time window + ticker/type/status
+--              filters, newest first) and a partial index for the pending queue
+
+CREATE INDEX IF NOT EXISTS idx_signals_timestamp_ticker_type_status
+    ON signals(timestamp DESC, ticker, signal_type, status);
+
+CREATE INDEX IF NOT EXISTS idx_signals_pending
+    ON signals(timestamp DESC)
+    WHERE status = 'PENDING';
+
+-- Rollback command (run this to undo migration):
+-- DROP INDEX IF EXISTS idx_signals_pending;
+-- DROP INDEX IF EXISTS idx_signals_timestamp_ticker_type_status;
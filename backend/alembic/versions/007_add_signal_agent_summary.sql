@@ -0,0 +1,36 @@
+-- Migration: Denormalize agent analysis summary onto signals
+-- Date: 2026-10-17
+-- Description: Agent count and agreement are stored when a signal is written so
+--              list views can render them without joining agent_analysis
+
+ALTER TABLE signals ADD COLUMN IF NOT EXISTS agent_count INTEGER;
+ALTER TABLE signals ADD COLUMN IF NOT EXISTS agent_agreement DOUBLE PRECISION;
+
+-- Backfill existing rows; STRONG_BUY/STRONG_SELL count as agreeing with BUY/SELL
+UPDATE signals s
+SET agent_count = summary.agent_count,
+    agent_agreement = summary.agent_agreement
+FROM (
+    SELECT
+        aa.signal_id,
+        COUNT(*) AS agent_count,
+        ROUND(AVG(
+            CASE
+                WHEN (CASE
+                        WHEN aa.recommendation IN ('BUY', 'STRONG_BUY') THEN 'BUY'
+                        WHEN aa.recommendation IN ('SELL', 'STRONG_SELL') THEN 'SELL'
+                        ELSE 'HOLD'
+                      END) = sig.signal_type THEN 1.0
+                ELSE 0.0
+            END
+        ), 4) AS agent_agreement
+    FROM agent_analysis aa
+    JOIN signals sig ON sig.id = aa.signal_id
+    GROUP BY aa.signal_id
+) AS summary
+WHERE s.id = summary.signal_id
+  AND s.agent_count IS NULL;
+
+-- Rollback command (run this to undo migration):
+-- ALTER TABLE signals DROP COLUMN IF EXISTS agent_agreement;
+-- ALTER TABLE signals DROP COLUMN IF EXISTS agent_count;
@@ -0,0 +1,21 @@
+-- Migration: Store signals.signal_type as a SMALLINT code
+-- Date: 2026-10-17
+-- Description: HOLD=0, BUY=1, SELL=2 (SIGNAL_TYPE_CODES in app/models/signal.py);
+--              smaller index entries and integer comparisons for type filters
+
+ALTER TABLE signals
+    ALTER COLUMN signal_type TYPE SMALLINT
+    USING CASE signal_type
+        WHEN 'HOLD' THEN 0
+        WHEN 'BUY' THEN 1
+        WHEN 'SELL' THEN 2
+    END;
+
+ALTER TABLE signals
+    ADD CONSTRAINT ck_signals_signal_type CHECK (signal_type IN (0, 1, 2));
+
+-- Rollback command (run this to undo migration):
+-- ALTER TABLE signals DROP CONSTRAINT IF EXISTS ck_signals_signal_type;
+-- ALTER TABLE signals
+--     ALTER COLUMN signal_type TYPE VARCHAR(10)
+--     USING CASE signal_type WHEN 0 THEN 'HOLD' WHEN 1 THEN 'BUY' WHEN 2 THEN 'SELL' END;
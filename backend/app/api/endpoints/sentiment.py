@@ -3,12 +3,14 @@ Sentiment Data API Endpoints
 Fetch social media and news sentiment
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.api.deps import get_db
-from app.services.sentiment_data import sentiment_service
+from app.services.sentiment_data import get_sentiment_service
 
 router = APIRouter()
 
@@ -29,7 +31,7 @@ async def get_sentiment(ticker: str):
     - Total mentions across sources
     """
     ticker = ticker.upper()
-    sentiment = sentiment_service.aggregate_sentiment(ticker)
+    sentiment = await get_sentiment_service().aggregate_sentiment_async(ticker)
 
     return sentiment
 
@@ -52,7 +54,8 @@ async def get_reddit_sentiment(ticker: str):
     - Top posts with high engagement
     """
     ticker = ticker.upper()
-    reddit_data = sentiment_service.get_reddit_sentiment(ticker)
+    # Blocking Reddit API calls run in a worker thread
+    reddit_data = await asyncio.to_thread(get_sentiment_service().get_reddit_sentiment, ticker)
 
     return reddit_data
 
@@ -71,7 +74,7 @@ async def get_news_sentiment(ticker: str):
     - Recent headlines with sentiment
     """
     ticker = ticker.upper()
-    news_data = sentiment_service.get_news_sentiment(ticker)
+    news_data = await asyncio.to_thread(get_sentiment_service().get_news_sentiment, ticker)
 
     return news_data
 
@@ -88,6 +91,8 @@ async def get_trending_tickers(
 
     Returns list of tickers sorted by mention count
     """
-    trending = sentiment_service.get_trending_tickers(subreddit=subreddit, limit=limit)
+    trending = await asyncio.to_thread(
+        get_sentiment_service().get_trending_tickers, subreddit=subreddit, limit=limit
+    )
 
     return {"subreddit": subreddit, "trending_tickers": trending}
@@ -28,7 +28,7 @@ from app.agents import (
     PredictorAgent,
 )
 from app.services.market_data import market_data_service
-from app.services.sentiment_data import sentiment_service
+from app.services.sentiment_data import get_sentiment_service
 from app.services.signal_service import get_signal_service
 from app.core.config import settings
 from app.core.database import get_db
@@ -166,7 +166,7 @@ async def generate_signal(
     sentiment_data = None
     if include_sentiment:
         try:
-            sentiment_data = sentiment_service.aggregate_sentiment(ticker)
+            sentiment_data = get_sentiment_service().aggregate_sentiment(ticker)
         except Exception as e:
             logger.warning(f"Failed to get sentiment for {ticker}: {e}")
 
@@ -245,11 +245,14 @@ async def list_signals(
         days=days,
         limit=limit,
         offset=offset,
+        include_analyses=True,
     )
 
     return {
         "count": len(signals),
-        "signals": [signal_service.signal_to_dict(s) for s in signals],
+        "signals": [
+            signal_service.signal_to_dict(s, include_analyses=True) for s in signals
+        ],
     }
 
 
@@ -292,11 +295,10 @@ async def get_paper_trading_data(
 
     signal_service = get_signal_service(db)
 
-    # Get all signals from the period
-    signals = signal_service.get_signals(days=days, limit=500)
-
-    # Filter to BUY signals only (that's what we track for paper trading)
-    buy_signals = [s for s in signals if s.signal_type == "BUY"]
+    # BUY signals only (that's what we track for paper trading), summary columns
+    buy_signals = signal_service.get_signals_summary(
+        signal_type="BUY", days=days, limit=500
+    )
 
     # Get current prices for all tickers
     tickers = list(set(s.ticker for s in buy_signals))
@@ -483,7 +485,7 @@ async def get_signal(
     if not signal:
         raise HTTPException(status_code=404, detail=f"Signal {signal_id} not found")
 
-    return signal_service.signal_to_dict(signal)
+    return signal_service.signal_to_dict(signal, include_analyses=True)
 
 
 @router.patch("/{signal_id}/status")
@@ -521,7 +523,10 @@ async def update_signal_status(
     if not updated:
         raise HTTPException(status_code=404, detail=f"Signal {signal_id} not found")
 
-    return signal_service.signal_to_dict(updated)
+    # The updated signal has no relationships loaded; reload with its analyses
+    return signal_service.signal_to_dict(
+        signal_service.get_signal(signal_id), include_analyses=True
+    )
 
 
 @router.post("/generate-all")
@@ -574,7 +579,7 @@ async def generate_all_signals(
             # Get sentiment (optional, don't fail if unavailable)
             sentiment_data = None
             try:
-                sentiment_data = sentiment_service.aggregate_sentiment(ticker)
+                sentiment_data = get_sentiment_service().aggregate_sentiment(ticker)
             except Exception:
                 pass
 
@@ -670,7 +675,7 @@ async def analyze_single_agent(
 
     # Get sentiment data
     try:
-        sentiment_data = sentiment_service.aggregate_sentiment(ticker)
+        sentiment_data = get_sentiment_service().aggregate_sentiment(ticker)
     except Exception:
         sentiment_data = None
 
@@ -1,3 +1,5 @@
+import json
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -8,7 +10,26 @@ database_url = settings.DATABASE_URL
 if database_url.startswith("postgresql://"):
     database_url = database_url.replace("postgresql://", "postgresql+psycopg://", 1)
 
-engine = create_engine(database_url, pool_pre_ping=True)
+try:
+    import orjson
+
+    def _json_serializer(data) -> str:
+        """Serialize JSONB values once per row with orjson."""
+        return orjson.dumps(
+            data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    _json_deserializer = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    _json_serializer = json.dumps
+    _json_deserializer = json.loads
+
+engine = create_engine(
+    database_url,
+    pool_pre_ping=True,
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -1,12 +1,26 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.endpoints import health, market, sentiment, data, signals, backtest, telegram, learning
+from app.services.regime_kernels import warmup_kernels
+from app.services.telegram_bot import close_telegram_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Compile numeric kernels before serving traffic; close HTTP clients on shutdown"""
+    warmup_kernels()
+    yield
+    await close_telegram_service()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS middleware
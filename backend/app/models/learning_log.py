@@ -3,8 +3,8 @@ Learning Log Model
 Records all learning system events: weight updates, bias detection, corrections, alerts.
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, Date, Text, DateTime
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Numeric, Date, Text, DateTime, Index
+from sqlalchemy.sql import func, text
 from app.core.database import Base
 
 
@@ -38,6 +38,19 @@ class LearningLog(Base):
 
     created_at = Column(DateTime, nullable=False, server_default=func.now())
 
+    __table_args__ = (
+        Index("idx_learning_log_event_type_date", "event_type", "date"),
+        # One REGIME_SHIFT row per day and target regime (upsert target)
+        Index(
+            "uix_learning_log_regime_shift",
+            "date",
+            "event_type",
+            "metric_name",
+            unique=True,
+            postgresql_where=text("event_type = 'REGIME_SHIFT'"),
+        ),
+    )
+
     def __repr__(self):
         return (
             f"<LearningLog(date={self.date}, type={self.event_type}, "
@@ -3,11 +3,33 @@ Signal Model
 Generated buy/sell signals from agent consensus
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, Text, ForeignKey
+from sqlalchemy import (
+    CheckConstraint, Column, Integer, SmallInteger, String, Numeric, Float, DateTime, Text,
+    ForeignKey, Index,
+)
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
+from sqlalchemy.types import TypeDecorator
 from app.core.database import Base
 
+# signal_type is stored as a SMALLINT code; Python code sees the strings
+SIGNAL_TYPE_CODES = {"HOLD": 0, "BUY": 1, "SELL": 2}
+SIGNAL_TYPE_NAMES = {code: name for name, code in SIGNAL_TYPE_CODES.items()}
+
+
+class SignalTypeCode(TypeDecorator):
+    """BUY/SELL/HOLD stored as a 2-byte integer code."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        # Unknown names bind as NULL, so filters on them match nothing
+        return None if value is None else SIGNAL_TYPE_CODES.get(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else SIGNAL_TYPE_NAMES[value]
+
 
 class Signal(Base):
     __tablename__ = "signals"
@@ -15,11 +37,14 @@ class Signal(Base):
     id = Column(Integer, primary_key=True, index=True)
     timestamp = Column(DateTime, nullable=False, server_default=func.now(), index=True)
     ticker = Column(String(10), ForeignKey("watchlist.ticker"), nullable=False, index=True)
-    signal_type = Column(String(10), nullable=False)  # BUY, SELL, HOLD
+    signal_type = Column(SignalTypeCode, nullable=False)  # BUY, SELL, HOLD
     confidence = Column(Integer, nullable=False)  # 1-5 (number of agents agreeing)
     entry_price = Column(Numeric(10, 2))
     target_price = Column(Numeric(10, 2))
     stop_loss = Column(Numeric(10, 2))
+    composite_score = Column(Float, index=True)  # SignalRanker score, set on write
+    agent_count = Column(Integer)  # Number of agent analyses, set on write
+    agent_agreement = Column(Float)  # Fraction of agents agreeing with signal_type
     position_size = Column(Integer)  # Number of shares
     status = Column(
         String(20), default="PENDING", index=True
@@ -29,6 +54,26 @@ class Signal(Base):
     pnl = Column(Numeric(10, 2))
     notes = Column(Text)
 
+    __table_args__ = (
+        # get_signals: time window + optional ticker/type/status filters,
+        # newest first, so the planner can stop at LIMIT
+        Index(
+            "idx_signals_timestamp_ticker_type_status",
+            timestamp.desc(),
+            ticker,
+            signal_type,
+            status,
+        ),
+        # get_pending_signals: small partial index over the approval queue
+        Index(
+            "idx_signals_pending",
+            timestamp.desc(),
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        # Only the codes in SIGNAL_TYPE_CODES are valid
+        CheckConstraint("signal_type IN (0, 1, 2)", name="ck_signals_signal_type"),
+    )
+
     # Relationships
     watchlist_item = relationship("Watchlist", back_populates="signals")
     agent_analyses = relationship("AgentAnalysis", back_populates="signal")
@@ -4,7 +4,7 @@ Data fetching, aggregation, backtesting, and learning services
 """
 
 from app.services.market_data import market_data_service, MarketDataService
-from app.services.sentiment_data import sentiment_service, SentimentDataService
+from app.services.sentiment_data import get_sentiment_service, SentimentDataService
 from app.services.data_aggregator import data_aggregator, DataAggregatorService
 from app.services.signal_service import SignalService, get_signal_service
 from app.services.signal_ranker import signal_ranker, SignalRanker
@@ -18,7 +18,7 @@ from app.services.regime_detector import RegimeDetector, MarketRegime
 __all__ = [
     "market_data_service",
     "MarketDataService",
-    "sentiment_service",
+    "get_sentiment_service",
     "SentimentDataService",
     "data_aggregator",
     "DataAggregatorService",
@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
 from app.services.market_data import market_data_service
-from app.services.sentiment_data import sentiment_service
+from app.services.sentiment_data import get_sentiment_service
 from app.models.market_data import MarketData
 from app.models.sentiment_data import SentimentData
 from app.models.watchlist import Watchlist
@@ -45,7 +45,7 @@ class DataAggregatorService:
         quote = market_data_service.get_quote(ticker)
         historical = market_data_service.get_historical_data(ticker, days=30)
         technical = market_data_service.get_technical_indicators(ticker)
-        sentiment = sentiment_service.aggregate_sentiment(ticker)
+        sentiment = get_sentiment_service().aggregate_sentiment(ticker)
 
         # Calculate additional metrics
         analysis = {
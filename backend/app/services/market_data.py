@@ -3,8 +3,11 @@ Market Data Service
 Aggregates market data from multiple sources: Polygon.io, Finnhub, Alpha Vantage
 """
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from app.core.config import settings
@@ -14,11 +17,21 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _create_session() -> requests.Session:
+    """Create a keep-alive HTTP session with a pooled adapter."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def _make_request(
     url: str,
     params: Dict,
     timeout: int = 10,
     max_retries: int = 3,
+    session: Optional[requests.Session] = None,
 ) -> Optional[requests.Response]:
     """
     Make an HTTP request with retry logic.
@@ -28,15 +41,17 @@ def _make_request(
         params: Query parameters
         timeout: Request timeout in seconds
         max_retries: Maximum retry attempts
+        session: Pooled session to reuse connections (default: new connection)
 
     Returns:
         Response object or None on failure
     """
     delay = 1.0  # Initial delay in seconds
+    http = session or requests
 
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, params=params, timeout=timeout)
+            response = http.get(url, params=params, timeout=timeout)
 
             # Handle rate limiting
             if response.status_code == 429:
@@ -97,10 +112,14 @@ def _make_request(
 class MarketDataService:
     """Aggregate market data from multiple sources with fallback logic"""
 
+    # Concurrent provider requests issued by batch fetches
+    MAX_PARALLEL_FETCHES = 4
+
     def __init__(self):
         self.polygon_base = "https://api.polygon.io"
         self.finnhub_base = "https://finnhub.io/api/v1"
         self.av_base = "https://www.alphavantage.co/query"
+        self.session = _create_session()
 
     def get_current_price(self, ticker: str) -> Optional[float]:
         """
@@ -134,7 +153,9 @@ class MarketDataService:
         try:
             url = f"{self.polygon_base}/v2/aggs/ticker/{ticker}/prev"
             params = {"apiKey": settings.POLYGON_API_KEY}
-            response = _make_request(url, params, timeout=10, max_retries=3)
+            response = _make_request(
+                url, params, timeout=10, max_retries=3, session=self.session
+            )
 
             if response and response.status_code == 200:
                 data = response.json()
@@ -158,7 +179,9 @@ class MarketDataService:
         try:
             url = f"{self.finnhub_base}/quote"
             params = {"symbol": ticker, "token": settings.FINNHUB_API_KEY}
-            response = _make_request(url, params, timeout=10, max_retries=3)
+            response = _make_request(
+                url, params, timeout=10, max_retries=3, session=self.session
+            )
 
             if response and response.status_code == 200:
                 data = response.json()
@@ -197,6 +220,79 @@ class MarketDataService:
         logger.error(f"All historical data sources failed for {ticker}")
         return []
 
+    def get_batch_historical(
+        self, tickers: List[str], days: int = 30
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get historical OHLCV data for several tickers in one pass
+
+        None of the configured providers offer a multi-symbol history
+        endpoint, so each unique ticker is fetched once, concurrently over
+        the pooled session, and callers that need overlapping series share
+        the same result.
+
+        Args:
+            tickers: Stock ticker symbols (duplicates are fetched once)
+            days: Number of days of history (default 30)
+
+        Returns:
+            Dictionary mapping ticker to OHLCV list sorted by date descending
+        """
+        unique_tickers = list(dict.fromkeys(tickers))
+        if len(unique_tickers) <= 1:
+            return {
+                ticker: self.get_historical_data(ticker, days)
+                for ticker in unique_tickers
+            }
+
+        workers = min(len(unique_tickers), self.MAX_PARALLEL_FETCHES)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            histories = executor.map(
+                lambda ticker: self.get_historical_data(ticker, days),
+                unique_tickers,
+            )
+            return dict(zip(unique_tickers, histories))
+
+    def get_historical_closes(self, ticker: str, days: int = 30) -> np.ndarray:
+        """
+        Get historical close prices as a contiguous array
+
+        Args:
+            ticker: Stock ticker symbol
+            days: Number of days of history (default 30)
+
+        Returns:
+            float64 array of closes sorted by date ascending (oldest first)
+        """
+        return self._closes_array(self.get_historical_data(ticker, days))
+
+    def get_batch_closes(
+        self, tickers: List[str], days: int = 30
+    ) -> Dict[str, np.ndarray]:
+        """
+        Get historical close prices for several tickers in one pass
+
+        Args:
+            tickers: Stock ticker symbols (duplicates are fetched once)
+            days: Number of days of history (default 30)
+
+        Returns:
+            Dictionary mapping ticker to a float64 close array, oldest first
+        """
+        return {
+            ticker: self._closes_array(history)
+            for ticker, history in self.get_batch_historical(tickers, days).items()
+        }
+
+    @staticmethod
+    def _closes_array(historical: List[Dict]) -> np.ndarray:
+        """Convert newest-first OHLCV dicts to an oldest-first close array"""
+        return np.fromiter(
+            (float(bar["close"]) for bar in reversed(historical)),
+            dtype=np.float64,
+            count=len(historical),
+        )
+
     def _get_historical_alphavantage(self, ticker: str, days: int) -> List[Dict]:
         """Get historical data from Alpha Vantage with retry logic"""
         if not settings.ALPHA_VANTAGE_API_KEY:
@@ -210,7 +306,9 @@ class MarketDataService:
                 "apikey": settings.ALPHA_VANTAGE_API_KEY,
                 "outputsize": "compact",  # last 100 days
             }
-            response = _make_request(self.av_base, params, timeout=15, max_retries=3)
+            response = _make_request(
+                self.av_base, params, timeout=15, max_retries=3, session=self.session
+            )
 
             if response and response.status_code == 200:
                 data = response.json()
@@ -260,7 +358,9 @@ class MarketDataService:
 
             url = f"{self.polygon_base}/v2/aggs/ticker/{ticker}/range/1/day/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
             params = {"apiKey": settings.POLYGON_API_KEY, "limit": days}
-            response = _make_request(url, params, timeout=15, max_retries=3)
+            response = _make_request(
+                url, params, timeout=15, max_retries=3, session=self.session
+            )
 
             if response and response.status_code == 200:
                 data = response.json()
@@ -338,7 +438,9 @@ class MarketDataService:
                 "series_type": "close",
                 "apikey": settings.ALPHA_VANTAGE_API_KEY,
             }
-            response = _make_request(self.av_base, params, timeout=15, max_retries=3)
+            response = _make_request(
+                self.av_base, params, timeout=15, max_retries=3, session=self.session
+            )
 
             if response and response.status_code == 200:
                 data = response.json()
@@ -436,7 +538,7 @@ class MarketDataService:
             try:
                 url = f"{self.finnhub_base}/quote"
                 params = {"symbol": ticker, "token": settings.FINNHUB_API_KEY}
-                response = requests.get(url, params=params, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -7,6 +7,7 @@ Strategies:
 - DIVERSIFIED: 80% equally across top 5 (16% each), 20% cash
 """
 
+from operator import attrgetter, itemgetter
 from typing import List, Dict, Literal
 import logging
 
@@ -15,6 +16,10 @@ logger = logging.getLogger(__name__)
 # Type alias for allocation modes
 AllocationMode = Literal["CORE_FOCUS", "BALANCED", "DIVERSIFIED"]
 
+# C-level accessors for the ranked-signal dicts used in the allocation loops
+_signal_and_score = itemgetter("signal", "score")
+_entry_price = attrgetter("entry_price")
+
 
 class PortfolioAllocator:
     """Allocates capital across signals based on selected strategy."""
@@ -78,39 +83,39 @@ class PortfolioAllocator:
             return positions
 
         # Core position (60%)
-        core_signal = ranked_signals[0]
+        core_signal, core_score = _signal_and_score(ranked_signals[0])
         core_dollars = capital * 0.60
-        entry_price = float(core_signal["signal"].entry_price or 100)
+        entry_price = float(_entry_price(core_signal) or 100)
         core_shares = int(core_dollars / entry_price) if entry_price > 0 else 0
 
         positions.append(
             {
-                "signal": core_signal["signal"],
+                "signal": core_signal,
                 "allocation_pct": 0.60,
                 "allocation_dollars": round(core_dollars, 2),
                 "shares": core_shares,
                 "position_type": "CORE",
                 "rank": 1,
-                "score": core_signal["score"],
+                "score": core_score,
             }
         )
 
         # Satellite positions (next 3, 10% each)
         satellite_capital_per = capital * 0.10
-        for i in range(1, min(4, len(ranked_signals))):
-            sat_signal = ranked_signals[i]
-            entry_price = float(sat_signal["signal"].entry_price or 100)
+        satellites = map(_signal_and_score, ranked_signals[1:4])
+        for rank, (sat_signal, sat_score) in enumerate(satellites, start=2):
+            entry_price = float(_entry_price(sat_signal) or 100)
             sat_shares = int(satellite_capital_per / entry_price) if entry_price > 0 else 0
 
             positions.append(
                 {
-                    "signal": sat_signal["signal"],
+                    "signal": sat_signal,
                     "allocation_pct": 0.10,
                     "allocation_dollars": round(satellite_capital_per, 2),
                     "shares": sat_shares,
                     "position_type": "SATELLITE",
-                    "rank": i + 1,
-                    "score": sat_signal["score"],
+                    "rank": rank,
+                    "score": sat_score,
                 }
             )
 
@@ -139,39 +144,39 @@ class PortfolioAllocator:
             return positions
 
         # Core position (40%)
-        core_signal = ranked_signals[0]
+        core_signal, core_score = _signal_and_score(ranked_signals[0])
         core_dollars = capital * 0.40
-        entry_price = float(core_signal["signal"].entry_price or 100)
+        entry_price = float(_entry_price(core_signal) or 100)
         core_shares = int(core_dollars / entry_price) if entry_price > 0 else 0
 
         positions.append(
             {
-                "signal": core_signal["signal"],
+                "signal": core_signal,
                 "allocation_pct": 0.40,
                 "allocation_dollars": round(core_dollars, 2),
                 "shares": core_shares,
                 "position_type": "CORE",
                 "rank": 1,
-                "score": core_signal["score"],
+                "score": core_score,
             }
         )
 
         # Satellite positions (next 4, 12.5% each)
         satellite_capital_per = capital * 0.125
-        for i in range(1, min(5, len(ranked_signals))):
-            sat_signal = ranked_signals[i]
-            entry_price = float(sat_signal["signal"].entry_price or 100)
+        satellites = map(_signal_and_score, ranked_signals[1:5])
+        for rank, (sat_signal, sat_score) in enumerate(satellites, start=2):
+            entry_price = float(_entry_price(sat_signal) or 100)
             sat_shares = int(satellite_capital_per / entry_price) if entry_price > 0 else 0
 
             positions.append(
                 {
-                    "signal": sat_signal["signal"],
+                    "signal": sat_signal,
                     "allocation_pct": 0.125,
                     "allocation_dollars": round(satellite_capital_per, 2),
                     "shares": sat_shares,
                     "position_type": "SATELLITE",
-                    "rank": i + 1,
-                    "score": sat_signal["score"],
+                    "rank": rank,
+                    "score": sat_score,
                 }
             )
 
@@ -203,20 +208,20 @@ class PortfolioAllocator:
         allocation_per = 0.80 / num_positions
         capital_per = (capital * 0.80) / num_positions
 
-        for i in range(num_positions):
-            sig = ranked_signals[i]
-            entry_price = float(sig["signal"].entry_price or 100)
+        top = map(_signal_and_score, ranked_signals[:num_positions])
+        for rank, (signal, score) in enumerate(top, start=1):
+            entry_price = float(_entry_price(signal) or 100)
             shares = int(capital_per / entry_price) if entry_price > 0 else 0
 
             positions.append(
                 {
-                    "signal": sig["signal"],
+                    "signal": signal,
                     "allocation_pct": round(allocation_per, 4),
                     "allocation_dollars": round(capital_per, 2),
                     "shares": shares,
                     "position_type": "EQUAL",
-                    "rank": i + 1,
-                    "score": sig["score"],
+                    "rank": rank,
+                    "score": score,
                 }
             )
 
@@ -10,16 +10,21 @@ Market Regimes:
 """
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
+import numpy as np
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.models.learning_log import LearningLog
 from app.models.market_data import MarketData
-from app.services.market_data import MarketDataService
+from app.services.market_data import market_data_service
+from app.services.regime_kernels import calculate_returns, sma_last
 
 logger = logging.getLogger(__name__)
 
@@ -73,22 +78,48 @@ class RegimeDetector:
     SMA_BEAR_THRESHOLD = -0.05  # SPY 5% below SMA(200) = BEAR_MARKET
     CORRELATION_DIVERGENCE_THRESHOLD = 0.3  # Low correlation = DIVERGENCE
 
+    # History windows
+    AI_SECTOR_TICKERS = ["NVDA", "MSFT", "GOOGL"]
+    HISTORY_DAYS = 365  # Enough trading days for SMA(200)
+    CORRELATION_WINDOW = 30  # Trading days used for AI sector correlation
+
+    # Reuse a detection result for this many seconds
+    CACHE_TTL = 60.0
+
+    # REGIME_SHIFT rows loaded once and shared by the log lookups
+    SHIFT_WINDOW_DAYS = 30
+
     def __init__(self, db: Session):
         self.db = db
-        self.market_data_service = MarketDataService()
+        self.market_data_service = market_data_service
         self.logger = logging.getLogger("regime_detector")
+        self._regime_cache: Optional[Tuple[float, RegimeAnalysis]] = None
+        self._shift_cache: Optional[Tuple[date, List[LearningLog]]] = None
 
-    def detect_current_regime(self) -> RegimeAnalysis:
+    def detect_current_regime(self, use_cache: bool = True) -> RegimeAnalysis:
         """
         Detect the current market regime.
 
+        Args:
+            use_cache: Reuse a result computed within CACHE_TTL seconds
+
         Returns:
             RegimeAnalysis with current regime and supporting data
         """
-        # Get market indicators
-        vix_level = self._get_vix_level()
-        spy_vs_sma = self._get_spy_vs_sma200()
-        ai_correlation = self._get_ai_sector_correlation()
+        if use_cache and self._regime_cache is not None:
+            cached_at, analysis = self._regime_cache
+            if time.monotonic() - cached_at < self.CACHE_TTL:
+                return analysis
+
+        # The VIX quote runs in a worker thread while the DB lookup stays on
+        # this thread (the SQLAlchemy session is not thread-safe)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            vix_future = executor.submit(self._fetch_vix_quote)
+            previous_regime = self._get_previous_regime()
+            vix_level = vix_future.result()
+
+        if vix_level is None:
+            vix_level = self._get_vix_from_db()
 
         # Determine regime based on priority
         # 1. HIGH_VOLATILITY takes precedence if VIX is extreme
@@ -96,55 +127,59 @@ class RegimeDetector:
         # 3. DIVERGENCE if AI sector uncorrelated
         # 4. NORMAL otherwise
 
-        reasoning_parts = []
+        # At most one condition fires: each later check requires NORMAL
+        condition = "Normal market conditions"
         current_regime = MarketRegime.NORMAL
         confidence = 0.8
+        spy_vs_sma = None
+        ai_correlation = None
 
         # Check VIX first (highest priority during crises)
         if vix_level is not None:
             if vix_level >= self.VIX_EXTREME_THRESHOLD:
                 current_regime = MarketRegime.HIGH_VOLATILITY
                 confidence = 0.95
-                reasoning_parts.append(f"VIX at {vix_level:.1f} (extreme fear)")
+                condition = f"VIX at {vix_level:.1f} (extreme fear)"
             elif vix_level >= self.VIX_HIGH_THRESHOLD:
                 current_regime = MarketRegime.HIGH_VOLATILITY
                 confidence = 0.85
-                reasoning_parts.append(f"VIX at {vix_level:.1f} (elevated)")
+                condition = f"VIX at {vix_level:.1f} (elevated)"
+
+        if current_regime != MarketRegime.NORMAL:
+            # Trend and sector checks cannot override VIX; skip their fetches
+            self.logger.debug(
+                f"Skipping SPY trend and AI sector checks (VIX {vix_level:.1f})"
+            )
+        else:
+            closes = self._fetch_closes()
+            spy_vs_sma = self._get_spy_vs_sma200(closes.get("SPY"))
+            ai_correlation = self._get_ai_sector_correlation(closes)
 
         # Check SPY trend (bear market overrides normal but not volatility)
         if spy_vs_sma is not None and current_regime == MarketRegime.NORMAL:
             if spy_vs_sma <= self.SMA_BEAR_THRESHOLD:
                 current_regime = MarketRegime.BEAR_MARKET
                 confidence = 0.85
-                reasoning_parts.append(
-                    f"SPY {spy_vs_sma*100:.1f}% below SMA(200)"
-                )
+                condition = f"SPY {spy_vs_sma*100:.1f}% below SMA(200)"
 
         # Check AI sector correlation (divergence is informational)
         if ai_correlation is not None and current_regime == MarketRegime.NORMAL:
             if ai_correlation < self.CORRELATION_DIVERGENCE_THRESHOLD:
                 current_regime = MarketRegime.DIVERGENCE
                 confidence = 0.75
-                reasoning_parts.append(
-                    f"AI sector correlation {ai_correlation:.2f} (decoupled)"
-                )
+                condition = f"AI sector correlation {ai_correlation:.2f} (decoupled)"
 
-        # Get previous regime
-        previous_regime = self._get_previous_regime()
         regime_changed = previous_regime != current_regime if previous_regime else False
 
         # Build reasoning
-        if not reasoning_parts:
-            reasoning_parts.append("Normal market conditions")
-
-        if regime_changed and previous_regime:
-            reasoning_parts.append(f"Regime shift from {previous_regime.value}")
-
-        # Log regime shift
+        reasoning = condition
         if regime_changed:
-            self._log_regime_shift(previous_regime, current_regime, reasoning_parts)
+            reasoning = f"{condition}; Regime shift from {previous_regime.value}"
+
+            # Log regime shift
+            self._log_regime_shift(previous_regime, current_regime, reasoning)
 
-        return RegimeAnalysis(
+        analysis = RegimeAnalysis(
             current_regime=current_regime,
             previous_regime=previous_regime,
             regime_changed=regime_changed,
@@ -152,144 +187,177 @@ class RegimeDetector:
             spy_vs_sma200=spy_vs_sma,
             ai_sector_correlation=ai_correlation,
             confidence=confidence,
-            reasoning="; ".join(reasoning_parts),
+            reasoning=reasoning,
         )
+        self._regime_cache = (time.monotonic(), analysis)
+        return analysis
 
-    def _get_vix_level(self) -> Optional[float]:
-        """Get current VIX level from market data."""
+    def _fetch_vix_quote(self) -> Optional[float]:
+        """Get current VIX level from the market data service."""
         try:
-            # Try to get VIX from market data service
-            vix_data = self.market_data_service.get_current_price("^VIX")
-            if vix_data and "price" in vix_data:
-                return float(vix_data["price"])
+            price = self.market_data_service.get_current_price("^VIX")
+            if price is not None:
+                return float(price)
         except Exception as e:
             self.logger.warning(f"Failed to get VIX level: {e}")
 
-        # Fallback: check database for recent VIX data
+        return None
+
+    def _get_vix_from_db(self) -> Optional[float]:
+        """Fallback: check database for recent VIX data."""
         try:
-            recent = (
-                self.db.query(MarketData)
+            close = (
+                self.db.query(MarketData.close)
                 .filter(MarketData.ticker == "^VIX")
-                .order_by(MarketData.date.desc())
-                .first()
+                .order_by(MarketData.timestamp.desc())
+                .limit(1)
+                .scalar()
             )
-            if recent and recent.close:
-                return float(recent.close)
+            if close:
+                return float(close)
         except Exception as e:
             self.logger.warning(f"Failed to get VIX from database: {e}")
 
         return None
 
-    def _get_spy_vs_sma200(self) -> Optional[float]:
+    def _fetch_closes(self) -> Dict[str, np.ndarray]:
         """
-        Calculate SPY price relative to its 200-day SMA.
+        Fetch SPY and AI sector close prices in a single batch.
 
         Returns:
-            Percentage above/below SMA(200), e.g., -0.05 means 5% below
+            Dict of ticker -> float64 close array, oldest bar first
         """
         try:
-            # Get historical SPY data (need 200 days for SMA)
-            history = self.market_data_service.get_historical_data(
-                "SPY", period="1y"
+            return self.market_data_service.get_batch_closes(
+                ["SPY", *self.AI_SECTOR_TICKERS], days=self.HISTORY_DAYS
             )
-            if not history or len(history) < 200:
+        except Exception as e:
+            self.logger.warning(f"Failed to fetch market history: {e}")
+            return {}
+
+    def _get_spy_vs_sma200(
+        self, spy_closes: Optional[np.ndarray] = None
+    ) -> Optional[float]:
+        """
+        Calculate SPY price relative to its 200-day SMA.
+
+        Args:
+            spy_closes: Prefetched SPY closes (oldest first); fetched if None
+
+        Returns:
+            Percentage above/below SMA(200), e.g., -0.05 means 5% below
+        """
+        closes = spy_closes
+        if closes is None:
+            try:
+                closes = self.market_data_service.get_historical_closes(
+                    "SPY", days=self.HISTORY_DAYS
+                )
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to fetch SPY history: {type(e).__name__}: {e}"
+                )
                 return None
 
-            # Calculate SMA(200)
-            closes = [float(h.get("close", 0)) for h in history[-200:]]
-            sma_200 = sum(closes) / len(closes)
+        if len(closes) < 200:
+            return None
 
-            # Get current price
-            current_price = float(history[-1].get("close", 0))
+        # Calculate SMA(200)
+        sma_200 = sma_last(np.ascontiguousarray(closes, dtype=np.float64), 200)
 
-            if sma_200 > 0:
-                return (current_price - sma_200) / sma_200
+        # Get current price
+        current_price = float(closes[-1])
 
-        except Exception as e:
-            self.logger.warning(f"Failed to calculate SPY vs SMA(200): {e}")
+        if sma_200 > 0:
+            return (current_price - sma_200) / sma_200
 
         return None
 
-    def _get_ai_sector_correlation(self) -> Optional[float]:
+    def _get_ai_sector_correlation(
+        self, closes: Optional[Dict[str, np.ndarray]] = None
+    ) -> Optional[float]:
         """
         Calculate correlation between AI sector and SPY over last 30 days.
 
         Uses top AI stocks (NVDA, MSFT, GOOGL) as proxy for AI sector.
 
+        Args:
+            closes: Prefetched ticker closes (oldest first); fetched if None
+
         Returns:
             Correlation coefficient (0-1)
         """
-        try:
-            ai_tickers = ["NVDA", "MSFT", "GOOGL"]
-            spy_history = self.market_data_service.get_historical_data(
-                "SPY", period="1mo"
-            )
-            if not spy_history or len(spy_history) < 20:
-                return None
-
-            spy_returns = self._calculate_returns(spy_history)
+        if closes is None:
+            closes = self._fetch_closes()
 
-            correlations = []
-            for ticker in ai_tickers:
-                ticker_history = self.market_data_service.get_historical_data(
-                    ticker, period="1mo"
-                )
-                if ticker_history and len(ticker_history) >= 20:
-                    ticker_returns = self._calculate_returns(ticker_history)
-                    corr = self._calculate_correlation(spy_returns, ticker_returns)
-                    if corr is not None:
-                        correlations.append(corr)
+        window = self.CORRELATION_WINDOW
+        empty = np.empty(0, dtype=np.float64)
+        spy_closes = closes.get("SPY", empty)[-window:]
+        if len(spy_closes) < 20:
+            return None
 
-            if correlations:
-                return sum(correlations) / len(correlations)
+        # Row 0 is SPY, the rest are AI tickers with enough history
+        returns = [calculate_returns(spy_closes)]
+        for ticker in self.AI_SECTOR_TICKERS:
+            ticker_closes = closes.get(ticker, empty)[-window:]
+            if len(ticker_closes) >= 20:
+                returns.append(calculate_returns(ticker_closes))
 
-        except Exception as e:
-            self.logger.warning(f"Failed to calculate AI sector correlation: {e}")
+        n = min(len(r) for r in returns)
+        if len(returns) < 2 or n < 10:
+            return None
 
-        return None
+        matrix = np.vstack([r[-n:] for r in returns])
 
-    def _calculate_returns(self, history: List[Dict]) -> List[float]:
-        """Calculate daily returns from price history."""
-        returns = []
-        for i in range(1, len(history)):
-            prev_close = float(history[i-1].get("close", 0))
-            curr_close = float(history[i].get("close", 0))
-            if prev_close > 0:
-                returns.append((curr_close - prev_close) / prev_close)
-        return returns
-
-    def _calculate_correlation(
-        self, returns1: List[float], returns2: List[float]
-    ) -> Optional[float]:
-        """Calculate Pearson correlation between two return series."""
-        n = min(len(returns1), len(returns2))
-        if n < 10:
+        # Constant series have no defined correlation
+        varying = np.ptp(matrix, axis=1) > 0
+        if not varying[0] or not varying[1:].any():
             return None
 
-        r1 = returns1[-n:]
-        r2 = returns2[-n:]
+        row_corrs = np.corrcoef(matrix[varying])[0, 1:]
+        return float(np.nanmean(row_corrs))
 
-        mean1 = sum(r1) / n
-        mean2 = sum(r2) / n
+    def _get_recent_shifts(self) -> List[LearningLog]:
+        """
+        Get REGIME_SHIFT log entries from the last SHIFT_WINDOW_DAYS.
 
-        numerator = sum((r1[i] - mean1) * (r2[i] - mean2) for i in range(n))
-        denom1 = sum((x - mean1) ** 2 for x in r1) ** 0.5
-        denom2 = sum((x - mean2) ** 2 for x in r2) ** 0.5
+        Queried once per day per detector and invalidated when a new shift
+        is logged, so previous-regime, history and freeze checks share it.
 
-        if denom1 > 0 and denom2 > 0:
-            return numerator / (denom1 * denom2)
+        Returns:
+            Log entries, most recent first
+        """
+        today = date.today()
+        if self._shift_cache is not None and self._shift_cache[0] == today:
+            return self._shift_cache[1]
 
-        return None
+        cutoff = today - timedelta(days=self.SHIFT_WINDOW_DAYS)
+        shifts = (
+            self.db.query(LearningLog)
+            .filter(
+                LearningLog.event_type == "REGIME_SHIFT",
+                LearningLog.date >= cutoff,
+            )
+            .order_by(LearningLog.created_at.desc())
+            .all()
+        )
+        self._shift_cache = (today, shifts)
+        return shifts
 
     def _get_previous_regime(self) -> Optional[MarketRegime]:
         """Get the most recently recorded regime from learning_log."""
         try:
-            log_entry = (
-                self.db.query(LearningLog)
-                .filter(LearningLog.event_type == "REGIME_SHIFT")
-                .order_by(LearningLog.created_at.desc())
-                .first()
-            )
+            recent_shifts = self._get_recent_shifts()
+            if recent_shifts:
+                log_entry = recent_shifts[0]
+            else:
+                # No shift inside the window; fall back to the latest ever
+                log_entry = (
+                    self.db.query(LearningLog)
+                    .filter(LearningLog.event_type == "REGIME_SHIFT")
+                    .order_by(LearningLog.created_at.desc())
+                    .first()
+                )
 
             if log_entry and log_entry.metric_name:
                 try:
@@ -305,18 +373,31 @@ class RegimeDetector:
         self,
         old_regime: Optional[MarketRegime],
         new_regime: MarketRegime,
-        reasoning_parts: List[str],
+        reasoning: str,
     ) -> None:
-        """Log regime shift to learning_log."""
+        """
+        Log regime shift to learning_log.
+
+        Idempotent per (date, new regime): concurrent workers detecting the
+        same shift insert one row via ON CONFLICT DO NOTHING.
+        """
         try:
-            log_entry = LearningLog(
-                date=date.today(),
-                event_type="REGIME_SHIFT",
-                metric_name=new_regime.value,
-                reasoning=f"Regime shift: {old_regime.value if old_regime else 'UNKNOWN'} -> {new_regime.value}. {'; '.join(reasoning_parts)}",
+            stmt = (
+                insert(LearningLog)
+                .values(
+                    date=date.today(),
+                    event_type="REGIME_SHIFT",
+                    metric_name=new_regime.value,
+                    reasoning=f"Regime shift: {old_regime.value if old_regime else 'UNKNOWN'} -> {new_regime.value}. {reasoning}",
+                )
+                .on_conflict_do_nothing(
+                    index_elements=["date", "event_type", "metric_name"],
+                    index_where=LearningLog.event_type == "REGIME_SHIFT",
+                )
             )
-            self.db.add(log_entry)
+            self.db.execute(stmt)
             self.db.commit()
+            self._shift_cache = None
 
             self.logger.info(
                 f"Regime shift detected: {old_regime} -> {new_regime}"
@@ -333,15 +414,18 @@ class RegimeDetector:
         """
         cutoff = date.today() - timedelta(days=days)
 
-        logs = (
-            self.db.query(LearningLog)
-            .filter(
-                LearningLog.event_type == "REGIME_SHIFT",
-                LearningLog.date >= cutoff,
+        if days <= self.SHIFT_WINDOW_DAYS:
+            logs = [log for log in self._get_recent_shifts() if log.date >= cutoff]
+        else:
+            logs = (
+                self.db.query(LearningLog)
+                .filter(
+                    LearningLog.event_type == "REGIME_SHIFT",
+                    LearningLog.date >= cutoff,
+                )
+                .order_by(LearningLog.created_at.desc())
+                .all()
             )
-            .order_by(LearningLog.created_at.desc())
-            .all()
-        )
 
         return [log.to_dict() for log in logs]
 
@@ -358,13 +442,8 @@ class RegimeDetector:
         """
         # Check for multiple regime shifts
         week_ago = date.today() - timedelta(days=7)
-        recent_shifts = (
-            self.db.query(LearningLog)
-            .filter(
-                LearningLog.event_type == "REGIME_SHIFT",
-                LearningLog.date >= week_ago,
-            )
-            .count()
+        recent_shifts = sum(
+            1 for log in self._get_recent_shifts() if log.date >= week_ago
         )
 
         if recent_shifts >= 3:
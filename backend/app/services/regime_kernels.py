@@ -0,0 +1,82 @@
+"""
+Regime Kernels
+Numeric kernels used by the regime detector.
+
+The kernels are JIT-compiled with numba when it is installed. Running this
+module builds an ahead-of-time compiled extension next to it, which is
+preferred at import so workers never pay the JIT compile on first use:
+
+    python -m app.services.regime_kernels
+"""
+
+import logging
+import os
+from typing import Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+AOT_MODULE = "_regime_kernels_aot"
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    logger.warning("numba not installed, regime kernels run as plain Python")
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+def _sma_last(closes: np.ndarray, window: int) -> float:
+    """Simple moving average of the last `window` float64 closes."""
+    n = closes.shape[0]
+    s = 0.0
+    for i in range(n - window, n):
+        s += closes[i]
+    return s / window
+
+
+try:
+    from app.services._regime_kernels_aot import sma_last
+except ImportError:
+    sma_last = njit(cache=True, fastmath=True)(_sma_last)
+
+
+def calculate_returns(closes: Sequence[float]) -> np.ndarray:
+    """Calculate daily returns from an oldest-first close series."""
+    closes = np.asarray(closes, dtype=np.float64)
+    prev = closes[:-1]
+    # Masked divide: non-positive prior closes give 0.0 without warnings
+    return np.divide(
+        np.diff(closes), prev, out=np.zeros_like(prev), where=prev > 0
+    )
+
+
+def warmup_kernels() -> None:
+    """Compile (or load cached) regime kernels ahead of the first request."""
+    sample = np.linspace(1.0, 2.0, 200)
+    sma_last(sample, 200)
+
+
+def build_aot() -> None:
+    """Compile the kernels into an importable extension module."""
+    from numba.pycc import CC
+
+    cc = CC(AOT_MODULE)
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export("sma_last", "f8(f8[:], i8)")(_sma_last)
+    cc.compile()
+    logger.info(f"Built {AOT_MODULE} in {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        build_aot()
+    except Exception:
+        # The JIT fallback still works, so report the failure without failing the build
+        logger.exception(f"Failed to build {AOT_MODULE}; kernels will be JIT-compiled")
@@ -6,24 +6,115 @@ Uses VADER (Valence Aware Dictionary for sEntiment Reasoning) for
 accurate financial text sentiment analysis.
 """
 
+import asyncio
+import heapq
 import json
+import random
+import re
 import requests
+import string
+import threading
 import time
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    logger.warning("orjson not installed, sentiment cache uses stdlib json")
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Fallback keyword lists used when VADER is unavailable
+REDDIT_POSITIVE_KEYWORDS = (
+    "buy", "bullish", "moon", "rocket", "gain", "profit", "calls",
+    "long", "undervalued", "breakout", "surge", "beat", "upgrade",
+)
+REDDIT_NEGATIVE_KEYWORDS = (
+    "sell", "bearish", "crash", "dump", "loss", "puts", "short",
+    "overvalued", "downgrade", "weak", "miss", "plunge", "drop",
+)
+NEWS_POSITIVE_KEYWORDS = (
+    "surge", "rally", "gain", "bullish", "upgrade", "beat", "record",
+    "soar", "jump", "rise", "growth", "profit", "breakthrough",
+)
+NEWS_NEGATIVE_KEYWORDS = (
+    "plunge", "drop", "bearish", "downgrade", "miss", "crash", "fall",
+    "decline", "loss", "concern", "warning", "cut", "layoff", "lawsuit",
+)
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one alternation scanned in a single pass.
+
+    The lookahead reports overlapping substring matches, so counting the
+    distinct matches equals checking `kw in text` for every keyword.
+    """
+    return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+
+_REDDIT_POSITIVE_RE = _keyword_pattern(REDDIT_POSITIVE_KEYWORDS)
+_REDDIT_NEGATIVE_RE = _keyword_pattern(REDDIT_NEGATIVE_KEYWORDS)
+_NEWS_POSITIVE_RE = _keyword_pattern(NEWS_POSITIVE_KEYWORDS)
+_NEWS_NEGATIVE_RE = _keyword_pattern(NEWS_NEGATIVE_KEYWORDS)
+
+
+def _count_keywords(pattern: re.Pattern, text: str) -> int:
+    """Count how many distinct keywords of a compiled pattern occur in text."""
+    return len(set(pattern.findall(text)))
+
+
+# Exclude common words that look like tickers
+_TICKER_EXCLUDE = frozenset({
+    "I", "A", "THE", "AND", "FOR", "TO", "OF", "IS", "IT", "ON", "IN", "AT",
+    "BE", "OR", "AS", "IF", "SO", "BY", "CEO", "IPO", "ETF", "USD", "USA",
+    "SEC", "FDA",
+})
+
+# Common stock ticker pattern (1-5 uppercase letters). Excluded words are
+# rejected by a lookahead inside the regex engine, so findall only yields
+# candidate tickers and no per-token membership check is needed.
+_TICKER_RE = re.compile(
+    r"\b(?!(?:" + "|".join(sorted(_TICKER_EXCLUDE)) + r")\b)([A-Z]{1,5})\b"
+)
+
+
 # Initialize VADER - lazy load to avoid import errors during testing
 _vader_analyzer = None
 
 
 def get_vader_analyzer():
-    """Lazy-load VADER analyzer to avoid import errors."""
+    """
+    Lazy-load VADER analyzer to avoid import errors.
+
+    Prefers the Rust-backed vader_sentimental binding when installed, which
+    exposes the same polarity_scores() interface as vaderSentiment.
+    """
     global _vader_analyzer
     if _vader_analyzer is None:
+        try:
+            import vader_sentimental
+            _vader_analyzer = vader_sentimental.SentimentIntensityAnalyzer()
+            logger.info("VADER sentiment analyzer initialized (vader_sentimental)")
+            return _vader_analyzer
+        except ImportError:
+            pass
+
         try:
             from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
             _vader_analyzer = SentimentIntensityAnalyzer()
@@ -34,78 +125,172 @@ def get_vader_analyzer():
     return _vader_analyzer
 
 
+def _create_session() -> requests.Session:
+    """Create a keep-alive HTTP session with a pooled adapter."""
+    session = requests.Session()
+    session.headers["User-Agent"] = f"alpha-machine/{settings.VERSION}"
+    # Retries are handled by _make_request_with_retry, not urllib3
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=Retry(total=0))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket shared by every caller of one API.
+
+    acquire() blocks until a token is free, so concurrent workers queue
+    for their turn instead of bursting past the limit together.
+    """
+
+    def __init__(self, rate: int, per: float):
+        self.capacity = float(rate)
+        self.fill_rate = rate / per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.fill_rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+def _read_post(submission) -> Tuple[str, str, int, float]:
+    """
+    Read the fields used for scoring from a Reddit submission once.
+
+    Returns:
+        Tuple of (title, selftext capped at 500 chars, score, upvote_ratio)
+    """
+    # Limit selftext to avoid processing huge posts
+    selftext = getattr(submission, "selftext", "") or ""
+    return submission.title, selftext[:500], submission.score, submission.upvote_ratio
+
+
+# Reddit allows 60 requests per minute per OAuth client
+_reddit_limiter = _TokenBucket(60, 60.0)
+
+
+# Retry backoff bounds in seconds
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 8.0
+
+
+def _next_delay(delay: float) -> float:
+    """Decorrelated-jitter backoff so concurrent workers don't retry in lockstep."""
+    return min(RETRY_MAX_DELAY, random.uniform(RETRY_BASE_DELAY, delay * 3))
+
+
+def _sleep_before_retry(wait: float, deadline: float) -> bool:
+    """
+    Sleep before a retry unless doing so would overrun the deadline.
+
+    Returns:
+        True if slept and the caller should retry, False if out of budget
+    """
+    if time.monotonic() + wait > deadline:
+        logger.warning(f"Retry budget exhausted, not waiting {wait:.1f}s")
+        return False
+    time.sleep(wait)
+    return True
+
+
 def _make_request_with_retry(
     url: str,
     params: Dict,
     timeout: int = 10,
     max_retries: int = 3,
+    session: Optional[requests.Session] = None,
+    total_timeout: float = 20.0,
 ) -> Optional[requests.Response]:
     """
     Make an HTTP request with retry logic for transient failures.
 
+    Retries back off with decorrelated jitter and stop early once the next
+    wait would run past the overall time budget.
+
     Args:
         url: Request URL
         params: Query parameters
         timeout: Request timeout in seconds
         max_retries: Maximum retry attempts
+        session: Pooled session to reuse connections (default: new connection)
+        total_timeout: Overall time budget for all attempts in seconds
 
     Returns:
         Response object or None on failure
     """
-    delay = 1.0
+    http = session or requests
+    deadline = time.monotonic() + total_timeout
+    delay = RETRY_BASE_DELAY
 
     for attempt in range(max_retries):
+        can_retry = attempt < max_retries - 1
+
         try:
-            response = requests.get(url, params=params, timeout=timeout)
+            response = http.get(url, params=params, timeout=timeout)
 
             # Handle rate limiting
-            if response.status_code == 429:
-                if attempt < max_retries - 1:
-                    retry_after = int(response.headers.get("Retry-After", delay))
-                    logger.warning(
-                        f"Rate limited, waiting {retry_after}s "
-                        f"(attempt {attempt + 1}/{max_retries})"
-                    )
-                    time.sleep(retry_after)
-                    delay *= 2
+            if response.status_code == 429 and can_retry:
+                try:
+                    retry_after = float(response.headers.get("Retry-After", delay))
+                except ValueError:
+                    retry_after = delay
+                logger.warning(
+                    f"Rate limited, waiting {retry_after:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                if _sleep_before_retry(retry_after, deadline):
+                    delay = _next_delay(delay)
                     continue
 
             # Handle server errors
-            if response.status_code >= 500:
-                if attempt < max_retries - 1:
-                    logger.warning(
-                        f"Server error {response.status_code}, "
-                        f"retrying in {delay}s (attempt {attempt + 1}/{max_retries})"
-                    )
-                    time.sleep(delay)
-                    delay *= 2
+            elif response.status_code >= 500 and can_retry:
+                logger.warning(
+                    f"Server error {response.status_code}, "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})"
+                )
+                if _sleep_before_retry(delay, deadline):
+                    delay = _next_delay(delay)
                     continue
 
             return response
 
         except requests.exceptions.Timeout as e:
-            if attempt < max_retries - 1:
+            if can_retry:
                 logger.warning(
-                    f"Request timeout, retrying in {delay}s "
+                    f"Request timeout, retrying in {delay:.1f}s "
                     f"(attempt {attempt + 1}/{max_retries})"
                 )
-                time.sleep(delay)
-                delay *= 2
-            else:
-                logger.error(f"Request timeout after {max_retries} attempts: {e}")
-                return None
+                if _sleep_before_retry(delay, deadline):
+                    delay = _next_delay(delay)
+                    continue
+            logger.error(f"Request timeout after {attempt + 1} attempts: {e}")
+            return None
 
         except requests.exceptions.ConnectionError as e:
-            if attempt < max_retries - 1:
+            if can_retry:
                 logger.warning(
-                    f"Connection error, retrying in {delay}s "
+                    f"Connection error, retrying in {delay:.1f}s "
                     f"(attempt {attempt + 1}/{max_retries})"
                 )
-                time.sleep(delay)
-                delay *= 2
-            else:
-                logger.error(f"Connection error after {max_retries} attempts: {e}")
-                return None
+                if _sleep_before_retry(delay, deadline):
+                    delay = _next_delay(delay)
+                    continue
+            logger.error(f"Connection error after {attempt + 1} attempts: {e}")
+            return None
 
         except Exception as e:
             logger.error(f"Unexpected request error: {type(e).__name__}: {e}")
@@ -120,54 +305,140 @@ class SentimentDataService:
     # Cache TTL in seconds (30 minutes)
     CACHE_TTL = 1800
 
+    # Per-source cache TTLs in seconds
+    REDDIT_CACHE_TTL = 180
+    NEWS_CACHE_TTL = 300
+
+    # Shorter TTL for results with no mentions, so dead tickers are retried
+    # sooner but don't hammer Reddit/NewsAPI on every request (5 minutes)
+    EMPTY_CACHE_TTL = 300
+
+    # VADER compound thresholds for positive/negative classification
+    POSITIVE_THRESHOLD = 0.05
+    NEGATIVE_THRESHOLD = -0.05
+
+    # Compound adjustment applied for strong/negative Reddit engagement
+    ENGAGEMENT_ADJUSTMENT = 0.1
+
+    # Distinct texts whose VADER score is memoized (syndicated headlines,
+    # cross-posted Reddit titles)
+    VADER_CACHE_SIZE = 4096
+
+    # NewsAPI page sizes for single-ticker and batched (q="A OR B ...") queries
+    NEWS_PAGE_SIZE = 30
+    NEWS_BATCH_PAGE_SIZE = 100
+    NEWS_BATCH_SIZE = 20
+
+    # Shared Redis connection pool, created on first use per REDIS_URL
+    REDIS_MAX_CONNECTIONS = 32
+    _redis_pool = None
+    _redis_pool_url = None
+
     def __init__(self):
         self.reddit = None
+        # PRAW is not thread-safe; serializes calls made from worker threads
+        self._reddit_lock = threading.Lock()
         self.vader = get_vader_analyzer()
+        self.session = _create_session()
+
+        # VADER only scores lexicon words; texts without any score 0.0
+        lexicon = getattr(self.vader, "lexicon", None)
+        self._vader_vocab = frozenset(lexicon) if lexicon else None
+        self._cached_compound = lru_cache(maxsize=self.VADER_CACHE_SIZE)(self._vader_compound)
         self._init_reddit()
 
-    def _get_cached_sentiment(self, ticker: str) -> Optional[Dict]:
+    @classmethod
+    def _redis(cls):
         """
-        Check Redis cache for sentiment data.
+        Get a Redis client backed by the shared connection pool.
+
+        The pool is built lazily and rebuilt if REDIS_URL changes, so
+        cache reads and writes reuse open sockets instead of connecting
+        on every call.
+
+        Returns:
+            redis.Redis client
+        """
+        import redis
+
+        if cls._redis_pool is None or cls._redis_pool_url != settings.REDIS_URL:
+            cls._redis_pool = redis.ConnectionPool.from_url(
+                settings.REDIS_URL, max_connections=cls.REDIS_MAX_CONNECTIONS
+            )
+            cls._redis_pool_url = settings.REDIS_URL
+        return redis.Redis(connection_pool=cls._redis_pool)
+
+    def _read_cache(self, key: str) -> Optional[Dict]:
+        """
+        Read a JSON payload from Redis.
 
         Args:
-            ticker: Stock ticker symbol
+            key: Redis key
 
         Returns:
-            Cached sentiment data or None if not found
+            Cached data or None if not found or Redis is unavailable
         """
         if not settings.REDIS_URL:
             return None
 
         try:
-            import redis
-            r = redis.from_url(settings.REDIS_URL)
-            cached = r.get(f"sentiment:{ticker}")
+            cached = self._redis().get(key)
             if cached:
-                logger.debug(f"Cache hit for sentiment:{ticker}")
-                return json.loads(cached)
+                logger.debug(f"Cache hit for {key}")
+                return _json_loads(cached)
         except Exception as e:
             logger.warning(f"Redis cache read failed: {e}")
         return None
 
-    def _cache_sentiment(self, ticker: str, data: Dict):
+    def _write_cache(self, key: str, data: Dict, ttl: int):
         """
-        Cache sentiment data to Redis.
+        Write a JSON payload to Redis.
 
         Args:
-            ticker: Stock ticker symbol
-            data: Sentiment data to cache
+            key: Redis key
+            data: Data to cache
+            ttl: Cache TTL in seconds
         """
         if not settings.REDIS_URL:
             return
 
         try:
-            import redis
-            r = redis.from_url(settings.REDIS_URL)
-            r.setex(f"sentiment:{ticker}", self.CACHE_TTL, json.dumps(data))
-            logger.debug(f"Cached sentiment for {ticker} (TTL={self.CACHE_TTL}s)")
+            self._redis().setex(key, ttl, _json_dumps(data))
+            logger.debug(f"Cached {key} (TTL={ttl}s)")
         except Exception as e:
             logger.warning(f"Redis cache write failed: {e}")
 
+    def _get_cached_sentiment(self, ticker: str) -> Optional[Dict]:
+        """
+        Check Redis cache for sentiment data.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Cached sentiment data or None if not found
+        """
+        return self._read_cache(f"sentiment:{ticker}")
+
+    def _cache_ttl(self, data: Dict) -> int:
+        """Pick the cache TTL for a combined result (short if it found nothing)."""
+        if data.get("total_mentions") == 0:
+            return self.EMPTY_CACHE_TTL
+        return self.CACHE_TTL
+
+    def _cache_sentiment(self, ticker: str, data: Dict, ttl: Optional[int] = None):
+        """
+        Cache sentiment data to Redis.
+
+        Args:
+            ticker: Stock ticker symbol
+            data: Sentiment data to cache
+            ttl: Cache TTL in seconds (default: based on total mentions)
+        """
+        if ttl is None:
+            ttl = self._cache_ttl(data)
+        self._write_cache(f"sentiment:{ticker}", data, ttl)
+
     def _init_reddit(self):
         """Initialize Reddit API client (PRAW)"""
         if not all([settings.REDDIT_CLIENT_ID, settings.REDDIT_CLIENT_SECRET]):
@@ -187,12 +458,16 @@ class SentimentDataService:
             logger.error(f"Failed to initialize Reddit: {e}")
             self.reddit = None
 
-    def get_reddit_sentiment(self, ticker: str) -> Dict:
+    def get_reddit_sentiment(
+        self, ticker: str, use_cache: bool = True, timestamp: Optional[str] = None
+    ) -> Dict:
         """
         Scrape Reddit mentions and calculate sentiment
 
         Args:
             ticker: Stock ticker symbol
+            use_cache: Whether to use Redis caching (default: True)
+            timestamp: ISO timestamp for the result (default: now)
 
         Returns:
             Dictionary with Reddit sentiment data
@@ -206,65 +481,59 @@ class SentimentDataService:
             "negative_count": 0,
             "neutral_count": 0,
             "top_posts": [],
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
         }
 
         if not self.reddit:
             logger.warning("Reddit client not available")
             return result
 
-        try:
-            mentions = 0
-            positive = 0
-            negative = 0
-            neutral = 0
-            top_posts = []
+        cache_key = f"sentiment:reddit:{ticker}"
+        if use_cache:
+            cached = self._read_cache(cache_key)
+            if cached is not None:
+                return cached
 
+        try:
             # Search relevant subreddits
             subreddits = ["wallstreetbets", "stocks", "investing", "stockmarket"]
 
-            sentiment_sum = 0.0
+            with self._reddit_lock:
+                posts = self._search_subreddits(ticker, subreddits)
+                if posts is None:
+                    # Failed searches are not cached so the next request retries
+                    return result
 
-            for subreddit_name in subreddits:
-                try:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-
-                    # Search last 24 hours
-                    for submission in subreddit.search(ticker, time_filter="day", limit=25):
-                        mentions += 1
-
-                        # VADER-based sentiment analysis (returns -1.0 to 1.0)
-                        sentiment = self._analyze_reddit_post(submission)
-                        sentiment_sum += sentiment
-
-                        # Classify based on compound score thresholds
-                        if sentiment >= 0.05:
-                            positive += 1
-                        elif sentiment <= -0.05:
-                            negative += 1
-                        else:
-                            neutral += 1
-
-                        # Track top posts
-                        if submission.score > 50 and len(top_posts) < 5:
-                            top_posts.append(
-                                {
-                                    "title": submission.title[:100],
-                                    "score": submission.score,
-                                    "subreddit": subreddit_name,
-                                    "sentiment": round(sentiment, 3),
-                                }
-                            )
+                # Read each submission's fields once; PRAW attributes are lazy
+                fields = [_read_post(submission) for submission in posts]
 
-                except Exception as e:
-                    logger.warning(f"Error searching r/{subreddit_name}: {e}")
-                    continue
+            # VADER-based sentiment analysis (returns -1.0 to 1.0)
+            sentiments = self._score_post_fields(fields)
+            mentions = len(posts)
+            positive, negative, neutral = self._classify_sentiments(sentiments)
+
+            # Track the 5 highest-scoring posts (bounded heap, ties keep search order)
+            popular = [
+                (score, -i, posts[i], title, sentiment)
+                for i, ((title, _, score, _), sentiment) in enumerate(
+                    zip(fields, sentiments.tolist())
+                )
+                if score > 50
+            ]
+            top_posts = [
+                {
+                    "title": title[:100],
+                    "score": score,
+                    "subreddit": submission.subreddit.display_name,
+                    "sentiment": round(sentiment, 3),
+                }
+                for score, _, submission, title, sentiment in heapq.nlargest(
+                    5, popular, key=lambda post: post[:2]
+                )
+            ]
 
             # Calculate average sentiment score (-1 to +1)
-            if mentions > 0:
-                sentiment_score = sentiment_sum / mentions
-            else:
-                sentiment_score = 0.0
+            sentiment_score = float(sentiments.mean()) if mentions > 0 else 0.0
 
             result.update(
                 {
@@ -277,6 +546,10 @@ class SentimentDataService:
                 }
             )
 
+            if use_cache:
+                ttl = self.REDDIT_CACHE_TTL if mentions else self.EMPTY_CACHE_TTL
+                self._write_cache(cache_key, result, ttl)
+
             logger.info(
                 f"Reddit sentiment for {ticker}: {mentions} mentions, score={sentiment_score:.2f}"
             )
@@ -286,6 +559,49 @@ class SentimentDataService:
 
         return result
 
+    def _classify_sentiments(self, sentiments: np.ndarray) -> Tuple[int, int, int]:
+        """
+        Count positive, negative and neutral scores by compound thresholds.
+
+        Args:
+            sentiments: Array of compound sentiment scores
+
+        Returns:
+            Tuple of (positive, negative, neutral) counts
+        """
+        positive = int(np.count_nonzero(sentiments >= self.POSITIVE_THRESHOLD))
+        negative = int(np.count_nonzero(sentiments <= self.NEGATIVE_THRESHOLD))
+        return positive, negative, sentiments.size - positive - negative
+
+    def _search_subreddits(self, ticker: str, subreddits: List[str]) -> Optional[List]:
+        """
+        Search several subreddits for recent posts mentioning a ticker.
+
+        Uses one multireddit query ("a+b+c") so the search costs a single
+        request against Reddit's rate limit. This trades away coverage on
+        purpose: the limit caps the combined results rather than each
+        subreddit, so a busy one like r/wallstreetbets can take most of the
+        slots, and one failed search loses every subreddit at once.
+
+        Args:
+            ticker: Stock ticker symbol
+            subreddits: Subreddits to search
+
+        Returns:
+            List of submissions from the last 24 hours, or None on error
+        """
+        try:
+            combined = self.reddit.subreddit("+".join(subreddits))
+
+            # Search last 24 hours; top 25 * len(subreddits) posts across all of
+            # them, not 25 from each
+            _reddit_limiter.acquire()
+            return list(combined.search(ticker, time_filter="day", limit=25 * len(subreddits)))
+
+        except Exception as e:
+            logger.warning(f"Error searching r/{'+'.join(subreddits)}: {e}")
+            return None
+
     def _analyze_reddit_post(self, submission) -> float:
         """
         Analyze Reddit post sentiment using VADER.
@@ -296,44 +612,108 @@ class SentimentDataService:
         Returns:
             Compound sentiment score (-1.0 to 1.0)
         """
-        # Build text from title and selftext
-        text = submission.title
-        if hasattr(submission, 'selftext') and submission.selftext:
-            # Limit selftext to avoid processing huge posts
-            text += " " + submission.selftext[:500]
+        return float(self._score_reddit_posts([submission])[0])
 
-        # Use VADER if available
-        if self.vader:
-            scores = self.vader.polarity_scores(text)
-            compound = scores['compound']
+    def _score_reddit_posts(self, submissions: List) -> np.ndarray:
+        """
+        Score a batch of Reddit posts using VADER.
+
+        Args:
+            submissions: Reddit submission objects
 
-            # Engagement boost: high score + high upvote ratio = community agreement
-            if submission.score > 100 and submission.upvote_ratio > 0.8:
-                compound = min(compound + 0.1, 1.0)
-            elif submission.score < 0:
-                # Negative score indicates community disagrees with sentiment
-                compound = max(compound - 0.1, -1.0)
+        Returns:
+            Array of compound sentiment scores (-1.0 to 1.0)
+        """
+        return self._score_post_fields([_read_post(submission) for submission in submissions])
+
+    def _score_post_fields(self, posts: List[Tuple[str, str, int, float]]) -> np.ndarray:
+        """
+        Score a batch of Reddit posts from fields read by _read_post.
+
+        Args:
+            posts: (title, selftext, score, upvote_ratio) per post
 
-            return compound
+        Returns:
+            Array of compound sentiment scores (-1.0 to 1.0)
+        """
+        if not posts:
+            return np.zeros(0)
 
         # Fallback to simple keyword analysis if VADER not available
-        title = submission.title.lower()
+        if not self.vader:
+            return np.array([
+                self._keyword_reddit_post(title, score, ratio)
+                for title, _, score, ratio in posts
+            ])
+
+        # Build text from title and selftext (selftext already capped by _read_post)
+        compound = self._vader_compounds([
+            f"{title} {selftext}" if selftext else title for title, selftext, _, _ in posts
+        ])
+
+        # Engagement boost: high score + high upvote ratio = community agreement
+        scores = np.array([score for _, _, score, _ in posts])
+        ratios = np.array([ratio for _, _, _, ratio in posts])
+        boosted = (scores > 100) & (ratios > 0.8)
+        compound[boosted] = np.minimum(compound[boosted] + self.ENGAGEMENT_ADJUSTMENT, 1.0)
+
+        # Negative score indicates community disagrees with sentiment
+        penalized = ~boosted & (scores < 0)
+        compound[penalized] = np.maximum(compound[penalized] - self.ENGAGEMENT_ADJUSTMENT, -1.0)
+
+        return compound
+
+    def _vader_compounds(self, texts: List[str]) -> np.ndarray:
+        """
+        Score texts with VADER, skipping those it would score as neutral.
 
-        positive_keywords = [
-            "buy", "bullish", "moon", "rocket", "gain", "profit", "calls",
-            "long", "undervalued", "breakout", "surge", "beat", "upgrade",
-        ]
-        negative_keywords = [
-            "sell", "bearish", "crash", "dump", "loss", "puts", "short",
-            "overvalued", "downgrade", "weak", "miss", "plunge", "drop",
-        ]
+        Args:
+            texts: Texts to score
 
-        positive_count = sum(1 for kw in positive_keywords if kw in title)
-        negative_count = sum(1 for kw in negative_keywords if kw in title)
+        Returns:
+            Array of compound sentiment scores (-1.0 to 1.0)
+        """
+        compound = self._cached_compound
+        has_sentiment = self._has_vader_words
+        return np.array([
+            compound(text) if has_sentiment(text) else 0.0
+            for text in texts
+        ])
+
+    def _vader_compound(self, text: str) -> float:
+        """VADER compound score for one text (memoized per instance)."""
+        return self.vader.polarity_scores(text)['compound']
+
+    def _has_vader_words(self, text: str) -> bool:
+        """
+        Cheap precheck for whether VADER can give text a non-zero score.
 
-        if submission.score > 100 and submission.upvote_ratio > 0.8:
+        Tokenizes the way VADER does (whitespace split, punctuation stripped
+        from words) and looks for any lexicon entry. Non-ASCII text always
+        passes, since VADER expands emoji into lexicon words.
+        """
+        vocab = self._vader_vocab
+        if vocab is None or not text.isascii():
+            return True
+
+        for token in text.split():
+            word = token.strip(string.punctuation)
+            if len(word) <= 2:
+                word = token
+            if word.lower() in vocab:
+                return True
+        return False
+
+    def _keyword_reddit_post(self, title: str, score: int, upvote_ratio: float) -> float:
+        """Keyword-based Reddit post sentiment, used when VADER is unavailable."""
+        title = title.lower()
+
+        positive_count = _count_keywords(_REDDIT_POSITIVE_RE, title)
+        negative_count = _count_keywords(_REDDIT_NEGATIVE_RE, title)
+
+        if score > 100 and upvote_ratio > 0.8:
             positive_count += 1
-        elif submission.score < 0:
+        elif score < 0:
             negative_count += 1
 
         if positive_count > negative_count:
@@ -342,17 +722,77 @@ class SentimentDataService:
             return -0.5
         return 0.0
 
-    def get_news_sentiment(self, ticker: str) -> Dict:
+    def get_news_sentiment(
+        self, ticker: str, use_cache: bool = True, timestamp: Optional[str] = None
+    ) -> Dict:
         """
         Fetch news and analyze sentiment
 
         Args:
             ticker: Stock ticker symbol
+            use_cache: Whether to use Redis caching (default: True)
+            timestamp: ISO timestamp for the result (default: now)
 
         Returns:
             Dictionary with news sentiment data
         """
-        result = {
+        return self.get_news_sentiment_batch(
+            [ticker], use_cache=use_cache, timestamp=timestamp
+        )[ticker]
+
+    def get_news_sentiment_batch(
+        self, tickers: List[str], use_cache: bool = True, timestamp: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        Fetch news sentiment for many tickers with one NewsAPI call per batch.
+
+        Uncached tickers are queried NEWS_BATCH_SIZE at a time with
+        q="A OR B ...", and each article is routed to the tickers named in
+        its title or description.
+
+        Args:
+            tickers: Stock ticker symbols
+            use_cache: Whether to use Redis caching (default: True)
+            timestamp: ISO timestamp for the results (default: now)
+
+        Returns:
+            Dictionary mapping ticker to news sentiment data
+        """
+        unique = list(dict.fromkeys(tickers))
+        timestamp = timestamp or datetime.now().isoformat()
+        results = {ticker: self._empty_news_result(ticker, timestamp) for ticker in unique}
+
+        if not settings.NEWS_API_KEY:
+            logger.warning("NewsAPI key not configured")
+            return results
+
+        missing = []
+        for ticker in unique:
+            cached = self._read_cache(f"sentiment:news:{ticker}") if use_cache else None
+            if cached is not None:
+                results[ticker] = cached
+            else:
+                missing.append(ticker)
+
+        for i in range(0, len(missing), self.NEWS_BATCH_SIZE):
+            batch = missing[i:i + self.NEWS_BATCH_SIZE]
+            articles = self._fetch_news_articles(batch)
+            if articles is None:
+                # Errors are not cached so the next request retries
+                continue
+
+            for ticker, ticker_articles in self._route_articles(batch, articles).items():
+                data = self._summarize_news(results[ticker], ticker_articles)
+                results[ticker] = data
+                if use_cache:
+                    ttl = self.NEWS_CACHE_TTL if data["article_count"] else self.EMPTY_CACHE_TTL
+                    self._write_cache(f"sentiment:news:{ticker}", data, ttl)
+
+        return results
+
+    def _empty_news_result(self, ticker: str, timestamp: str) -> Dict:
+        """News sentiment result with no articles."""
+        return {
             "source": "news",
             "ticker": ticker,
             "article_count": 0,
@@ -361,85 +801,39 @@ class SentimentDataService:
             "negative_count": 0,
             "neutral_count": 0,
             "headlines": [],
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
         }
 
-        if not settings.NEWS_API_KEY:
-            logger.warning("NewsAPI key not configured")
-            return result
+    def _fetch_news_articles(self, tickers: List[str]) -> Optional[List[Dict]]:
+        """
+        Query NewsAPI for articles mentioning any of the tickers.
+
+        Args:
+            tickers: Stock ticker symbols, OR-ed into one query
 
+        Returns:
+            List of articles, or None if the request failed
+        """
+        label = ", ".join(tickers)
         try:
             url = "https://newsapi.org/v2/everything"
             params = {
-                "q": ticker,
+                "q": " OR ".join(tickers),
                 "apiKey": settings.NEWS_API_KEY,
                 "language": "en",
                 "sortBy": "publishedAt",
-                "pageSize": 30,
+                "pageSize": self.NEWS_PAGE_SIZE if len(tickers) == 1 else self.NEWS_BATCH_PAGE_SIZE,
             }
 
-            response = _make_request_with_retry(url, params, timeout=10, max_retries=3)
+            response = _make_request_with_retry(
+                url, params, timeout=10, max_retries=3, session=self.session
+            )
 
             if response and response.status_code == 200:
-                data = response.json()
-                articles = data.get("articles", [])
-
+                articles = _json_loads(response.content).get("articles", [])
                 if not articles:
-                    logger.info(f"No news articles found for {ticker}")
-                    return result
-
-                positive = 0
-                negative = 0
-                neutral = 0
-                headlines = []
-                sentiment_sum = 0.0
-
-                for article in articles:
-                    title = article.get("title", "")
-                    if not title:
-                        continue
-
-                    # VADER-based sentiment analysis (returns -1.0 to 1.0)
-                    sentiment = self._analyze_headline(title)
-                    sentiment_sum += sentiment
-
-                    # Classify based on compound score thresholds
-                    if sentiment >= 0.05:
-                        positive += 1
-                    elif sentiment <= -0.05:
-                        negative += 1
-                    else:
-                        neutral += 1
-
-                    # Store headlines with sentiment
-                    if len(headlines) < 10:
-                        headlines.append(
-                            {
-                                "title": title[:150],
-                                "source": article.get("source", {}).get("name", "Unknown"),
-                                "published": article.get("publishedAt", ""),
-                                "sentiment": round(sentiment, 3),
-                            }
-                        )
-
-                total = len(articles)
-                sentiment_score = sentiment_sum / total if total > 0 else 0.0
-
-                result.update(
-                    {
-                        "article_count": total,
-                        "sentiment_score": round(sentiment_score, 3),
-                        "positive_count": positive,
-                        "negative_count": negative,
-                        "neutral_count": neutral,
-                        "headlines": headlines,
-                    }
-                )
-
-                logger.info(
-                    f"News sentiment for {ticker}: {total} articles, score={sentiment_score:.2f}"
-                )
-
+                    logger.info(f"No news articles found for {label}")
+                return articles
             elif response.status_code == 401:
                 logger.error("NewsAPI authentication failed - check API key")
             elif response.status_code == 429:
@@ -448,7 +842,84 @@ class SentimentDataService:
                 logger.warning(f"NewsAPI error: {response.status_code}")
 
         except Exception as e:
-            logger.error(f"News sentiment failed for {ticker}: {e}")
+            logger.error(f"News sentiment failed for {label}: {e}")
+
+        return None
+
+    def _route_articles(self, tickers: List[str], articles: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Partition batched NewsAPI articles by the tickers they mention.
+
+        A single-ticker query keeps every article, as before batching.
+
+        Args:
+            tickers: Tickers that were OR-ed into the query
+            articles: Articles returned by NewsAPI
+
+        Returns:
+            Dictionary mapping each ticker to its articles
+        """
+        if len(tickers) == 1:
+            return {tickers[0]: articles}
+
+        routed: Dict[str, List[Dict]] = {ticker: [] for ticker in tickers}
+        patterns = [(ticker, re.compile(r"\b" + re.escape(ticker) + r"\b")) for ticker in tickers]
+        for article in articles:
+            text = f"{article.get('title') or ''} {article.get('description') or ''}"
+            for ticker, pattern in patterns:
+                if pattern.search(text):
+                    routed[ticker].append(article)
+        return routed
+
+    def _summarize_news(self, result: Dict, articles: List[Dict]) -> Dict:
+        """
+        Score one ticker's articles into a news sentiment result.
+
+        Args:
+            result: Empty news result for the ticker
+            articles: Articles mentioning the ticker
+
+        Returns:
+            Updated news sentiment data
+        """
+        if not articles:
+            return result
+
+        titled = [article for article in articles if article.get("title")]
+
+        # VADER-based sentiment analysis (returns -1.0 to 1.0)
+        sentiments = self._score_headlines([article["title"] for article in titled])
+        sentiment_sum = float(sentiments.sum())
+        positive, negative, neutral = self._classify_sentiments(sentiments)
+
+        # Store the first 10 headlines with sentiment
+        headlines = [
+            {
+                "title": article["title"][:150],
+                "source": (article.get("source") or {}).get("name") or "Unknown",
+                "published": article.get("publishedAt") or "",
+                "sentiment": sentiment,
+            }
+            for article, sentiment in zip(titled[:10], np.round(sentiments[:10], 3).tolist())
+        ]
+
+        total = len(articles)
+        sentiment_score = sentiment_sum / total if total > 0 else 0.0
+
+        result.update(
+            {
+                "article_count": total,
+                "sentiment_score": round(sentiment_score, 3),
+                "positive_count": positive,
+                "negative_count": negative,
+                "neutral_count": neutral,
+                "headlines": headlines,
+            }
+        )
+
+        logger.info(
+            f"News sentiment for {result['ticker']}: {total} articles, score={sentiment_score:.2f}"
+        )
 
         return result
 
@@ -462,25 +933,31 @@ class SentimentDataService:
         Returns:
             Compound sentiment score (-1.0 to 1.0)
         """
+        return float(self._score_headlines([headline])[0])
+
+    def _score_headlines(self, headlines: List[str]) -> np.ndarray:
+        """
+        Score a batch of news headlines using VADER.
+
+        Args:
+            headlines: News headline texts
+
+        Returns:
+            Array of compound sentiment scores (-1.0 to 1.0)
+        """
         # Use VADER if available
         if self.vader:
-            scores = self.vader.polarity_scores(headline)
-            return scores['compound']
+            return self._vader_compounds(headlines)
 
+        return np.array([self._keyword_headline(headline) for headline in headlines])
+
+    def _keyword_headline(self, headline: str) -> float:
+        """Keyword-based headline sentiment, used when VADER is unavailable."""
         # Fallback to keyword analysis
         headline_lower = headline.lower()
 
-        positive_keywords = [
-            "surge", "rally", "gain", "bullish", "upgrade", "beat", "record",
-            "soar", "jump", "rise", "growth", "profit", "breakthrough",
-        ]
-        negative_keywords = [
-            "plunge", "drop", "bearish", "downgrade", "miss", "crash", "fall",
-            "decline", "loss", "concern", "warning", "cut", "layoff", "lawsuit",
-        ]
-
-        positive_count = sum(1 for kw in positive_keywords if kw in headline_lower)
-        negative_count = sum(1 for kw in negative_keywords if kw in headline_lower)
+        positive_count = _count_keywords(_NEWS_POSITIVE_RE, headline_lower)
+        negative_count = _count_keywords(_NEWS_NEGATIVE_RE, headline_lower)
 
         if positive_count > negative_count:
             return 0.5
@@ -507,9 +984,39 @@ class SentimentDataService:
                 cached["from_cache"] = True
                 return cached
 
-        reddit_data = self.get_reddit_sentiment(ticker)
-        news_data = self.get_news_sentiment(ticker)
+        # One timestamp for the combined result and both sources
+        timestamp = datetime.now().isoformat()
+
+        # Reddit and News are independent I/O; fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            reddit_future = executor.submit(self.get_reddit_sentiment, ticker, use_cache, timestamp)
+            news_future = executor.submit(self.get_news_sentiment, ticker, use_cache, timestamp)
+            reddit_data = reddit_future.result()
+            news_data = news_future.result()
+
+        result = self._combine_sentiment(ticker, reddit_data, news_data, timestamp)
 
+        # Cache the result for future requests
+        if use_cache:
+            self._cache_sentiment(ticker, result)
+
+        return result
+
+    def _combine_sentiment(
+        self, ticker: str, reddit_data: Dict, news_data: Dict, timestamp: str
+    ) -> Dict:
+        """
+        Combine Reddit and News results into one weighted sentiment.
+
+        Args:
+            ticker: Stock ticker symbol
+            reddit_data: Result of get_reddit_sentiment
+            news_data: Result of get_news_sentiment
+            timestamp: ISO timestamp for the result
+
+        Returns:
+            Dictionary with combined sentiment data
+        """
         # Weighted average (Reddit 60%, News 40%)
         # Reddit gets higher weight due to retail investor focus
         reddit_score = reddit_data.get("sentiment_score", 0)
@@ -546,18 +1053,105 @@ class SentimentDataService:
             "reddit": reddit_data,
             "news": news_data,
             "total_mentions": reddit_data.get("mentions", 0) + news_data.get("article_count", 0),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "from_cache": False,
         }
 
         logger.info(f"Combined sentiment for {ticker}: {combined_score:.2f} ({sentiment_label})")
 
-        # Cache the result for future requests
-        if use_cache:
-            self._cache_sentiment(ticker, result)
-
         return result
 
+    async def aggregate_sentiment_async(self, ticker: str, use_cache: bool = True) -> Dict:
+        """
+        Async variant of aggregate_sentiment for use from event-loop code.
+
+        Runs the blocking aggregation in a worker thread so API handlers
+        don't stall the event loop while Reddit and News are fetched.
+
+        Args:
+            ticker: Stock ticker symbol
+            use_cache: Whether to use Redis caching (default: True)
+
+        Returns:
+            Dictionary with combined sentiment data
+        """
+        return await asyncio.to_thread(self.aggregate_sentiment, ticker, use_cache)
+
+    def aggregate_sentiment_bulk(
+        self, tickers: List[str], use_cache: bool = True
+    ) -> Dict[str, Dict]:
+        """
+        Aggregate sentiment for many tickers with batched cache access.
+
+        Cached entries are read with a single MGET and fresh results are
+        written back in one pipeline, instead of one Redis round-trip per
+        ticker. For cache misses, news is fetched with batched NewsAPI
+        queries in a worker thread while Reddit is searched one ticker at a
+        time on the calling thread.
+
+        Args:
+            tickers: Stock ticker symbols
+            use_cache: Whether to use Redis caching (default: True)
+
+        Returns:
+            Dictionary mapping ticker to combined sentiment data
+        """
+        unique = list(dict.fromkeys(tickers))
+        results: Dict[str, Dict] = {}
+
+        if use_cache and settings.REDIS_URL and unique:
+            try:
+                keys = [f"sentiment:{ticker}" for ticker in unique]
+                for ticker, cached in zip(unique, self._redis().mget(keys)):
+                    if cached:
+                        data = _json_loads(cached)
+                        data["from_cache"] = True
+                        results[ticker] = data
+            except Exception as e:
+                logger.warning(f"Redis bulk cache read failed: {e}")
+
+        missing = [ticker for ticker in unique if ticker not in results]
+        if missing:
+            timestamp = datetime.now().isoformat()
+
+            # The batched news fetch runs in a worker while Reddit is searched
+            # here; PRAW is not thread-safe, so its searches stay sequential
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                news_future = executor.submit(
+                    self.get_news_sentiment_batch, missing, False, timestamp
+                )
+                reddit_data = {
+                    ticker: self.get_reddit_sentiment(
+                        ticker, use_cache=False, timestamp=timestamp
+                    )
+                    for ticker in missing
+                }
+                news_data = news_future.result()
+            fresh = {
+                ticker: self._combine_sentiment(
+                    ticker, reddit_data[ticker], news_data[ticker], timestamp
+                )
+                for ticker in missing
+            }
+            results.update(fresh)
+
+            if use_cache and settings.REDIS_URL:
+                try:
+                    with self._redis().pipeline(transaction=False) as pipe:
+                        for ticker, data in fresh.items():
+                            pipe.setex(f"sentiment:{ticker}", self._cache_ttl(data), _json_dumps(data))
+                        pipe.execute()
+                    logger.debug(f"Cached sentiment for {len(fresh)} tickers")
+                except Exception as e:
+                    logger.warning(f"Redis bulk cache write failed: {e}")
+
+        logger.info(
+            f"Bulk sentiment for {len(unique)} tickers: "
+            f"{len(unique) - len(missing)} cached, {len(missing)} fetched"
+        )
+
+        return {ticker: results[ticker] for ticker in unique}
+
     def get_trending_tickers(
         self, subreddit: str = "wallstreetbets", limit: int = 10
     ) -> List[Dict]:
@@ -575,54 +1169,16 @@ class SentimentDataService:
             return []
 
         try:
-            ticker_counts = {}
-            sub = self.reddit.subreddit(subreddit)
-
-            # Common stock ticker pattern (1-5 uppercase letters)
-            import re
-
-            ticker_pattern = re.compile(r"\b([A-Z]{1,5})\b")
-
-            # Exclude common words that look like tickers
-            exclude = {
-                "I",
-                "A",
-                "THE",
-                "AND",
-                "FOR",
-                "TO",
-                "OF",
-                "IS",
-                "IT",
-                "ON",
-                "IN",
-                "AT",
-                "BE",
-                "OR",
-                "AS",
-                "IF",
-                "SO",
-                "BY",
-                "CEO",
-                "IPO",
-                "ETF",
-                "USD",
-                "USA",
-                "SEC",
-                "FDA",
-                "CEO",
-            }
-
-            for submission in sub.hot(limit=50):
-                title = submission.title
-                matches = ticker_pattern.findall(title)
+            counts = Counter()
+            with self._reddit_lock:
+                sub = self.reddit.subreddit(subreddit)
+                _reddit_limiter.acquire()
 
-                for ticker in matches:
-                    if ticker not in exclude:
-                        ticker_counts[ticker] = ticker_counts.get(ticker, 0) + 1
+                for submission in sub.hot(limit=50):
+                    counts.update(_TICKER_RE.findall(submission.title))
 
-            # Sort by count and return top tickers
-            sorted_tickers = sorted(ticker_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
+            # Most mentioned first
+            sorted_tickers = counts.most_common(limit)
 
             return [{"ticker": t, "mentions": c} for t, c in sorted_tickers]
 
@@ -632,4 +1188,12 @@ class SentimentDataService:
 
 
 # Singleton instance
-sentiment_service = SentimentDataService()
+_sentiment_service: Optional[SentimentDataService] = None
+
+
+def get_sentiment_service() -> SentimentDataService:
+    """Get or create sentiment data service instance."""
+    global _sentiment_service
+    if _sentiment_service is None:
+        _sentiment_service = SentimentDataService()
+    return _sentiment_service
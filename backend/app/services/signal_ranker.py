@@ -4,10 +4,13 @@ Signal Ranking System - sorts signals by quality composite score.
 Used by the backtesting engine to prioritize which signals to allocate capital to.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
+import heapq
 import logging
 
+import numpy as np
+
 from app.models.signal import Signal
 
 logger = logging.getLogger(__name__)
@@ -16,7 +19,9 @@ logger = logging.getLogger(__name__)
 class SignalRanker:
     """Ranks signals based on composite score for portfolio allocation."""
 
-    def rank_signals(self, signals: List[Signal], db: Session) -> List[Dict]:
+    def rank_signals(
+        self, signals: List[Signal], db: Session, top_n: Optional[int] = None
+    ) -> List[Dict]:
         """
         Rank signals by composite quality score.
 
@@ -27,6 +32,7 @@ class SignalRanker:
         Args:
             signals: List of Signal objects from database
             db: Database session (for potential future lookups)
+            top_n: Only return the N best signals (None = all)
 
         Returns:
             List of dicts with ranked signals:
@@ -42,105 +48,193 @@ class SignalRanker:
                 ...
             ]
         """
-        ranked = []
-
-        for signal in signals:
-            # Only rank BUY signals (we want to allocate capital to buys)
-            if signal.signal_type != "BUY":
-                continue
+        # Only rank BUY signals (we want to allocate capital to buys)
+        buys = [signal for signal in signals if signal.signal_type == "BUY"]
+        if not buys:
+            logger.info(f"Ranked 0 BUY signals out of {len(signals)} total signals")
+            return []
+
+        n = len(buys)
+        entry = np.fromiter((float(s.entry_price or 0) for s in buys), dtype=np.float64, count=n)
+        target = np.fromiter((float(s.target_price or 0) for s in buys), dtype=np.float64, count=n)
+        stop = np.fromiter((float(s.stop_loss or 0) for s in buys), dtype=np.float64, count=n)
+        confidence = np.fromiter((float(s.confidence) for s in buys), dtype=np.float64, count=n)
+
+        expected_returns = self._expected_returns(entry, target)
+        risk_factors = self._risk_factors(entry, stop)
+        scores = self._scores(confidence, expected_returns, risk_factors)
+
+        score_list = scores.tolist()
+
+        # Sort by score descending (best signals first), ties keep input order
+        if top_n is None:
+            order = np.argsort(-scores, kind="stable").tolist()
+        else:
+            order = heapq.nlargest(top_n, range(n), key=score_list.__getitem__)
+
+        return_list = np.round(expected_returns, 4).tolist()
+        risk_list = np.round(risk_factors, 2).tolist()
+
+        ranked = [
+            {
+                "signal": buys[i],
+                "score": score_list[i],
+                "expected_return": return_list[i],
+                "risk_factor": risk_list[i],
+                "confidence": buys[i].confidence,
+                "rank": rank,
+            }
+            for rank, i in enumerate(order, start=1)
+        ]
+
+        logger.info(f"Ranked {n} BUY signals out of {len(signals)} total signals")
+        return ranked
 
-            # Calculate expected return (from entry to target)
-            expected_return = self._calculate_expected_return(signal)
+    def composite_score(
+        self,
+        confidence: int,
+        entry_price: Optional[float],
+        target_price: Optional[float],
+        stop_loss: Optional[float],
+    ) -> float:
+        """
+        Calculate the ranking score for a single signal's values.
 
-            # Calculate risk factor (based on stop-loss distance)
-            risk_factor = self._calculate_risk_factor(signal)
+        This is the value persisted in Signal.composite_score, so stored
+        scores order exactly like rank_signals would order them.
 
-            # Composite score: higher confidence, higher return, lower risk = better
-            # Normalize confidence from 1-5 scale to 0-1
-            confidence_norm = float(signal.confidence) / 5.0
-            score = confidence_norm * expected_return * (1.0 / risk_factor)
+        Args:
+            confidence: Confidence on the 1-5 scale
+            entry_price: Entry price (None if not set)
+            target_price: Target price (None if not set)
+            stop_loss: Stop-loss price (None if not set)
 
-            ranked.append(
-                {
-                    "signal": signal,
-                    "score": round(score, 6),
-                    "expected_return": round(expected_return, 4),
-                    "risk_factor": round(risk_factor, 2),
-                    "confidence": signal.confidence,
-                }
-            )
-
-        # Sort by score descending (best signals first)
-        ranked.sort(key=lambda x: x["score"], reverse=True)
-
-        # Add rank position
-        for i, item in enumerate(ranked):
-            item["rank"] = i + 1
-
-        logger.info(f"Ranked {len(ranked)} BUY signals out of {len(signals)} total signals")
-        return ranked
+        Returns:
+            Composite score rounded to 6 decimals
+        """
+        expected_return = self._expected_return(entry_price, target_price)
+        risk_factor = self._risk_factor(entry_price, stop_loss)
+        return round((confidence / 5.0) * expected_return / risk_factor, 6)
 
-    def _calculate_expected_return(self, signal: Signal) -> float:
+    def _expected_return(
+        self, entry_price: Optional[float], target_price: Optional[float]
+    ) -> float:
         """
         Calculate expected return percentage from entry to target.
 
         Args:
-            signal: Signal with entry_price and target_price
+            entry_price: Entry price (None if not set)
+            target_price: Target price (None if not set)
 
         Returns:
             Expected return as decimal (e.g., 0.25 = 25% return)
         """
-        if signal.entry_price and signal.target_price:
-            entry = float(signal.entry_price)
-            target = float(signal.target_price)
-            if entry > 0:
-                return (target - entry) / entry
+        entry = float(entry_price or 0)
+        target = float(target_price or 0)
+        if entry > 0 and target != 0:
+            return (target - entry) / entry
 
         # Default 10% expected return if prices not set
         return 0.10
 
-    def _calculate_risk_factor(self, signal: Signal) -> float:
+    def _risk_factor(self, entry_price: Optional[float], stop_loss: Optional[float]) -> float:
         """
         Calculate risk factor based on stop-loss distance.
 
         Larger stop-loss distance = higher risk factor.
 
         Args:
-            signal: Signal with entry_price and stop_loss
+            entry_price: Entry price (None if not set)
+            stop_loss: Stop-loss price (None if not set)
 
         Returns:
             Risk factor multiplier (1.0 = baseline, higher = riskier)
         """
-        if signal.entry_price and signal.stop_loss:
-            entry = float(signal.entry_price)
-            stop = float(signal.stop_loss)
-            if entry > 0:
-                downside_risk = (entry - stop) / entry
-                # Scale: 10% downside = risk factor 1.0
-                # 20% downside = risk factor 2.0, etc.
-                return max(1.0, downside_risk * 10)
+        entry = float(entry_price or 0)
+        stop = float(stop_loss or 0)
+        if entry > 0 and stop != 0:
+            # Scale: 10% downside = risk factor 1.0
+            # 20% downside = risk factor 2.0, etc.
+            return max(1.0, (entry - stop) / entry * 10)
 
         # Default medium risk if stop-loss not set
         return 1.5
 
+    def _scores(
+        self, confidence: np.ndarray, expected_returns: np.ndarray, risk_factors: np.ndarray
+    ) -> np.ndarray:
+        """Composite score: higher confidence, higher return, lower risk = better."""
+        # Normalize confidence from 1-5 scale to 0-1
+        return np.round((confidence / 5.0) * expected_returns / risk_factors, 6)
+
+    def _expected_returns(self, entry: np.ndarray, target: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _expected_return over arrays of prices.
+
+        Missing prices must be passed as 0.0.
+        """
+        valid = (entry > 0) & (target != 0)
+        returns = np.full(entry.shape, 0.10)
+        np.divide(target - entry, entry, out=returns, where=valid)
+        return returns
+
+    def _risk_factors(self, entry: np.ndarray, stop: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _risk_factor over arrays of prices.
+
+        Missing prices must be passed as 0.0.
+        """
+        valid = (entry > 0) & (stop != 0)
+        downside = np.zeros(entry.shape)
+        np.divide(entry - stop, entry, out=downside, where=valid)
+        return np.where(valid, np.maximum(1.0, downside * 10), 1.5)
+
     def get_top_signals(
-        self, signals: List[Signal], db: Session, top_n: int = 5
+        self, signals: Optional[List[Signal]], db: Session, top_n: int = 5
     ) -> List[Dict]:
         """
         Get top N ranked signals.
 
-        Convenience method for quickly getting best signals.
+        Convenience method for quickly getting best signals. With no list
+        given, the top BUY signals are read from the database ordered by
+        their stored composite_score.
 
         Args:
-            signals: List of Signal objects
+            signals: List of Signal objects, or None to query the database
             db: Database session
             top_n: Number of top signals to return
 
         Returns:
             Top N ranked signals
         """
-        ranked = self.rank_signals(signals, db)
-        return ranked[:top_n]
+        if signals is None:
+            return self._get_top_stored_signals(db, top_n)
+
+        return self.rank_signals(signals, db, top_n=top_n)
+
+    def _get_top_stored_signals(self, db: Session, top_n: int) -> List[Dict]:
+        """Top N BUY signals by persisted composite_score."""
+        signals = (
+            db.query(Signal)
+            .filter(Signal.signal_type == "BUY", Signal.composite_score.isnot(None))
+            .order_by(Signal.composite_score.desc(), Signal.id)
+            .limit(top_n)
+            .all()
+        )
+
+        return [
+            {
+                "signal": signal,
+                "score": signal.composite_score,
+                "expected_return": round(
+                    self._expected_return(signal.entry_price, signal.target_price), 4
+                ),
+                "risk_factor": round(self._risk_factor(signal.entry_price, signal.stop_loss), 2),
+                "confidence": signal.confidence,
+                "rank": rank,
+            }
+            for rank, signal in enumerate(signals, start=1)
+        ]
 
 
 # Singleton instance
@@ -3,20 +3,123 @@ Signal Service - CRUD operations for trading signals
 Handles signal persistence, risk parameters, and history
 """
 
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from bisect import bisect_right
+from collections import Counter
+from typing import Iterable, List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from decimal import Decimal
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from functools import lru_cache
+import numpy as np
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import case, desc, func, insert, select, update
 import logging
 
-from app.models.signal import Signal
+from app.models.signal import SIGNAL_TYPE_CODES, Signal
 from app.models.agent_analysis import AgentAnalysis
+from app.services.signal_ranker import signal_ranker
 from app.agents.signal_generator import ConsensusSignal, PositionSize
 from app.agents.base_agent import AgentSignal, SignalType
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
+_LOGGER = logging.getLogger("signal_service")
+
+# Lower bounds of confidence levels 2-5 on the 1-5 scale
+_CONFIDENCE_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+
+# Distinct cent amounts whose Decimal is memoized (prices cluster)
+DECIMAL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=DECIMAL_CACHE_SIZE)
+def _cents_to_decimal(cents: int) -> Decimal:
+    """Exact Decimal for a whole number of cents."""
+    return Decimal(cents).scaleb(-2)
+
+
+def _to_decimal(value: float) -> Decimal:
+    """Round a float to cents as a Decimal for Numeric(10, 2) columns."""
+    return _cents_to_decimal(int(round(value * 100)))
+
+
+def _round_price(value: Optional[float]) -> Optional[float]:
+    """Round a price to cents as Numeric(10, 2) stores it; None stays None."""
+    return None if value is None else round(float(value), 2)
+
+
+# get_statistics results per window size: days -> (computed_at, stats)
+STATISTICS_CACHE_TTL = 60
+_statistics_cache: Dict[int, Any] = {}
+# Bumped on every clear so results computed before a write are not cached
+_statistics_generation = 0
+
+_cache_lock = threading.Lock()
+
+
+def _clear_signal_caches():
+    """Drop cached statistics after signals are written."""
+    global _statistics_generation
+    with _cache_lock:
+        _statistics_cache.clear()
+        _statistics_generation += 1
+
+
+# Agent signal type -> database signal_type
+_SIGNAL_TYPE_MAP = {
+    SignalType.STRONG_BUY: "BUY",
+    SignalType.BUY: "BUY",
+    SignalType.HOLD: "HOLD",
+    SignalType.SELL: "SELL",
+    SignalType.STRONG_SELL: "SELL",
+}
+
+# Columns written by copy_signals; id comes from the sequence
+_COPY_SIGNALS_SQL = (
+    "COPY signals (ticker, signal_type, confidence, entry_price, target_price, "
+    "stop_loss, composite_score, position_size, status, timestamp) FROM STDIN"
+)
+
+# Columns loaded by get_signals_summary; skips notes and the agent summary
+_SUMMARY_COLUMNS = (
+    Signal.id,
+    Signal.ticker,
+    Signal.signal_type,
+    Signal.confidence,
+    Signal.entry_price,
+    Signal.target_price,
+    Signal.stop_loss,
+    Signal.position_size,
+    Signal.status,
+    Signal.timestamp,
+)
+
+# Price direction per agent signal type: +1 long, -1 short, 0 flat
+_DIRECTION = {
+    SignalType.STRONG_BUY: 1,
+    SignalType.BUY: 1,
+    SignalType.HOLD: 0,
+    SignalType.SELL: -1,
+    SignalType.STRONG_SELL: -1,
+}
+
+
+def _should_alert(signal: Signal) -> bool:
+    """Only high-confidence BUY/SELL signals (confidence >= 4, 80%) alert."""
+    return signal.confidence >= 4 and signal.signal_type != "HOLD"
+
+
+def _alert_data(signal: Signal) -> Dict[str, Any]:
+    """Signal fields sent to the Telegram alert tasks."""
+    return {
+        "ticker": signal.ticker,
+        "signal_type": signal.signal_type,
+        "confidence": signal.confidence / 5.0,  # Convert 1-5 to 0-1
+        "entry_price": float(signal.entry_price) if signal.entry_price else None,
+        "target_price": float(signal.target_price) if signal.target_price else None,
+        "stop_loss": float(signal.stop_loss) if signal.stop_loss else None,
+    }
 
 
 def _trigger_telegram_alert(signal: Signal) -> bool:
@@ -25,27 +128,18 @@ def _trigger_telegram_alert(signal: Signal) -> bool:
 
     Only alerts for BUY/SELL signals with confidence >= 4 (80%).
     """
-    if not settings.TELEGRAM_BOT_TOKEN or not settings.TELEGRAM_CHAT_ID:
-        return False
-
-    # Only alert for high-confidence BUY/SELL signals
-    if signal.confidence < 4 or signal.signal_type == "HOLD":
+    # Eligibility is checked before settings
+    if not _should_alert(signal) or not (
+        settings.TELEGRAM_BOT_TOKEN and settings.TELEGRAM_CHAT_ID
+    ):
         return False
 
     try:
+        # Imported here: app.tasks imports signal_tasks, which imports this module
         from app.tasks.telegram_tasks import send_signal_alert_task
 
-        signal_data = {
-            "ticker": signal.ticker,
-            "signal_type": signal.signal_type,
-            "confidence": signal.confidence / 5.0,  # Convert 1-5 to 0-1
-            "entry_price": float(signal.entry_price) if signal.entry_price else None,
-            "target_price": float(signal.target_price) if signal.target_price else None,
-            "stop_loss": float(signal.stop_loss) if signal.stop_loss else None,
-        }
-
         # Trigger async task
-        send_signal_alert_task.delay(signal_data)
+        send_signal_alert_task.delay(_alert_data(signal))
         logger.info(f"Telegram alert triggered for {signal.ticker}")
         return True
     except Exception as e:
@@ -53,6 +147,28 @@ def _trigger_telegram_alert(signal: Signal) -> bool:
         return False
 
 
+def _trigger_telegram_alerts(signals: List[Signal]) -> int:
+    """
+    Trigger one combined Telegram alert for the eligible signals of a batch.
+
+    Returns:
+        Number of signals included in the alert
+    """
+    alerts = [_alert_data(signal) for signal in signals if _should_alert(signal)]
+    if not alerts or not (settings.TELEGRAM_BOT_TOKEN and settings.TELEGRAM_CHAT_ID):
+        return 0
+
+    try:
+        from app.tasks.telegram_tasks import send_signal_alerts_task
+
+        send_signal_alerts_task.delay(alerts)
+        logger.info(f"Telegram alert triggered for {len(alerts)} signals")
+        return len(alerts)
+    except Exception as e:
+        logger.warning(f"Failed to trigger Telegram alerts: {e}")
+        return 0
+
+
 class SignalService:
     """
     Service for managing trading signals.
@@ -86,7 +202,7 @@ class SignalService:
             db: SQLAlchemy database session
         """
         self.db = db
-        self.logger = logging.getLogger("signal_service")
+        self.logger = _LOGGER
 
     def save_signal(
         self,
@@ -103,46 +219,35 @@ class SignalService:
             portfolio_value: Total portfolio value for position sizing
 
         Returns:
-            Saved Signal database object
+            Detached Signal built from the inserted values with its id and
+            timestamp. Relationships are not loaded (agent_analyses is
+            empty); reload with get_signal before rendering analyses.
         """
         # Calculate risk parameters
         stop_loss = self._calculate_stop_loss(entry_price, consensus.signal)
         target_price = self._calculate_target_price(entry_price, consensus.signal)
-        position_size = self._calculate_shares(
-            entry_price, portfolio_value, consensus.position_size
-        )
-
-        # Map signal type to database format
-        signal_type = self._map_signal_type(consensus.signal)
-
-        # Map confidence to 1-5 scale
-        confidence_score = self._map_confidence(consensus.confidence)
-
-        # Create signal record
-        signal = Signal(
-            ticker=consensus.ticker,
-            signal_type=signal_type,
-            confidence=confidence_score,
-            entry_price=Decimal(str(round(entry_price, 2))),
-            target_price=Decimal(str(round(target_price, 2))),
-            stop_loss=Decimal(str(round(stop_loss, 2))),
-            position_size=position_size,
-            status="PENDING",
-            notes=consensus.reasoning[:500] if consensus.reasoning else None,
+        values = self._signal_values(
+            consensus, entry_price, target_price, stop_loss, portfolio_value
         )
 
-        self.db.add(signal)
-        self.db.flush()  # Get the signal ID
+        # INSERT ... RETURNING gets the generated id and timestamp in the same
+        # round-trip, instead of add + flush and a refresh after commit
+        signal_id, timestamp = self.db.execute(
+            insert(Signal).returning(Signal.id, Signal.timestamp), values
+        ).one()
 
         # Save individual agent analyses
-        self._save_agent_analyses(signal.id, consensus.agent_signals)
+        self._save_agent_analyses(signal_id, consensus.agent_signals)
 
         self.db.commit()
-        self.db.refresh(signal)
+        _clear_signal_caches()
+
+        # Build the saved record in memory for callers and the Telegram alert
+        signal = Signal(id=signal_id, timestamp=timestamp, **values)
 
         self.logger.info(
             f"Saved signal {signal.id}: {signal.ticker} {signal.signal_type} "
-            f"@ ${entry_price} (confidence: {signal.confidence})"
+            f"@ ${values['entry_price']} (confidence: {signal.confidence})"
         )
 
         # Trigger Telegram alert for high-confidence signals
@@ -150,22 +255,205 @@ class SignalService:
 
         return signal
 
+    def save_signals_bulk(
+        self,
+        consensus_list: List[ConsensusSignal],
+        entry_prices: List[float],
+        portfolio_value: float = 100000.0,
+    ) -> List[Signal]:
+        """
+        Save consensus signals for many tickers in one transaction.
+
+        Stop loss and target prices are computed for all signals at once,
+        then the signals and their agent analyses are written with one
+        INSERT each.
+
+        Args:
+            consensus_list: ConsensusSignals from SignalGenerator
+            entry_prices: Entry price for each consensus, in the same order
+            portfolio_value: Total portfolio value for position sizing
+
+        Returns:
+            Detached Signal objects built from the inserted values, in input
+            order. Relationships are not loaded (agent_analyses is empty);
+            reload with get_signal before rendering analyses.
+        """
+        if not consensus_list:
+            return []
+
+        entries = np.asarray(entry_prices, dtype=np.float64)
+        directions = np.fromiter(
+            (_DIRECTION.get(c.signal, 0) for c in consensus_list),
+            dtype=np.float64,
+            count=len(consensus_list),
+        )
+        stops = (entries * (1 - directions * self.STOP_LOSS_PERCENT)).tolist()
+        targets = (entries * (1 + directions * self.TARGET_PERCENT)).tolist()
+
+        rows = [
+            self._signal_values(consensus, entry, target, stop, portfolio_value)
+            for consensus, entry, target, stop in zip(
+                consensus_list, entries.tolist(), targets, stops
+            )
+        ]
+
+        # sort_by_parameter_order keeps RETURNING rows aligned with the input
+        returned = self.db.execute(
+            insert(Signal).returning(
+                Signal.id, Signal.timestamp, sort_by_parameter_order=True
+            ),
+            rows,
+        ).all()
+
+        analyses = [
+            row
+            for (signal_id, _), consensus in zip(returned, consensus_list)
+            for row in self._agent_analysis_rows(signal_id, consensus.agent_signals)
+        ]
+        if analyses:
+            self.db.execute(insert(AgentAnalysis), analyses)
+
+        self.db.commit()
+        _clear_signal_caches()
+
+        signals = [
+            Signal(id=signal_id, timestamp=timestamp, **values)
+            for (signal_id, timestamp), values in zip(returned, rows)
+        ]
+        self.logger.info(f"Saved {len(signals)} signals in bulk")
+
+        # One combined alert for the batch instead of one task per signal
+        _trigger_telegram_alerts(signals)
+
+        return signals
+
+    def copy_signals(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Load historical signals with PostgreSQL COPY FROM STDIN.
+
+        Intended for backfills such as replaying backtest signals. Rows are
+        streamed to the server as they are read, so memory stays flat for
+        large iterables. Agent analyses are not written.
+
+        Args:
+            rows: Dicts with ticker, signal_type, confidence, entry_price,
+                  target_price, stop_loss and timestamp; position_size,
+                  status (default PENDING) and composite_score are optional
+
+        Returns:
+            Number of rows copied
+        """
+        driver_connection = self.db.connection().connection.driver_connection
+        count = 0
+
+        with driver_connection.cursor() as cursor:
+            with cursor.copy(_COPY_SIGNALS_SQL) as copy:
+                for row in rows:
+                    # Score the prices as stored, like _signal_values does
+                    entry_price = _round_price(row.get("entry_price"))
+                    target_price = _round_price(row.get("target_price"))
+                    stop_loss = _round_price(row.get("stop_loss"))
+
+                    composite_score = row.get("composite_score")
+                    if composite_score is None:
+                        composite_score = signal_ranker.composite_score(
+                            row["confidence"], entry_price, target_price, stop_loss
+                        )
+                    # COPY bypasses the column type, so encode signal_type here
+                    copy.write_row((
+                        row["ticker"],
+                        SIGNAL_TYPE_CODES[row["signal_type"]],
+                        row["confidence"],
+                        entry_price,
+                        target_price,
+                        stop_loss,
+                        composite_score,
+                        row.get("position_size"),
+                        row.get("status", "PENDING"),
+                        row["timestamp"],
+                    ))
+                    count += 1
+
+        self.db.commit()
+        _clear_signal_caches()
+
+        self.logger.info(f"Copied {count} signals")
+        return count
+
+    def _signal_values(
+        self,
+        consensus: ConsensusSignal,
+        entry_price: float,
+        target_price: float,
+        stop_loss: float,
+        portfolio_value: float,
+    ) -> Dict[str, Any]:
+        """Build the signals row for a consensus with its risk parameters."""
+        position_size = self._calculate_shares(
+            entry_price, portfolio_value, consensus.position_size
+        )
+
+        # Map signal type to database format
+        signal_type = self._map_signal_type(consensus.signal)
+
+        # Map confidence to 1-5 scale
+        confidence_score = self._map_confidence(consensus.confidence)
+
+        # Agent summary stored on the signal row so list views need no join
+        agent_count = len(consensus.agent_signals)
+        agreeing = sum(
+            self._map_signal_type(agent_signal.signal) == signal_type
+            for agent_signal in consensus.agent_signals
+        )
+        agent_agreement = round(agreeing / agent_count, 4) if agent_count else None
+
+        entry_price = round(entry_price, 2)
+        target_price = round(target_price, 2)
+        stop_loss = round(stop_loss, 2)
+
+        return {
+            "ticker": consensus.ticker,
+            "signal_type": signal_type,
+            "confidence": confidence_score,
+            "entry_price": _to_decimal(entry_price),
+            "target_price": _to_decimal(target_price),
+            "stop_loss": _to_decimal(stop_loss),
+            "composite_score": signal_ranker.composite_score(
+                confidence_score, entry_price, target_price, stop_loss
+            ),
+            "position_size": position_size,
+            "agent_count": agent_count,
+            "agent_agreement": agent_agreement,
+            # Explicit so the returned Signal matches the row; the column
+            # default only applies inside the INSERT
+            "status": "PENDING",
+            "notes": consensus.reasoning[:500] if consensus.reasoning else None,
+        }
+
     def _save_agent_analyses(
         self, signal_id: int, agent_signals: List[AgentSignal]
     ) -> None:
-        """Save individual agent analyses to database."""
-        for agent_signal in agent_signals:
-            # AgentSignal uses 'factors' dict, map to data_used for database
-            data_used = getattr(agent_signal, "factors", {}) or {}
-            analysis = AgentAnalysis(
-                signal_id=signal_id,
-                agent_name=agent_signal.agent_name,
-                recommendation=agent_signal.signal.value,
-                confidence=self._map_confidence(agent_signal.confidence),
-                reasoning=agent_signal.reasoning[:1000] if agent_signal.reasoning else "",
-                data_used=data_used,
-            )
-            self.db.add(analysis)
+        """Save individual agent analyses to database in one bulk INSERT."""
+        rows = self._agent_analysis_rows(signal_id, agent_signals)
+        if rows:
+            self.db.execute(insert(AgentAnalysis), rows)
+
+    def _agent_analysis_rows(
+        self, signal_id: int, agent_signals: List[AgentSignal]
+    ) -> List[Dict[str, Any]]:
+        """Build agent_analysis rows for a saved signal."""
+        return [
+            {
+                "signal_id": signal_id,
+                "agent_name": agent_signal.agent_name,
+                "recommendation": agent_signal.signal.value,
+                "confidence": self._map_confidence(agent_signal.confidence),
+                "reasoning": agent_signal.reasoning[:1000] if agent_signal.reasoning else "",
+                # AgentSignal uses 'factors' dict, map to data_used for database
+                "data_used": getattr(agent_signal, "factors", {}) or {},
+            }
+            for agent_signal in agent_signals
+        ]
 
     def _calculate_stop_loss(self, entry_price: float, signal: SignalType) -> float:
         """
@@ -174,12 +462,7 @@ class SignalService:
         For BUY signals: entry * (1 - STOP_LOSS_PERCENT)
         For SELL signals: entry * (1 + STOP_LOSS_PERCENT)
         """
-        if signal in (SignalType.BUY, SignalType.STRONG_BUY):
-            return entry_price * (1 - self.STOP_LOSS_PERCENT)
-        elif signal in (SignalType.SELL, SignalType.STRONG_SELL):
-            return entry_price * (1 + self.STOP_LOSS_PERCENT)
-        else:
-            return entry_price
+        return entry_price * (1 - _DIRECTION.get(signal, 0) * self.STOP_LOSS_PERCENT)
 
     def _calculate_target_price(self, entry_price: float, signal: SignalType) -> float:
         """
@@ -188,12 +471,7 @@ class SignalService:
         For BUY signals: entry * (1 + TARGET_PERCENT)
         For SELL signals: entry * (1 - TARGET_PERCENT)
         """
-        if signal in (SignalType.BUY, SignalType.STRONG_BUY):
-            return entry_price * (1 + self.TARGET_PERCENT)
-        elif signal in (SignalType.SELL, SignalType.STRONG_SELL):
-            return entry_price * (1 - self.TARGET_PERCENT)
-        else:
-            return entry_price
+        return entry_price * (1 + _DIRECTION.get(signal, 0) * self.TARGET_PERCENT)
 
     def _calculate_shares(
         self,
@@ -219,27 +497,11 @@ class SignalService:
 
     def _map_signal_type(self, signal: SignalType) -> str:
         """Map SignalType enum to database string."""
-        mapping = {
-            SignalType.STRONG_BUY: "BUY",
-            SignalType.BUY: "BUY",
-            SignalType.HOLD: "HOLD",
-            SignalType.SELL: "SELL",
-            SignalType.STRONG_SELL: "SELL",
-        }
-        return mapping.get(signal, "HOLD")
+        return _SIGNAL_TYPE_MAP.get(signal, "HOLD")
 
     def _map_confidence(self, confidence: float) -> int:
         """Map confidence (0.0-1.0) to 1-5 scale."""
-        if confidence >= 0.8:
-            return 5
-        elif confidence >= 0.6:
-            return 4
-        elif confidence >= 0.4:
-            return 3
-        elif confidence >= 0.2:
-            return 2
-        else:
-            return 1
+        return bisect_right(_CONFIDENCE_THRESHOLDS, confidence) + 1
 
     def get_signal(self, signal_id: int) -> Optional[Signal]:
         """
@@ -253,6 +515,7 @@ class SignalService:
         """
         return (
             self.db.query(Signal)
+            .options(selectinload(Signal.agent_analyses))
             .filter(Signal.id == signal_id)
             .first()
         )
@@ -265,6 +528,7 @@ class SignalService:
         days: int = 30,
         limit: int = 100,
         offset: int = 0,
+        include_analyses: bool = False,
     ) -> List[Signal]:
         """
         Get signals with optional filtering.
@@ -276,12 +540,16 @@ class SignalService:
             days: Number of days to look back
             limit: Maximum number of signals to return
             offset: Offset for pagination
+            include_analyses: Load agent analyses in one extra query
 
         Returns:
             List of matching signals
         """
         query = self.db.query(Signal)
 
+        if include_analyses:
+            query = query.options(selectinload(Signal.agent_analyses))
+
         # Apply filters
         if ticker:
             query = query.filter(Signal.ticker == ticker.upper())
@@ -302,6 +570,39 @@ class SignalService:
 
         return query.all()
 
+    def get_signals_summary(
+        self,
+        ticker: Optional[str] = None,
+        signal_type: Optional[str] = None,
+        status: Optional[str] = None,
+        days: int = 30,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Any]:
+        """
+        Get summary rows for signals with optional filtering.
+
+        Same filters and ordering as get_signals, but selects only the
+        _SUMMARY_COLUMNS instead of building full Signal objects.
+
+        Returns:
+            List of rows with attribute access (row.ticker, row.entry_price, ...)
+        """
+        since = datetime.utcnow() - timedelta(days=days)
+        stmt = select(*_SUMMARY_COLUMNS).where(Signal.timestamp >= since)
+
+        if ticker:
+            stmt = stmt.where(Signal.ticker == ticker.upper())
+
+        if signal_type:
+            stmt = stmt.where(Signal.signal_type == signal_type.upper())
+
+        if status:
+            stmt = stmt.where(Signal.status == status.upper())
+
+        stmt = stmt.order_by(desc(Signal.timestamp)).offset(offset).limit(limit)
+        return self.db.execute(stmt).all()
+
     def get_signals_by_ticker(self, ticker: str, limit: int = 10) -> List[Signal]:
         """Get recent signals for a specific ticker."""
         return self.get_signals(ticker=ticker, limit=limit)
@@ -327,26 +628,44 @@ class SignalService:
             notes: Additional notes
 
         Returns:
-            Updated signal or None if not found
+            Updated signal or None if not found. Relationships are not
+            loaded; use get_signal when agent analyses are needed.
         """
-        signal = self.get_signal(signal_id)
-        if not signal:
-            return None
+        status = status.upper()
+        updates = {"status": status}
 
-        signal.status = status.upper()
-
-        if status.upper() == "EXECUTED":
-            signal.executed_at = datetime.utcnow()
-        elif status.upper() == "CLOSED":
-            signal.closed_at = datetime.utcnow()
+        if status == "EXECUTED":
+            updates["executed_at"] = datetime.utcnow()
+        elif status == "CLOSED":
+            updates["closed_at"] = datetime.utcnow()
             if pnl is not None:
-                signal.pnl = Decimal(str(round(pnl, 2)))
+                updates["pnl"] = _to_decimal(pnl)
 
         if notes:
-            signal.notes = notes
-
-        self.db.commit()
-        self.db.refresh(signal)
+            updates["notes"] = notes
+
+        if not self.db.get_bind().dialect.update_returning:
+            signal = self.get_signal(signal_id)
+            if not signal:
+                return None
+            for field, value in updates.items():
+                setattr(signal, field, value)
+            self.db.commit()
+            _clear_signal_caches()
+            self.db.refresh(signal)
+        else:
+            # UPDATE ... RETURNING replaces the SELECT before and the refresh after
+            row = self.db.execute(
+                update(Signal)
+                .where(Signal.id == signal_id)
+                .values(**updates)
+                .returning(*Signal.__table__.c)
+            ).one_or_none()
+            if row is None:
+                return None
+            self.db.commit()
+            _clear_signal_caches()
+            signal = Signal(**row._mapping)
 
         self.logger.info(f"Updated signal {signal_id} status to {status}")
         return signal
@@ -365,12 +684,17 @@ class SignalService:
         """Close a signal with P&L result."""
         return self.update_signal_status(signal_id, "CLOSED", pnl=pnl, notes=notes)
 
-    def signal_to_dict(self, signal: Signal) -> Dict[str, Any]:
+    def signal_to_dict(self, signal: Signal, include_analyses: bool = False) -> Dict[str, Any]:
         """
-        Convert Signal to dictionary with agent analyses.
+        Convert Signal to dictionary, optionally with agent analyses.
+
+        Pass include_analyses only when agent_analyses was eager-loaded
+        (see get_signal / get_signals); otherwise each signal lazy-loads it
+        with its own query.
 
         Args:
             signal: Signal database object
+            include_analyses: Include the individual agent analyses
 
         Returns:
             Dictionary representation
@@ -390,11 +714,13 @@ class SignalService:
             "closed_at": signal.closed_at.isoformat() if signal.closed_at else None,
             "pnl": float(signal.pnl) if signal.pnl else None,
             "notes": signal.notes,
+            "agent_count": signal.agent_count,
+            "agent_agreement": signal.agent_agreement,
             "agent_analyses": [],
         }
 
-        # Add agent analyses if loaded
-        if signal.agent_analyses:
+        # Add agent analyses for detail views
+        if include_analyses and signal.agent_analyses:
             result["agent_analyses"] = [
                 {
                     "id": aa.id,
@@ -414,18 +740,39 @@ class SignalService:
         """
         Get signal statistics for the specified period.
 
+        Results are cached in-process for STATISTICS_CACHE_TTL seconds and
+        dropped whenever this process saves or updates a signal.
+
         Returns:
             Dict with counts, win rate, average P&L, etc.
         """
+        now = time.monotonic()
+        with _cache_lock:
+            cached = _statistics_cache.get(days)
+            generation = _statistics_generation
+        if cached and now - cached[0] < STATISTICS_CACHE_TTL:
+            return cached[1]
+
+        stats = self._compute_statistics(days)
+        with _cache_lock:
+            # A clear during the computation means stats may predate a write
+            if generation == _statistics_generation:
+                _statistics_cache[days] = (now, stats)
+        return stats
+
+    def _compute_statistics(self, days: int) -> Dict[str, Any]:
+        """Run the aggregate queries behind get_statistics."""
         since = datetime.utcnow() - timedelta(days=days)
 
-        signals = (
-            self.db.query(Signal)
+        # Counts are aggregated in the database; only one row per group comes back
+        groups = (
+            self.db.query(Signal.signal_type, Signal.status, func.count())
             .filter(Signal.timestamp >= since)
+            .group_by(Signal.signal_type, Signal.status)
             .all()
         )
 
-        total = len(signals)
+        total = sum(count for _, _, count in groups)
         if total == 0:
             return {
                 "period_days": days,
@@ -436,22 +783,30 @@ class SignalService:
                 "average_pnl": None,
             }
 
-        # Count by type
-        by_type = {}
-        for s in signals:
-            by_type[s.signal_type] = by_type.get(s.signal_type, 0) + 1
-
-        # Count by status
-        by_status = {}
-        for s in signals:
-            by_status[s.status] = by_status.get(s.status, 0) + 1
-
-        # Calculate win rate for closed signals
-        closed = [s for s in signals if s.status == "CLOSED" and s.pnl is not None]
-        if closed:
-            winners = [s for s in closed if s.pnl > 0]
-            win_rate = len(winners) / len(closed)
-            avg_pnl = sum(float(s.pnl) for s in closed) / len(closed)
+        # Count by type and status
+        by_type = Counter()
+        by_status = Counter()
+        for signal_type, status, count in groups:
+            by_type[signal_type] += count
+            by_status[status] += count
+
+        # Calculate win rate and average P&L for closed signals
+        closed_count, winners, avg_pnl = (
+            self.db.query(
+                func.count(),
+                func.sum(case((Signal.pnl > 0, 1), else_=0)),
+                func.avg(Signal.pnl),
+            )
+            .filter(
+                Signal.timestamp >= since,
+                Signal.status == "CLOSED",
+                Signal.pnl.isnot(None),
+            )
+            .one()
+        )
+        if closed_count:
+            win_rate = winners / closed_count
+            avg_pnl = float(avg_pnl)
         else:
             win_rate = None
             avg_pnl = None
@@ -459,18 +814,22 @@ class SignalService:
         return {
             "period_days": days,
             "total_signals": total,
-            "by_type": by_type,
-            "by_status": by_status,
-            "closed_signals": len(closed),
+            "by_type": dict(by_type),
+            "by_status": dict(by_status),
+            "closed_signals": closed_count,
             "win_rate": round(win_rate, 3) if win_rate is not None else None,
             "average_pnl": round(avg_pnl, 2) if avg_pnl is not None else None,
         }
 
 
-# Singleton pattern for service access
-_signal_service: Optional[SignalService] = None
-
-
 def get_signal_service(db: Session) -> SignalService:
-    """Get or create signal service instance."""
-    return SignalService(db)
+    """
+    Get the signal service bound to a database session.
+
+    The service is cached in the session's info dict, so repeated calls
+    within one request or task reuse the same instance.
+    """
+    service = db.info.get("_signal_service")
+    if service is None:
+        service = db.info["_signal_service"] = SignalService(db)
+    return service
@@ -6,13 +6,30 @@ Uses direct Telegram API calls for reliability.
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import asyncio
+import heapq
 import logging
+import threading
+import time
 import httpx
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Timestamp shown at the bottom of messages
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M EST"
+
+
+def _timestamp() -> str:
+    """Current time formatted for message footers."""
+    return datetime.now().strftime(_TIMESTAMP_FORMAT)
+
+
+def _fmt_price(price: Optional[float]) -> str:
+    """Format a price as $0.00, or N/A when not set."""
+    return f"${float(price):.2f}" if price else "N/A"
+
 
 class TelegramBotService:
     """
@@ -26,9 +43,20 @@ class TelegramBotService:
 
     BASE_URL = "https://api.telegram.org/bot{token}/{method}"
 
+    # Telegram API request timeout and connection pool size
+    HTTP_TIMEOUT = 10.0
+    HTTP_MAX_CONNECTIONS = 32
+
+    # Telegram limits: ~1 message/s per chat and 30 messages/s overall
+    CHAT_SEND_INTERVAL = 1.0
+    GLOBAL_SEND_INTERVAL = 1.0 / 30
+
     # Confidence threshold for real-time alerts (75% = 0.75)
     ALERT_CONFIDENCE_THRESHOLD = 0.75
 
+    # Signals per combined alert message (Telegram caps messages at 4096 chars)
+    ALERT_BATCH_SIZE = 20
+
     # Signal type emojis
     SIGNAL_EMOJIS = {
         "BUY": "🟢",
@@ -36,28 +64,212 @@ class TelegramBotService:
         "HOLD": "🟡",
     }
 
-    # Confidence stars
-    CONFIDENCE_STARS = {
-        5: "⭐⭐⭐⭐⭐",
-        4: "⭐⭐⭐⭐",
-        3: "⭐⭐⭐",
-        2: "⭐⭐",
-        1: "⭐",
-    }
+    # Confidence stars, indexed by confidence on the 1-5 scale
+    CONFIDENCE_STARS = ("", "⭐", "⭐⭐", "⭐⭐⭐", "⭐⭐⭐⭐", "⭐⭐⭐⭐⭐")
+
+    # Message templates, filled with str.format_map
+    _ALERT_TPL = """🚨 <b>ALPHA MACHINE SIGNAL ALERT</b> 🚨
+
+{emoji} <b>{ticker}</b> - <b>{signal_type}</b>
+
+📊 <b>Confidence:</b> {conf_percent:.1f}% {stars}
+💰 <b>Entry Price:</b> {entry}
+🎯 <b>Target:</b> {target}
+🛑 <b>Stop Loss:</b> {stop}
+
+⏰ {timestamp}
+
+<i>This signal met the ≥75% confidence threshold</i>"""
+
+    _EMPTY_SUMMARY_TPL = """📊 <b>ALPHA MACHINE DAILY SUMMARY</b>
+
+No signals generated today.
+
+⏰ {timestamp}"""
+
+    _SUMMARY_TPL = """📊 <b>ALPHA MACHINE DAILY SUMMARY</b>
+
+📈 <b>Today's Signals:</b>
+{signal_list}
+
+📊 <b>Summary:</b>
+  🟢 BUY: {buy}
+  🔴 SELL: {sell}
+  🟡 HOLD: {hold}
+
+⏰ {timestamp}"""
+
+    _START_TPL = """🤖 <b>Welcome to Alpha Machine Bot!</b>
+
+Your AI-powered stock trading assistant.
+
+<b>Your Chat ID:</b> <code>{chat_id}</code>
+(Add this to TELEGRAM_CHAT_ID in your environment)
+
+<b>Available Commands:</b>
+/signals - View recent trading signals
+/watchlist - View monitored stocks
+/status - Check system status
+/learning - Learning system status
+/weights - View agent weights
+/help - Show this help message
+
+<i>You'll receive real-time alerts for signals with ≥75% confidence.</i>"""
+
+    _STATUS_TPL = """🖥️ <b>Alpha Machine Status</b>
+
+✅ <b>System:</b> Online
+📊 <b>Total Signals:</b> {total_signals}
+📈 <b>Today's Signals:</b> {today_signals}
+📋 <b>Active Stocks:</b> {active_stocks}
+
+🤖 <b>AI Agents:</b>
+  • ContrarianAgent (GPT-4o) ✅
+  • GrowthAgent (Claude) ✅
+  • MultiModalAgent (Gemini) ✅
+  • PredictorAgent (Local) ✅
+
+⏰ {timestamp}"""
+
+    # No placeholders, sent as is
+    _HELP_TPL = """🤖 <b>Alpha Machine Bot - Help</b>
+
+<b>Commands:</b>
+/signals - View recent trading signals (last 24h)
+/watchlist - View monitored stocks
+/status - Check system status
+/learning - Learning system status &amp; biases
+/weights - View current agent weights
+/help - Show this help message
+
+<b>Automatic Notifications:</b>
+• Real-time alerts for signals with ≥75% confidence
+• Daily summary at 8:30 AM EST
+• Bias detection alerts
+• Weight change notifications
+• Market regime shift alerts
+
+<b>Signal Types:</b>
+🟢 BUY - Recommended to buy
+🔴 SELL - Recommended to sell
+🟡 HOLD - Maintain current position
+
+<b>Confidence Levels:</b>
+⭐⭐⭐⭐⭐ 80-100% - Very high confidence
+⭐⭐⭐⭐ 60-80% - High confidence
+⭐⭐⭐ 40-60% - Moderate confidence
+
+<i>For support, visit the Alpha Machine dashboard.</i>"""
 
     def __init__(self):
         """Initialize Telegram bot service."""
         self.token = settings.TELEGRAM_BOT_TOKEN
         self.chat_id = settings.TELEGRAM_CHAT_ID
         self.logger = logging.getLogger("telegram_bot")
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Next free send slot per chat and overall (time.monotonic seconds)
+        self._chat_next_send: Dict[str, float] = {}
+        self._global_next_send = 0.0
+        self._rate_lock = threading.Lock()
 
         if not self.token:
             self.logger.warning("TELEGRAM_BOT_TOKEN not configured")
 
+    def _confidence_stars(self, confidence: float) -> str:
+        """Stars for a confidence given as 0-1 or on the 1-5 scale."""
+        conf_int = int(confidence) if confidence > 1 else int(confidence * 5)
+        return self.CONFIDENCE_STARS[min(5, max(0, conf_int))]
+
     def _get_url(self, method: str) -> str:
         """Get Telegram API URL for a method."""
         return self.BASE_URL.format(token=self.token, method=method)
 
+    def _get_sync_client(self) -> httpx.Client:
+        """
+        Get the shared HTTP client for synchronous sends.
+
+        Created on first use and kept for the life of the service, so
+        consecutive alerts reuse the open TLS connection to the API.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.HTTP_TIMEOUT,
+                        limits=httpx.Limits(max_connections=self.HTTP_MAX_CONNECTIONS),
+                    )
+        return self._client
+
+    def _reserve_send_slot(self, chat_id: str) -> float:
+        """
+        Reserve the next send slot for a chat under the rate limits.
+
+        Slots are handed out in call order, so bursts are spread out
+        instead of being rejected with HTTP 429.
+
+        Returns:
+            Seconds to wait before sending
+        """
+        now = time.monotonic()
+        with self._rate_lock:
+            start = max(now, self._chat_next_send.get(chat_id, 0.0), self._global_next_send)
+            self._chat_next_send[chat_id] = start + self.CHAT_SEND_INTERVAL
+            self._global_next_send = start + self.GLOBAL_SEND_INTERVAL
+        return start - now
+
+    @staticmethod
+    def _retry_after(result: Dict[str, Any]) -> Optional[float]:
+        """Seconds Telegram asks us to wait, if the response is a 429."""
+        if result.get("error_code") != 429:
+            return None
+        return float(result.get("parameters", {}).get("retry_after", 1))
+
+    async def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client for async sends.
+
+        An AsyncClient is tied to the event loop it was first used on, so a
+        new one is created when called from a different loop, and the old
+        one is closed.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_client
+        if client is None or client.is_closed or self._async_client_loop is not loop:
+            if client is not None and not client.is_closed:
+                try:
+                    await client.aclose()
+                except Exception as e:
+                    # Its connections belong to the old, possibly closed, loop
+                    self.logger.debug(f"Failed to close stale HTTP client: {e}")
+            self._async_client = httpx.AsyncClient(
+                timeout=self.HTTP_TIMEOUT,
+                limits=httpx.Limits(max_connections=self.HTTP_MAX_CONNECTIONS),
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def close(self) -> None:
+        """Close the shared HTTP client for synchronous sends."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients at shutdown."""
+        if self._async_client is not None:
+            try:
+                await self._async_client.aclose()
+            except Exception as e:
+                self.logger.warning(f"Failed to close HTTP client: {e}")
+            self._async_client = None
+            self._async_client_loop = None
+        self.close()
+
     async def send_message(
         self,
         text: str,
@@ -85,7 +297,13 @@ class TelegramBotService:
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
+            # One retry if Telegram still answers 429 despite the limiter
+            for attempt in range(2):
+                wait = self._reserve_send_slot(target_chat)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                client = await self._get_async_client()
                 response = await client.post(
                     self._get_url("sendMessage"),
                     json={
@@ -93,16 +311,21 @@ class TelegramBotService:
                         "text": text,
                         "parse_mode": parse_mode,
                     },
-                    timeout=10.0,
                 )
                 result = response.json()
 
-                if result.get("ok"):
-                    self.logger.info(f"Message sent to chat {target_chat}")
-                    return True
-                else:
-                    self.logger.error(f"Telegram API error: {result}")
-                    return False
+                retry_after = self._retry_after(result)
+                if retry_after is None or attempt:
+                    break
+                self.logger.warning(f"Telegram rate limited, retrying in {retry_after}s")
+                await asyncio.sleep(retry_after)
+
+            if result.get("ok"):
+                self.logger.info(f"Message sent to chat {target_chat}")
+                return True
+            else:
+                self.logger.error(f"Telegram API error: {result}")
+                return False
 
         except Exception as e:
             self.logger.error(f"Failed to send message: {e}")
@@ -117,8 +340,6 @@ class TelegramBotService:
         Synchronous wrapper for send_message.
         Used in non-async contexts (e.g., Celery tasks).
         """
-        import httpx
-
         if not self.token:
             return False
 
@@ -127,148 +348,127 @@ class TelegramBotService:
             return False
 
         try:
-            response = httpx.post(
-                self._get_url("sendMessage"),
-                json={
-                    "chat_id": target_chat,
-                    "text": text,
-                    "parse_mode": "HTML",
-                },
-                timeout=10.0,
-            )
-            return response.json().get("ok", False)
+            # One retry if Telegram still answers 429 despite the limiter
+            for attempt in range(2):
+                wait = self._reserve_send_slot(target_chat)
+                if wait > 0:
+                    time.sleep(wait)
+
+                response = self._get_sync_client().post(
+                    self._get_url("sendMessage"),
+                    json={
+                        "chat_id": target_chat,
+                        "text": text,
+                        "parse_mode": "HTML",
+                    },
+                )
+                result = response.json()
+
+                retry_after = self._retry_after(result)
+                if retry_after is None or attempt:
+                    break
+                self.logger.warning(f"Telegram rate limited, retrying in {retry_after}s")
+                time.sleep(retry_after)
+
+            return result.get("ok", False)
         except Exception as e:
             self.logger.error(f"Failed to send message: {e}")
             return False
 
-    async def send_signal_alert(self, signal_data: Dict[str, Any]) -> bool:
-        """
-        Send real-time alert for a high-confidence signal.
-        """
-        ticker = signal_data.get("ticker", "UNKNOWN")
+    def _format_signal_alert(self, signal_data: Dict[str, Any]) -> str:
+        """Format the alert message for a single signal."""
         signal_type = signal_data.get("signal_type", "HOLD")
         confidence = signal_data.get("confidence", 0)
-        entry_price = signal_data.get("entry_price")
-        target_price = signal_data.get("target_price")
-        stop_loss = signal_data.get("stop_loss")
 
-        # Convert confidence to percentage
-        conf_percent = confidence * 100 if confidence <= 1 else confidence * 20
-
-        emoji = self.SIGNAL_EMOJIS.get(signal_type, "⚪")
-        conf_int = int(confidence) if confidence > 1 else int(confidence * 5)
-        stars = self.CONFIDENCE_STARS.get(conf_int, "")
-
-        # Format prices safely
-        entry_str = f"${entry_price:.2f}" if entry_price else "N/A"
-        target_str = f"${target_price:.2f}" if target_price else "N/A"
-        stop_str = f"${stop_loss:.2f}" if stop_loss else "N/A"
-
-        message = f"""🚨 <b>ALPHA MACHINE SIGNAL ALERT</b> 🚨
-
-{emoji} <b>{ticker}</b> - <b>{signal_type}</b>
-
-📊 <b>Confidence:</b> {conf_percent:.1f}% {stars}
-💰 <b>Entry Price:</b> {entry_str}
-🎯 <b>Target:</b> {target_str}
-🛑 <b>Stop Loss:</b> {stop_str}
+        return self._ALERT_TPL.format_map({
+            "ticker": signal_data.get("ticker", "UNKNOWN"),
+            "signal_type": signal_type,
+            "emoji": self.SIGNAL_EMOJIS.get(signal_type, "⚪"),
+            # Convert confidence to percentage
+            "conf_percent": confidence * 100 if confidence <= 1 else confidence * 20,
+            "stars": self._confidence_stars(confidence),
+            "entry": _fmt_price(signal_data.get("entry_price")),
+            "target": _fmt_price(signal_data.get("target_price")),
+            "stop": _fmt_price(signal_data.get("stop_loss")),
+            "timestamp": _timestamp(),
+        })
 
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}
-
-<i>This signal met the ≥75% confidence threshold</i>"""
-
-        return await self.send_message(message)
+    async def send_signal_alert(self, signal_data: Dict[str, Any]) -> bool:
+        """
+        Send real-time alert for a high-confidence signal.
+        """
+        return await self.send_message(self._format_signal_alert(signal_data))
 
     def send_signal_alert_sync(self, signal_data: Dict[str, Any]) -> bool:
         """Synchronous wrapper for send_signal_alert."""
-        ticker = signal_data.get("ticker", "UNKNOWN")
-        signal_type = signal_data.get("signal_type", "HOLD")
-        confidence = signal_data.get("confidence", 0)
-        entry_price = signal_data.get("entry_price")
-        target_price = signal_data.get("target_price")
-        stop_loss = signal_data.get("stop_loss")
-
-        conf_percent = confidence * 100 if confidence <= 1 else confidence * 20
-        emoji = self.SIGNAL_EMOJIS.get(signal_type, "⚪")
-        conf_int = int(confidence) if confidence > 1 else int(confidence * 5)
-        stars = self.CONFIDENCE_STARS.get(conf_int, "")
-
-        entry_str = f"${entry_price:.2f}" if entry_price else "N/A"
-        target_str = f"${target_price:.2f}" if target_price else "N/A"
-        stop_str = f"${stop_loss:.2f}" if stop_loss else "N/A"
-
-        message = f"""🚨 <b>ALPHA MACHINE SIGNAL ALERT</b> 🚨
-
-{emoji} <b>{ticker}</b> - <b>{signal_type}</b>
-
-📊 <b>Confidence:</b> {conf_percent:.1f}% {stars}
-💰 <b>Entry Price:</b> {entry_str}
-🎯 <b>Target:</b> {target_str}
-🛑 <b>Stop Loss:</b> {stop_str}
+        return self.send_message_sync(self._format_signal_alert(signal_data))
 
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}
-
-<i>This signal met the ≥75% confidence threshold</i>"""
+    def send_signal_alerts_sync(self, signals: List[Dict[str, Any]]) -> bool:
+        """
+        Send alerts for several signals as combined messages.
 
-        return self.send_message_sync(message)
+        A single signal gets the regular alert; larger bursts are sent as
+        one message per ALERT_BATCH_SIZE signals, so they use one send slot
+        instead of one per signal.
 
-    async def send_daily_summary(self, signals: List[Dict[str, Any]]) -> bool:
-        """Send daily signal summary."""
+        Returns:
+            True if every message was sent successfully
+        """
         if not signals:
-            message = f"""📊 <b>ALPHA MACHINE DAILY SUMMARY</b>
-
-No signals generated today.
-
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}"""
-            return await self.send_message(message)
-
-        # Group signals by type
-        buy_signals = [s for s in signals if s.get("signal_type") == "BUY"]
-        sell_signals = [s for s in signals if s.get("signal_type") == "SELL"]
-        hold_signals = [s for s in signals if s.get("signal_type") == "HOLD"]
+            return True
+        if len(signals) == 1:
+            return self.send_signal_alert_sync(signals[0])
+
+        sent = True
+        for start in range(0, len(signals), self.ALERT_BATCH_SIZE):
+            batch = signals[start:start + self.ALERT_BATCH_SIZE]
+            sent = self.send_message_sync(self._format_signal_alerts(batch)) and sent
+        return sent
+
+    def _format_signal_alerts(self, signals: List[Dict[str, Any]]) -> str:
+        """Format several signals as one combined alert message."""
+        lines = [f"🚨 <b>ALPHA MACHINE SIGNAL ALERTS</b> 🚨 ({len(signals)} signals)\n"]
+
+        for signal_data in signals:
+            ticker = signal_data.get("ticker", "UNKNOWN")
+            signal_type = signal_data.get("signal_type", "HOLD")
+            confidence = signal_data.get("confidence", 0)
+            entry_price = signal_data.get("entry_price")
+            target_price = signal_data.get("target_price")
+            stop_loss = signal_data.get("stop_loss")
 
-        # Build signal list
-        signal_lines = []
-        for signal in sorted(signals, key=lambda x: x.get("confidence", 0), reverse=True):
-            ticker = signal.get("ticker", "???")
-            signal_type = signal.get("signal_type", "HOLD")
-            confidence = signal.get("confidence", 0)
             conf_percent = confidence * 100 if confidence <= 1 else confidence * 20
             emoji = self.SIGNAL_EMOJIS.get(signal_type, "⚪")
-            signal_lines.append(f"  {emoji} <b>{ticker}</b>: {signal_type} ({conf_percent:.0f}%)")
-
-        signal_list = "\n".join(signal_lines[:15])
-
-        message = f"""📊 <b>ALPHA MACHINE DAILY SUMMARY</b>
-
-📈 <b>Today's Signals:</b>
-{signal_list}
-
-📊 <b>Summary:</b>
-  🟢 BUY: {len(buy_signals)}
-  🔴 SELL: {len(sell_signals)}
-  🟡 HOLD: {len(hold_signals)}
+            stars = self._confidence_stars(confidence)
 
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}"""
+            lines.append(
+                f"{emoji} <b>{ticker}</b> - <b>{signal_type}</b> {conf_percent:.1f}% {stars}"
+            )
+            lines.append(
+                f"   💰 {_fmt_price(entry_price)}  🎯 {_fmt_price(target_price)}  "
+                f"🛑 {_fmt_price(stop_loss)}\n"
+            )
 
-        return await self.send_message(message)
+        lines.append(f"⏰ {_timestamp()}")
+        lines.append("\n<i>These signals met the ≥75% confidence threshold</i>")
+        return "\n".join(lines)
 
-    def send_daily_summary_sync(self, signals: List[Dict[str, Any]]) -> bool:
-        """Synchronous wrapper for send_daily_summary."""
+    def _format_daily_summary(self, signals: List[Dict[str, Any]]) -> str:
+        """Format the daily summary message."""
         if not signals:
-            message = f"""📊 <b>ALPHA MACHINE DAILY SUMMARY</b>
-
-No signals generated today.
-
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}"""
-            return self.send_message_sync(message)
+            return self._EMPTY_SUMMARY_TPL.format_map({"timestamp": _timestamp()})
 
-        buy_signals = [s for s in signals if s.get("signal_type") == "BUY"]
-        sell_signals = [s for s in signals if s.get("signal_type") == "SELL"]
-        hold_signals = [s for s in signals if s.get("signal_type") == "HOLD"]
+        # Count signals by type
+        counts = {"BUY": 0, "SELL": 0, "HOLD": 0}
+        for signal in signals:
+            signal_type = signal.get("signal_type")
+            if signal_type in counts:
+                counts[signal_type] += 1
 
+        # Only the top 15 are listed, so only those are formatted
         signal_lines = []
-        for signal in sorted(signals, key=lambda x: x.get("confidence", 0), reverse=True):
+        top_signals = heapq.nlargest(15, signals, key=lambda x: x.get("confidence", 0))
+        for signal in top_signals:
             ticker = signal.get("ticker", "???")
             signal_type = signal.get("signal_type", "HOLD")
             confidence = signal.get("confidence", 0)
@@ -276,21 +476,21 @@ No signals generated today.
             emoji = self.SIGNAL_EMOJIS.get(signal_type, "⚪")
             signal_lines.append(f"  {emoji} <b>{ticker}</b>: {signal_type} ({conf_percent:.0f}%)")
 
-        signal_list = "\n".join(signal_lines[:15])
-
-        message = f"""📊 <b>ALPHA MACHINE DAILY SUMMARY</b>
-
-📈 <b>Today's Signals:</b>
-{signal_list}
-
-📊 <b>Summary:</b>
-  🟢 BUY: {len(buy_signals)}
-  🔴 SELL: {len(sell_signals)}
-  🟡 HOLD: {len(hold_signals)}
+        return self._SUMMARY_TPL.format_map({
+            "signal_list": "\n".join(signal_lines),
+            "buy": counts["BUY"],
+            "sell": counts["SELL"],
+            "hold": counts["HOLD"],
+            "timestamp": _timestamp(),
+        })
 
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}"""
+    async def send_daily_summary(self, signals: List[Dict[str, Any]]) -> bool:
+        """Send daily signal summary."""
+        return await self.send_message(self._format_daily_summary(signals))
 
-        return self.send_message_sync(message)
+    def send_daily_summary_sync(self, signals: List[Dict[str, Any]]) -> bool:
+        """Synchronous wrapper for send_daily_summary."""
+        return self.send_message_sync(self._format_daily_summary(signals))
 
     async def process_webhook(self, update_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -324,23 +524,7 @@ No signals generated today.
 
     async def _handle_start(self, chat_id: int) -> str:
         """Handle /start command."""
-        message = f"""🤖 <b>Welcome to Alpha Machine Bot!</b>
-
-Your AI-powered stock trading assistant.
-
-<b>Your Chat ID:</b> <code>{chat_id}</code>
-(Add this to TELEGRAM_CHAT_ID in your environment)
-
-<b>Available Commands:</b>
-/signals - View recent trading signals
-/watchlist - View monitored stocks
-/status - Check system status
-/learning - Learning system status
-/weights - View agent weights
-/help - Show this help message
-
-<i>You'll receive real-time alerts for signals with ≥75% confidence.</i>"""
-
+        message = self._START_TPL.format_map({"chat_id": chat_id})
         await self.send_message(message, chat_id=str(chat_id))
         return "start_handled"
 
@@ -368,7 +552,7 @@ Your AI-powered stock trading assistant.
                 conf_percent = signal.confidence * 20
                 lines.append(
                     f"  {emoji} <b>{signal.ticker}</b>: {signal.signal_type} "
-                    f"({conf_percent:.0f}%) @ ${float(signal.entry_price):.2f}"
+                    f"({conf_percent:.0f}%) @ {_fmt_price(signal.entry_price)}"
                 )
 
             await self.send_message("\n".join(lines), chat_id=str(chat_id))
@@ -386,11 +570,21 @@ Your AI-powered stock trading assistant.
         """Handle /watchlist command - show monitored stocks."""
         from app.core.database import SessionLocal
         from app.models.watchlist import Watchlist
+        from sqlalchemy import select
 
         try:
+            # Only ticker and tier are shown, so skip loading full ORM objects
+            stmt = (
+                select(Watchlist.ticker, Watchlist.tier)
+                .where(Watchlist.active.is_(True))
+                .order_by(Watchlist.tier, Watchlist.ticker)
+            )
+
             db = SessionLocal()
-            stocks = db.query(Watchlist).filter(Watchlist.active == True).all()
-            db.close()
+            try:
+                stocks = db.execute(stmt).all()
+            finally:
+                db.close()
 
             if not stocks:
                 await self.send_message(
@@ -400,10 +594,10 @@ Your AI-powered stock trading assistant.
                 return "watchlist_empty"
 
             lines = ["📋 <b>Watchlist:</b>\n"]
-            for stock in stocks:
-                tier_emoji = "⭐" if stock.tier and stock.tier <= 2 else ""
-                lines.append(f"  • <b>{stock.ticker}</b> {tier_emoji}")
-
+            lines.extend(
+                f"  • <b>{ticker}</b> {'⭐' if tier and tier <= 2 else ''}"
+                for ticker, tier in stocks
+            )
             lines.append(f"\n<i>Total: {len(stocks)} stocks</i>")
 
             await self.send_message("\n".join(lines), chat_id=str(chat_id))
@@ -422,40 +616,35 @@ Your AI-powered stock trading assistant.
         from app.core.database import SessionLocal
         from app.models.signal import Signal
         from app.models.watchlist import Watchlist
+        from sqlalchemy import func, select
 
         try:
-            db = SessionLocal()
-
             today = datetime.utcnow().date()
             today_start = datetime.combine(today, datetime.min.time())
 
-            total_signals = db.query(Signal).count()
-            today_signals = (
-                db.query(Signal)
-                .filter(Signal.timestamp >= today_start)
-                .count()
-            )
-            active_stocks = (
-                db.query(Watchlist)
-                .filter(Watchlist.active == True)
-                .count()
+            # All three counts in one round trip
+            stmt = select(
+                select(func.count(Signal.id)).scalar_subquery().label("total_signals"),
+                select(func.count(Signal.id))
+                .where(Signal.timestamp >= today_start)
+                .scalar_subquery()
+                .label("today_signals"),
+                select(func.count(Watchlist.id))
+                .where(Watchlist.active.is_(True))
+                .scalar_subquery()
+                .label("active_stocks"),
             )
-            db.close()
-
-            message = f"""🖥️ <b>Alpha Machine Status</b>
-
-✅ <b>System:</b> Online
-📊 <b>Total Signals:</b> {total_signals}
-📈 <b>Today's Signals:</b> {today_signals}
-📋 <b>Active Stocks:</b> {active_stocks}
 
-🤖 <b>AI Agents:</b>
-  • ContrarianAgent (GPT-4o) ✅
-  • GrowthAgent (Claude) ✅
-  • MultiModalAgent (Gemini) ✅
-  • PredictorAgent (Local) ✅
+            db = SessionLocal()
+            try:
+                counts = db.execute(stmt).one()
+            finally:
+                db.close()
 
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}"""
+            message = self._STATUS_TPL.format_map({
+                **counts._mapping,
+                "timestamp": _timestamp(),
+            })
 
             await self.send_message(message, chat_id=str(chat_id))
             return "status_sent"
@@ -470,36 +659,7 @@ Your AI-powered stock trading assistant.
 
     async def _handle_help(self, chat_id: int) -> str:
         """Handle /help command."""
-        message = """🤖 <b>Alpha Machine Bot - Help</b>
-
-<b>Commands:</b>
-/signals - View recent trading signals (last 24h)
-/watchlist - View monitored stocks
-/status - Check system status
-/learning - Learning system status &amp; biases
-/weights - View current agent weights
-/help - Show this help message
-
-<b>Automatic Notifications:</b>
-• Real-time alerts for signals with ≥75% confidence
-• Daily summary at 8:30 AM EST
-• Bias detection alerts
-• Weight change notifications
-• Market regime shift alerts
-
-<b>Signal Types:</b>
-🟢 BUY - Recommended to buy
-🔴 SELL - Recommended to sell
-🟡 HOLD - Maintain current position
-
-<b>Confidence Levels:</b>
-⭐⭐⭐⭐⭐ 80-100% - Very high confidence
-⭐⭐⭐⭐ 60-80% - High confidence
-⭐⭐⭐ 40-60% - Moderate confidence
-
-<i>For support, visit the Alpha Machine dashboard.</i>"""
-
-        await self.send_message(message, chat_id=str(chat_id))
+        await self.send_message(self._HELP_TPL, chat_id=str(chat_id))
         return "help_sent"
 
     def should_alert(self, signal_data: Dict[str, Any]) -> bool:
@@ -541,7 +701,7 @@ Your AI-powered stock trading assistant.
             lines.append(f"   Severity: {severity:.0f}%")
             lines.append(f"   {description}\n")
 
-        lines.append(f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}")
+        lines.append(f"⏰ {_timestamp()}")
         lines.append("\n<i>Review at /learning dashboard</i>")
 
         return self.send_message_sync("\n".join(lines))
@@ -566,7 +726,7 @@ Your AI-powered stock trading assistant.
                 f"  • <b>{agent}</b>: {old_weight:.2f} → {new_weight:.2f} ({direction}{abs(diff):.2f})"
             )
 
-        lines.append(f"\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}")
+        lines.append(f"\n⏰ {_timestamp()}")
 
         return self.send_message_sync("\n".join(lines))
 
@@ -596,7 +756,7 @@ Your AI-powered stock trading assistant.
 
 <i>Learning system will adjust agent weights accordingly.</i>
 
-⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}"""
+⏰ {_timestamp()}"""
 
         return self.send_message_sync(message)
 
@@ -623,7 +783,7 @@ Your AI-powered stock trading assistant.
         lines.append(f"  • Biases detected: {biases_count}")
         lines.append(f"  • System confidence: {confidence * 100:.0f}%")
 
-        lines.append(f"\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}")
+        lines.append(f"\n⏰ {_timestamp()}")
 
         return self.send_message_sync("\n".join(lines))
 
@@ -660,7 +820,7 @@ Your AI-powered stock trading assistant.
                 lines.append("\n✅ No biases detected")
 
             lines.append(f"\n📊 <b>Confidence:</b> {bias_report.overall_confidence * 100:.0f}%")
-            lines.append(f"\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}")
+            lines.append(f"\n⏰ {_timestamp()}")
 
             await self.send_message("\n".join(lines), chat_id=str(chat_id))
             return "learning_sent"
@@ -733,7 +893,7 @@ Your AI-powered stock trading assistant.
                 lines.append(f"   WR 7d/30d: {win_7d} / {win_30d}")
                 lines.append(f"   Trades (7d): {trades}\n")
 
-            lines.append(f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M EST')}")
+            lines.append(f"⏰ {_timestamp()}")
 
             await self.send_message("\n".join(lines), chat_id=str(chat_id))
             return "weights_sent"
@@ -757,3 +917,9 @@ def get_telegram_service() -> TelegramBotService:
     if _telegram_service is None:
         _telegram_service = TelegramBotService()
     return _telegram_service
+
+
+async def close_telegram_service() -> None:
+    """Close the service's HTTP clients, if the service was created."""
+    if _telegram_service is not None:
+        await _telegram_service.aclose()
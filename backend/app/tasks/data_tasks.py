@@ -16,7 +16,7 @@ from app.models.watchlist import Watchlist
 from app.models.market_data import MarketData
 from app.models.sentiment_data import SentimentData
 from app.services.market_data import market_data_service
-from app.services.sentiment_data import sentiment_service
+from app.services.sentiment_data import get_sentiment_service
 from app.tasks.celery_app import is_market_hours
 
 logger = logging.getLogger(__name__)
@@ -53,7 +53,7 @@ def fetch_market_data_task(self) -> Dict[str, Any]:
 
     try:
         # Get all active tickers from watchlist
-        watchlist = db.query(Watchlist).filter(Watchlist.is_active == True).all()
+        watchlist = db.query(Watchlist).filter(Watchlist.active == True).all()
 
         if not watchlist:
             results["status"] = "no_tickers"
@@ -148,17 +148,28 @@ def fetch_sentiment_task(self) -> Dict[str, Any]:
 
     try:
         # Get all active tickers from watchlist
-        watchlist = db.query(Watchlist).filter(Watchlist.is_active == True).all()
+        watchlist = db.query(Watchlist).filter(Watchlist.active == True).all()
 
         if not watchlist:
             results["status"] = "no_tickers"
             return results
 
-        for item in watchlist:
-            ticker = item.ticker
+        sentiment_service = get_sentiment_service()
+        tickers = [item.ticker for item in watchlist]
+
+        # One batched cache read and batched NewsAPI queries for the watchlist
+        try:
+            bulk_sentiment = sentiment_service.aggregate_sentiment_bulk(tickers)
+        except Exception as e:
+            logger.warning(f"Bulk sentiment fetch failed, fetching individually: {e}")
+            bulk_sentiment = {}
+
+        for ticker in tickers:
             try:
                 # Fetch aggregated sentiment
-                sentiment = sentiment_service.aggregate_sentiment(ticker)
+                sentiment = bulk_sentiment.get(ticker)
+                if sentiment is None:
+                    sentiment = sentiment_service.aggregate_sentiment(ticker)
 
                 if sentiment:
                     # Store in database
@@ -166,10 +177,8 @@ def fetch_sentiment_task(self) -> Dict[str, Any]:
                         ticker=ticker,
                         source="combined",
                         sentiment_score=sentiment.get("combined_sentiment", 0),
-                        bullish_count=sentiment.get("bullish_mentions", 0),
-                        bearish_count=sentiment.get("bearish_mentions", 0),
-                        total_mentions=sentiment.get("total_mentions", 0),
-                        confidence=sentiment.get("confidence", 0),
+                        mention_count=sentiment.get("total_mentions", 0),
+                        raw_data=sentiment,
                     )
                     db.add(sentiment_data)
 
@@ -250,7 +259,7 @@ def fetch_single_ticker_data(ticker: str) -> Dict[str, Any]:
 
         # Fetch sentiment
         try:
-            sentiment = sentiment_service.aggregate_sentiment(ticker)
+            sentiment = get_sentiment_service().aggregate_sentiment(ticker)
             result["sentiment_data"] = sentiment
         except Exception as e:
             logger.warning(f"Sentiment fetch failed for {ticker}: {e}")
@@ -23,7 +23,7 @@ from app.agents import (
     PredictorAgent,
 )
 from app.services.market_data import market_data_service
-from app.services.sentiment_data import sentiment_service
+from app.services.sentiment_data import get_sentiment_service
 from app.services.signal_service import get_signal_service
 from app.core.config import settings
 
@@ -128,6 +128,10 @@ def generate_daily_signals_task(
             f"with {len(generator.agents)} agents"
         )
 
+        # Consensus signals are saved together after all tickers are analyzed
+        consensus_list = []
+        entry_prices = []
+
         for item in watchlist:
             ticker = item.ticker
             try:
@@ -151,7 +155,7 @@ def generate_daily_signals_task(
                 # Fetch sentiment (optional)
                 sentiment_data = None
                 try:
-                    sentiment_data = sentiment_service.aggregate_sentiment(ticker)
+                    sentiment_data = get_sentiment_service().aggregate_sentiment(ticker)
                 except Exception:
                     pass
 
@@ -162,36 +166,8 @@ def generate_daily_signals_task(
                     sentiment_data=sentiment_data,
                 )
 
-                # Save to database
-                saved_signal = signal_service.save_signal(
-                    consensus=consensus,
-                    entry_price=entry_price,
-                    portfolio_value=portfolio_value,
-                )
-
-                # Update counts
-                signal_type = consensus.signal.value
-                if "BUY" in signal_type:
-                    results["buy_signals"] += 1
-                elif "SELL" in signal_type:
-                    results["sell_signals"] += 1
-                else:
-                    results["hold_signals"] += 1
-
-                results["successful"] += 1
-                results["signals"].append({
-                    "ticker": ticker,
-                    "signal_id": saved_signal.id,
-                    "signal_type": saved_signal.signal_type,
-                    "confidence": saved_signal.confidence,
-                    "entry_price": float(saved_signal.entry_price),
-                    "status": "success",
-                })
-
-                logger.info(
-                    f"Generated signal for {ticker}: {saved_signal.signal_type} "
-                    f"(confidence: {saved_signal.confidence})"
-                )
+                consensus_list.append(consensus)
+                entry_prices.append(entry_price)
 
             except Exception as e:
                 logger.error(f"Signal generation failed for {ticker}: {e}")
@@ -202,6 +178,63 @@ def generate_daily_signals_task(
                     "error": str(e),
                 })
 
+        # Save to database in one transaction
+        try:
+            saved_signals = signal_service.save_signals_bulk(
+                consensus_list, entry_prices, portfolio_value=portfolio_value
+            )
+        except Exception as e:
+            # One bad row fails the whole batch; save one by one so it only
+            # fails its own ticker
+            logger.warning(f"Bulk signal save failed, saving individually: {e}")
+            db.rollback()
+            saved_signals = []
+            for consensus, entry_price in zip(consensus_list, entry_prices):
+                try:
+                    saved_signals.append(signal_service.save_signal(
+                        consensus=consensus,
+                        entry_price=entry_price,
+                        portfolio_value=portfolio_value,
+                    ))
+                except Exception as e:
+                    logger.error(f"Signal save failed for {consensus.ticker}: {e}")
+                    db.rollback()
+                    saved_signals.append(None)
+                    results["failed"] += 1
+                    results["signals"].append({
+                        "ticker": consensus.ticker,
+                        "status": "error",
+                        "error": str(e),
+                    })
+
+        for consensus, saved_signal in zip(consensus_list, saved_signals):
+            if saved_signal is None:
+                continue
+
+            # Update counts
+            signal_type = consensus.signal.value
+            if "BUY" in signal_type:
+                results["buy_signals"] += 1
+            elif "SELL" in signal_type:
+                results["sell_signals"] += 1
+            else:
+                results["hold_signals"] += 1
+
+            results["successful"] += 1
+            results["signals"].append({
+                "ticker": saved_signal.ticker,
+                "signal_id": saved_signal.id,
+                "signal_type": saved_signal.signal_type,
+                "confidence": saved_signal.confidence,
+                "entry_price": float(saved_signal.entry_price),
+                "status": "success",
+            })
+
+            logger.info(
+                f"Generated signal for {saved_signal.ticker}: {saved_signal.signal_type} "
+                f"(confidence: {saved_signal.confidence})"
+            )
+
         results["status"] = "completed"
         results["total_processed"] = len(watchlist)
 
@@ -268,7 +301,7 @@ def generate_signal_for_ticker(
         # Fetch sentiment
         sentiment_data = None
         try:
-            sentiment_data = sentiment_service.aggregate_sentiment(ticker)
+            sentiment_data = get_sentiment_service().aggregate_sentiment(ticker)
         except Exception:
             pass
 
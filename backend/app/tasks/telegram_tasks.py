@@ -4,6 +4,7 @@ Telegram Tasks - Scheduled notifications for Alpha Machine
 Tasks:
 - send_daily_signal_summary_task: Daily signal summary at 8:30 AM EST
 - send_signal_alert_task: Real-time alert for high-confidence signals
+- send_signal_alerts_task: Combined alert for a batch of signals
 - check_and_alert_high_confidence: Check for high-confidence signals and alert
 """
 
@@ -145,6 +146,45 @@ def send_signal_alert_task(signal_data: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+@shared_task(name="app.tasks.telegram_tasks.send_signal_alerts_task")
+def send_signal_alerts_task(signals_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Send one combined Telegram alert for a batch of signals.
+
+    Called after signals are saved in bulk, so a burst of high-confidence
+    signals produces one message instead of one task and message each.
+
+    Args:
+        signals_data: Signal dictionaries as for send_signal_alert_task
+
+    Returns:
+        Dict with task results
+    """
+    if not settings.TELEGRAM_BOT_TOKEN or not settings.TELEGRAM_CHAT_ID:
+        return {"status": "skipped", "reason": "telegram_not_configured"}
+
+    result = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "signal_count": len(signals_data),
+        "status": "pending",
+    }
+
+    try:
+        telegram_service = get_telegram_service()
+        success = telegram_service.send_signal_alerts_sync(signals_data)
+        result["status"] = "sent" if success else "failed"
+
+        if success:
+            logger.info(f"Signal alerts sent for {len(signals_data)} signals")
+
+    except Exception as e:
+        logger.error(f"Failed to send signal alerts: {e}")
+        result["status"] = "error"
+        result["error"] = str(e)
+
+    return result
+
+
 @shared_task(
     bind=True,
     name="app.tasks.telegram_tasks.check_and_alert_high_confidence",
@@ -192,6 +232,7 @@ def check_and_alert_high_confidence(
 
         telegram_service = get_telegram_service()
 
+        alerts = []
         for signal in signals:
             signal_data = {
                 "ticker": signal.ticker,
@@ -203,13 +244,12 @@ def check_and_alert_high_confidence(
             }
 
             if telegram_service.should_alert(signal_data):
-                success = telegram_service.send_signal_alert_sync(signal_data)
-                if success:
-                    result["alerts_sent"] += 1
-                    logger.info(
-                        f"High-confidence alert sent: {signal.ticker} "
-                        f"{signal.signal_type} (conf: {signal.confidence})"
-                    )
+                alerts.append(signal_data)
+
+        # All alerts go out together rather than one message per signal
+        if alerts and telegram_service.send_signal_alerts_sync(alerts):
+            result["alerts_sent"] = len(alerts)
+            logger.info(f"High-confidence alerts sent for {len(alerts)} signals")
 
         result["status"] = "completed"
         result["signals_checked"] = len(signals)
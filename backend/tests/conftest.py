@@ -156,6 +156,8 @@ def mock_reddit_submission():
     """Create mock Reddit submission"""
     submission = Mock()
     submission.title = "NVDA to the moon! Strong buy signal"
+    submission.selftext = ""
+    submission.subreddit.display_name = "wallstreetbets"
     submission.score = 150
     submission.upvote_ratio = 0.85
     submission.num_comments = 45
@@ -171,6 +173,8 @@ def mock_reddit_submissions():
     # Positive post
     pos = Mock()
     pos.title = "NVDA earnings beat, bullish outlook"
+    pos.selftext = ""
+    pos.subreddit.display_name = "wallstreetbets"
     pos.score = 200
     pos.upvote_ratio = 0.90
     submissions.append(pos)
@@ -178,6 +182,8 @@ def mock_reddit_submissions():
     # Negative post
     neg = Mock()
     neg.title = "NVDA overvalued, bearish puts incoming"
+    neg.selftext = ""
+    neg.subreddit.display_name = "stocks"
     neg.score = 75
     neg.upvote_ratio = 0.65
     submissions.append(neg)
@@ -185,6 +191,8 @@ def mock_reddit_submissions():
     # Neutral post
     neutral = Mock()
     neutral.title = "NVDA analysis: what do you think?"
+    neutral.selftext = ""
+    neutral.subreddit.display_name = "investing"
     neutral.score = 50
     neutral.upvote_ratio = 0.70
     submissions.append(neutral)
@@ -110,6 +110,42 @@ class TestSignalRanker:
         assert result[0]["expected_return"] == 0.10  # Default 10%
         assert result[0]["risk_factor"] == 1.5  # Default medium risk
 
+    def test_rank_signals_matches_scalar_formulas(self):
+        """Vectorized ranking matches the per-signal helpers."""
+        ranker = SignalRanker()
+        signals = [
+            self.create_mock_signal(confidence=3, target_price=140.0, stop_loss=70.0),
+            self.create_mock_signal(confidence=5, target_price=95.0, stop_loss=97.0),
+            self.create_mock_signal(confidence=1, entry_price=50.0, target_price=80.0),
+        ]
+        signals[1].stop_loss = None
+        signals[2].target_price = Decimal("0")
+
+        result = ranker.rank_signals(signals, Mock())
+
+        for item in result:
+            signal = item["signal"]
+            expected_return = ranker._expected_return(signal.entry_price, signal.target_price)
+            risk_factor = ranker._risk_factor(signal.entry_price, signal.stop_loss)
+            assert item["expected_return"] == round(expected_return, 4)
+            assert item["risk_factor"] == round(risk_factor, 2)
+            assert item["score"] == pytest.approx(
+                signal.confidence / 5.0 * expected_return / risk_factor, abs=1e-6
+            )
+        assert [item["rank"] for item in result] == [1, 2, 3]
+        assert [item["score"] for item in result] == sorted(
+            (item["score"] for item in result), reverse=True
+        )
+
+    def test_rank_signals_ties_keep_input_order(self):
+        """Equal scores keep their original relative order."""
+        ranker = SignalRanker()
+        signals = [self.create_mock_signal(ticker=t) for t in ("AAA", "BBB", "CCC")]
+
+        result = ranker.rank_signals(signals, Mock())
+
+        assert [item["signal"].ticker for item in result] == ["AAA", "BBB", "CCC"]
+
     def test_get_top_signals(self):
         """get_top_signals returns limited results."""
         ranker = SignalRanker()
@@ -123,6 +159,63 @@ class TestSignalRanker:
         assert result[0]["rank"] == 1
 
 
+    def test_rank_signals_top_n_matches_full_ranking(self):
+        """top_n returns the same head as a full ranking, ties included."""
+        ranker = SignalRanker()
+        signals = [
+            self.create_mock_signal(ticker=f"T{i}", confidence=c)
+            for i, c in enumerate([2, 5, 3, 5, 1, 3, 4])
+        ]
+
+        full = ranker.rank_signals(signals, Mock())
+        top = ranker.rank_signals(signals, Mock(), top_n=3)
+
+        assert top == full[:3]
+        assert [item["signal"].ticker for item in top] == ["T1", "T3", "T6"]
+
+    def test_composite_score_matches_rank_signals(self):
+        """Persisted composite_score equals the score rank_signals assigns."""
+        ranker = SignalRanker()
+        signal = self.create_mock_signal(confidence=4, target_price=130.0, stop_loss=85.0)
+
+        result = ranker.rank_signals([signal], Mock())
+        score = ranker.composite_score(4, 100.0, 130.0, 85.0)
+
+        assert score == result[0]["score"]
+        assert isinstance(score, float)
+        assert ranker.composite_score(4, None, None, None) == round(0.8 * 0.10 / 1.5, 6)
+
+        cases = [(3, 100.0, 90.0, 105.0), (5, 50.0, 0, 48.0), (2, 100.0, 110.0, 0)]
+        for confidence, entry, target, stop in cases:
+            mock = self.create_mock_signal(
+                confidence=confidence, entry_price=entry, target_price=target, stop_loss=stop
+            )
+            ranked = ranker.rank_signals([mock], Mock())
+            assert ranker.composite_score(confidence, entry, target, stop) == ranked[0]["score"]
+
+    def test_get_top_signals_from_db(self):
+        """Without a list, get_top_signals reads stored scores from the database."""
+        ranker = SignalRanker()
+        stored = self.create_mock_signal(confidence=5)
+        stored.composite_score = 0.25
+        db = Mock()
+        query = db.query.return_value.filter.return_value.order_by.return_value
+        query.limit.return_value.all.return_value = [stored]
+
+        result = ranker.get_top_signals(None, db, top_n=2)
+
+        query.limit.assert_called_once_with(2)
+        assert result == [
+            {
+                "signal": stored,
+                "score": 0.25,
+                "expected_return": 0.25,
+                "risk_factor": 1.0,
+                "confidence": 5,
+                "rank": 1,
+            }
+        ]
+
 # ============================================================================
 # Portfolio Allocator Tests
 # ============================================================================
@@ -96,14 +96,14 @@ class TestDataTasks:
         assert "fetch_sentiment" in fetch_sentiment_task.name
 
     @patch("app.tasks.data_tasks.market_data_service")
-    @patch("app.tasks.data_tasks.sentiment_service")
+    @patch("app.tasks.data_tasks.get_sentiment_service")
     def test_fetch_single_ticker_data_success(self, mock_sentiment, mock_market):
         """fetch_single_ticker_data returns data for ticker"""
         from app.tasks.data_tasks import fetch_single_ticker_data
 
         mock_market.get_quote.return_value = {"current_price": 100.0}
         mock_market.get_technical_indicators.return_value = {"rsi": 50}
-        mock_sentiment.aggregate_sentiment.return_value = {"combined_sentiment": 0.5}
+        mock_sentiment.return_value.aggregate_sentiment.return_value = {"combined_sentiment": 0.5}
 
         result = fetch_single_ticker_data("NVDA")
 
@@ -111,6 +111,46 @@ class TestDataTasks:
         assert result["status"] == "success"
         assert result["market_data"] is not None
 
+    @patch("app.tasks.data_tasks.get_sentiment_service")
+    def test_fetch_sentiment_task_uses_bulk(self, mock_sentiment, mock_db_session, mock_watchlist):
+        """fetch_sentiment_task aggregates the whole watchlist in one bulk call"""
+        from app.tasks.data_tasks import fetch_sentiment_task
+
+        mock_db_session.query.return_value.filter.return_value.all.return_value = mock_watchlist
+        service = mock_sentiment.return_value
+        service.aggregate_sentiment_bulk.return_value = {
+            "NVDA": {"combined_sentiment": 0.4, "total_mentions": 12},
+            "AAPL": {"combined_sentiment": -0.1, "total_mentions": 3},
+        }
+
+        result = fetch_sentiment_task()
+
+        service.aggregate_sentiment_bulk.assert_called_once_with(["NVDA", "AAPL"])
+        service.aggregate_sentiment.assert_not_called()
+        assert result["successful"] == 2
+        assert mock_db_session.add.call_count == 2
+        mock_db_session.commit.assert_called_once()
+
+    @patch("app.tasks.data_tasks.get_sentiment_service")
+    def test_fetch_sentiment_task_bulk_failure_falls_back(
+        self, mock_sentiment, mock_db_session, mock_watchlist
+    ):
+        """A failed bulk fetch falls back to per-ticker aggregation"""
+        from app.tasks.data_tasks import fetch_sentiment_task
+
+        mock_db_session.query.return_value.filter.return_value.all.return_value = mock_watchlist
+        service = mock_sentiment.return_value
+        service.aggregate_sentiment_bulk.side_effect = Exception("Redis down")
+        service.aggregate_sentiment.side_effect = [
+            {"combined_sentiment": 0.4}, Exception("Reddit error"),
+        ]
+
+        result = fetch_sentiment_task()
+
+        assert result["status"] == "completed"
+        assert result["successful"] == 1
+        assert result["failed"] == 1
+
     @patch("app.tasks.data_tasks.market_data_service")
     def test_fetch_single_ticker_data_error(self, mock_market):
         """fetch_single_ticker_data handles errors"""
@@ -181,6 +221,48 @@ class TestSignalTasks:
         assert result["status"] == "success"
         assert result["signal"] == "BUY"
 
+    @patch("app.tasks.signal_tasks.get_sentiment_service")
+    @patch("app.tasks.signal_tasks.get_signal_service")
+    @patch("app.tasks.signal_tasks.SessionLocal")
+    @patch("app.tasks.signal_tasks.market_data_service")
+    @patch("app.tasks.signal_tasks.get_signal_generator")
+    def test_generate_daily_signals_bulk_save_fallback(
+        self, mock_gen, mock_market, mock_session, mock_get_service, mock_sentiment
+    ):
+        """A failed bulk save falls back to per-ticker saves"""
+        from app.tasks.signal_tasks import generate_daily_signals_task
+
+        mock_db = mock_session.return_value
+        mock_db.query.return_value.filter.return_value.all.return_value = [
+            Mock(ticker="NVDA"), Mock(ticker="AMD"),
+        ]
+        mock_market.get_quote.return_value = {"current_price": 100.0}
+
+        consensus = {
+            ticker: Mock(ticker=ticker, signal=Mock(value="BUY"))
+            for ticker in ("NVDA", "AMD")
+        }
+        mock_gen.return_value.generate_signal.side_effect = (
+            lambda ticker, **kwargs: consensus[ticker]
+        )
+
+        service = mock_get_service.return_value
+        service.save_signals_bulk.side_effect = Exception("bad row")
+        service.save_signal.side_effect = [
+            Mock(ticker="NVDA", id=1, signal_type="BUY", confidence=4, entry_price=100.0),
+            Exception("numeric overflow"),
+        ]
+
+        result = generate_daily_signals_task()
+
+        assert result["status"] == "completed"
+        assert result["successful"] == 1
+        assert result["failed"] == 1
+        assert result["buy_signals"] == 1
+        statuses = {s["ticker"]: s["status"] for s in result["signals"]}
+        assert statuses == {"NVDA": "success", "AMD": "error"}
+        assert mock_db.rollback.call_count == 2
+
     @patch("app.tasks.signal_tasks.market_data_service")
     def test_generate_signal_for_ticker_no_data(self, mock_market):
         """generate_signal_for_ticker handles missing market data"""
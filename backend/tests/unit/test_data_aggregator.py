@@ -12,7 +12,7 @@ class TestComprehensiveAnalysis:
     """Tests for get_comprehensive_analysis() method"""
 
     @patch("app.services.data_aggregator.market_data_service")
-    @patch("app.services.data_aggregator.sentiment_service")
+    @patch("app.services.data_aggregator.get_sentiment_service")
     def test_comprehensive_analysis_success(
         self,
         mock_sentiment,
@@ -25,7 +25,7 @@ class TestComprehensiveAnalysis:
         mock_market.get_quote.return_value = sample_market_data["quote"]
         mock_market.get_historical_data.return_value = sample_historical_data
         mock_market.get_technical_indicators.return_value = sample_market_data["indicators"]
-        mock_sentiment.aggregate_sentiment.return_value = sample_sentiment_data
+        mock_sentiment.return_value.aggregate_sentiment.return_value = sample_sentiment_data
 
         service = DataAggregatorService()
         result = service.get_comprehensive_analysis("NVDA")
@@ -38,13 +38,13 @@ class TestComprehensiveAnalysis:
         assert "overall_outlook" in result
 
     @patch("app.services.data_aggregator.market_data_service")
-    @patch("app.services.data_aggregator.sentiment_service")
+    @patch("app.services.data_aggregator.get_sentiment_service")
     def test_comprehensive_analysis_partial_data(self, mock_sentiment, mock_market):
         """Test analysis continues when some data missing"""
         mock_market.get_quote.return_value = {"current_price": None}
         mock_market.get_historical_data.return_value = []
         mock_market.get_technical_indicators.return_value = {}
-        mock_sentiment.aggregate_sentiment.return_value = {
+        mock_sentiment.return_value.aggregate_sentiment.return_value = {
             "combined_sentiment": 0,
             "sentiment_label": "neutral",
         }
@@ -7,7 +7,9 @@ Tests for:
 - RegimeDetector market regime classification
 """
 
+import numpy as np
 import pytest
+from sqlalchemy.dialects import postgresql
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, date, timedelta
 from decimal import Decimal
@@ -28,8 +30,10 @@ from app.services.learning_engine import (
     OptimizationResult,
 )
 from app.services.regime_detector import RegimeDetector, RegimeAnalysis
+from app.services.regime_kernels import calculate_returns, sma_last
 from app.models.agent_weights_history import AgentWeightsHistory
 from app.models.learning_log import LearningLog
+from app.models.market_data import MarketData
 from app.models.system_config import SystemConfig
 
 
@@ -527,7 +531,8 @@ class TestRegimeDetector:
     @pytest.fixture
     def regime_detector(self, mock_db):
         """Create RegimeDetector with mock db."""
-        with patch('app.services.regime_detector.MarketDataService'):
+        mock_db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        with patch('app.services.regime_detector.market_data_service'):
             return RegimeDetector(mock_db)
 
     def test_initialization(self, regime_detector):
@@ -538,27 +543,179 @@ class TestRegimeDetector:
 
     def test_calculate_returns(self, regime_detector):
         """Daily returns calculation."""
-        history = [
-            {"close": 100.0},
-            {"close": 102.0},
-            {"close": 101.0},
-            {"close": 103.0},
-        ]
+        closes = np.array([100.0, 102.0, 101.0, 103.0])
 
-        returns = regime_detector._calculate_returns(history)
+        returns = calculate_returns(closes)
 
         assert len(returns) == 3
         assert abs(returns[0] - 0.02) < 0.001  # 100 -> 102 = 2%
 
-    def test_calculate_correlation(self, regime_detector):
-        """Correlation calculation."""
-        returns1 = [0.01, 0.02, -0.01, 0.03, -0.02, 0.01, 0.02, -0.01, 0.01, 0.02]
-        returns2 = [0.01, 0.02, -0.01, 0.03, -0.02, 0.01, 0.02, -0.01, 0.01, 0.02]
+    def test_calculate_returns_zero_close(self, regime_detector):
+        """Non-positive closes yield a zero return instead of dividing by zero."""
+        closes = [0.0, 100.0, 110.0]
+
+        with np.errstate(all="raise"):
+            returns = calculate_returns(closes)
+
+        assert len(returns) == 2
+        assert returns[0] == 0.0
+        assert abs(returns[1] - 0.10) < 0.001
+
+    def test_spy_vs_sma200(self, regime_detector):
+        """SPY distance from its 200-day SMA."""
+        closes = np.array([100.0] * 199 + [90.0])
+
+        spy_vs_sma = regime_detector._get_spy_vs_sma200(closes)
+
+        sma_200 = (199 * 100.0 + 90.0) / 200
+        assert abs(spy_vs_sma - (90.0 - sma_200) / sma_200) < 1e-9
+
+    def test_spy_vs_sma200_insufficient_history(self, regime_detector):
+        """Less than 200 days of history yields no SMA signal."""
+        closes = np.full(50, 100.0)
+
+        assert regime_detector._get_spy_vs_sma200(closes) is None
+
+    def test_ai_sector_correlation_matrix(self, regime_detector):
+        """Mean SPY correlation across the AI basket, skipping flat tickers."""
+        rng = np.random.default_rng(7)
+        spy = 100 * np.cumprod(1 + rng.normal(0, 0.01, 31))
+        closes = {
+            "SPY": spy,
+            "NVDA": spy * 2.0,  # identical returns -> correlation 1
+            "MSFT": np.full(31, 50.0),  # flat -> skipped
+            "GOOGL": spy[:5],  # too short -> skipped
+        }
+
+        corr = regime_detector._get_ai_sector_correlation(closes)
+
+        assert abs(corr - 1.0) < 1e-9
+
+    def test_ai_sector_correlation_flat_spy(self, regime_detector):
+        """Zero-variance SPY returns have no correlation."""
+        rng = np.random.default_rng(7)
+        closes = {
+            "SPY": np.full(31, 400.0),
+            "NVDA": 100 * np.cumprod(1 + rng.normal(0, 0.01, 31)),
+        }
+
+        assert regime_detector._get_ai_sector_correlation(closes) is None
+
+    def test_fetch_closes_single_batch(self, regime_detector):
+        """SPY and AI tickers come from one batch call."""
+        regime_detector.market_data_service.get_batch_closes.return_value = {
+            "SPY": np.array([1.0, 2.0, 3.0]),
+        }
+
+        closes = regime_detector._fetch_closes()
+
+        regime_detector.market_data_service.get_batch_closes.assert_called_once_with(
+            ["SPY", "NVDA", "MSFT", "GOOGL"], days=regime_detector.HISTORY_DAYS
+        )
+        assert closes["SPY"].tolist() == [1.0, 2.0, 3.0]
+
+    def test_detect_current_regime_extreme_vix(self, regime_detector):
+        """Extreme VIX classifies the market as HIGH_VOLATILITY."""
+        regime_detector.market_data_service.get_current_price.return_value = 40.0
+        regime_detector.market_data_service.get_batch_closes.return_value = {}
+
+        analysis = regime_detector.detect_current_regime()
+
+        assert analysis.current_regime.value == "HIGH_VOLATILITY"
+        assert analysis.vix_level == 40.0
+        assert analysis.confidence == 0.95
+        assert analysis.regime_changed is False
+        assert analysis.spy_vs_sma200 is None
+        regime_detector.market_data_service.get_batch_closes.assert_not_called()
+
+    def test_detect_current_regime_bear_market(self, regime_detector):
+        """Calm VIX falls through to the SPY trend check."""
+        regime_detector.market_data_service.get_current_price.return_value = 15.0
+        regime_detector.market_data_service.get_batch_closes.return_value = {
+            "SPY": np.array([100.0] * 199 + [80.0]),
+        }
+
+        analysis = regime_detector.detect_current_regime()
+
+        assert analysis.current_regime.value == "BEAR_MARKET"
+        assert analysis.spy_vs_sma200 < regime_detector.SMA_BEAR_THRESHOLD
+
+    def test_detect_current_regime_logs_shift(self, regime_detector, mock_db):
+        """A change from the previous regime is explained and logged."""
+        previous = LearningLog(
+            date=date.today(), event_type="REGIME_SHIFT", metric_name="NORMAL"
+        )
+        mock_db.query.return_value.filter.return_value.order_by.return_value.all.return_value = [previous]
+        regime_detector.market_data_service.get_current_price.return_value = 28.0
+        regime_detector.market_data_service.get_batch_closes.return_value = {}
+
+        analysis = regime_detector.detect_current_regime()
+
+        assert analysis.regime_changed is True
+        assert analysis.reasoning == "VIX at 28.0 (elevated); Regime shift from NORMAL"
+        stmt = mock_db.execute.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (date, event_type, metric_name)" in sql
+        assert "DO NOTHING" in sql
+        assert stmt.compile().params["reasoning"].endswith(analysis.reasoning)
+
+    def test_vix_from_db_selects_close_only(self, regime_detector, mock_db):
+        """VIX fallback reads just the latest close column."""
+        latest = mock_db.query.return_value.filter.return_value.order_by.return_value.limit
+        latest.return_value.scalar.return_value = Decimal("31.50")
+
+        assert regime_detector._get_vix_from_db() == 31.5
+        mock_db.query.assert_called_with(MarketData.close)
+        latest.assert_called_with(1)
+
+    def test_detect_current_regime_cached(self, regime_detector):
+        """Repeated detection within the TTL reuses the previous result."""
+        regime_detector.market_data_service.get_current_price.return_value = 40.0
+        regime_detector.market_data_service.get_batch_closes.return_value = {}
+
+        first = regime_detector.detect_current_regime()
+        second = regime_detector.detect_current_regime()
+        fresh = regime_detector.detect_current_regime(use_cache=False)
+
+        assert second is first
+        assert fresh is not first
+        assert regime_detector.market_data_service.get_current_price.call_count == 2
+
+    def test_should_freeze_on_repeated_shifts(self, regime_detector, mock_db):
+        """Three regime shifts in a week freeze learning without re-detecting."""
+        shifts = [
+            LearningLog(date=date.today() - timedelta(days=d), event_type="REGIME_SHIFT")
+            for d in (1, 3, 5, 20)
+        ]
+        mock_db.query.return_value.filter.return_value.order_by.return_value.all.return_value = shifts
+
+        with patch.object(regime_detector, "detect_current_regime") as mock_detect:
+            assert regime_detector.should_freeze_learning() is True
+            mock_detect.assert_not_called()
+
+    def test_recent_shifts_shared_across_lookups(self, regime_detector, mock_db):
+        """Previous regime, history and freeze check reuse one shift query."""
+        shifts = [
+            LearningLog(
+                date=date.today() - timedelta(days=d),
+                event_type="REGIME_SHIFT",
+                metric_name="BEAR_MARKET",
+            )
+            for d in (2, 10)
+        ]
+        shifts_query = mock_db.query.return_value.filter.return_value.order_by.return_value
+        shifts_query.all.return_value = shifts
+
+        assert regime_detector._get_previous_regime().value == "BEAR_MARKET"
+        assert len(regime_detector.get_regime_history(days=7)) == 1
+        assert len(regime_detector.get_regime_history(days=30)) == 2
+        shifts_query.all.assert_called_once()
+
+    def test_sma_kernel_uses_trailing_window(self):
+        """SMA kernel averages only the last `window` closes."""
+        closes = np.arange(1.0, 301.0)
 
-        # Perfect correlation
-        corr = regime_detector._calculate_correlation(returns1, returns2)
-        assert corr is not None
-        assert abs(corr - 1.0) < 0.001
+        assert sma_last(closes, 200) == closes[-200:].mean()
 
 
 # ============================================================================
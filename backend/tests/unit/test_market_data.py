@@ -3,6 +3,8 @@ Unit Tests for Market Data Service
 Tests all market data methods with mocked API responses
 """
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import responses
@@ -13,7 +15,7 @@ class TestGetCurrentPrice:
     """Tests for get_current_price() method"""
 
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_polygon_success(self, mock_get, mock_settings, mock_polygon_success_response):
         """Test successful price fetch from Polygon.io"""
         mock_settings.POLYGON_API_KEY = "test_key"
@@ -27,7 +29,7 @@ class TestGetCurrentPrice:
         mock_get.assert_called_once()
 
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_polygon_fails_finnhub_succeeds(
         self, mock_get, mock_settings, mock_finnhub_success_response
     ):
@@ -48,7 +50,7 @@ class TestGetCurrentPrice:
         assert mock_get.call_count == 2
 
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_all_sources_fail(self, mock_get, mock_settings):
         """Test graceful failure when all sources fail"""
         mock_settings.POLYGON_API_KEY = "test_key"
@@ -62,7 +64,7 @@ class TestGetCurrentPrice:
         assert price is None
 
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_no_api_keys_configured(self, mock_get, mock_settings):
         """Test behavior when no API keys are configured"""
         mock_settings.POLYGON_API_KEY = None
@@ -75,7 +77,7 @@ class TestGetCurrentPrice:
         mock_get.assert_not_called()
 
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_api_timeout(self, mock_get, mock_settings):
         """Test handling of API timeout"""
         import requests
@@ -91,7 +93,7 @@ class TestGetCurrentPrice:
         assert price is None
 
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_malformed_response(self, mock_get, mock_settings):
         """Test handling of malformed API response"""
         mock_settings.POLYGON_API_KEY = "test_key"
@@ -112,7 +114,7 @@ class TestGetHistoricalData:
     """Tests for get_historical_data() method"""
 
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_alphavantage_success(self, mock_get, mock_settings, mock_alphavantage_daily_response):
         """Test successful historical data from Alpha Vantage"""
         mock_settings.ALPHA_VANTAGE_API_KEY = "test_key"
@@ -128,7 +130,7 @@ class TestGetHistoricalData:
         assert data[0]["source"] == "alphavantage"
 
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_alphavantage_rate_limit(
         self, mock_get, mock_settings, mock_alphavantage_rate_limit_response
     ):
@@ -146,7 +148,7 @@ class TestGetHistoricalData:
         assert data == []
 
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_polygon_fallback(self, mock_get, mock_settings, mock_polygon_historical_response):
         """Test fallback to Polygon when Alpha Vantage fails"""
         mock_settings.ALPHA_VANTAGE_API_KEY = "test_key"
@@ -176,11 +178,54 @@ class TestGetHistoricalData:
         assert data == []
 
 
+    @patch.object(MarketDataService, "get_historical_data")
+    def test_batch_historical_dedupes_tickers(self, mock_historical):
+        """Test batch fetch requests each unique ticker once"""
+        mock_historical.return_value = [{"close": 100.0}]
+
+        service = MarketDataService()
+        data = service.get_batch_historical(["SPY", "NVDA", "SPY"], days=60)
+
+        assert list(data.keys()) == ["SPY", "NVDA"]
+        assert mock_historical.call_count == 2
+        mock_historical.assert_any_call("SPY", 60)
+
+    @patch.object(MarketDataService, "get_historical_data")
+    def test_batch_historical_fetches_concurrently(self, mock_historical):
+        """Test batch fetch overlaps per-ticker requests and keeps order"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(ticker, days):
+            barrier.wait()  # Only passes if all three run at once
+            return [{"close": float(len(ticker))}]
+
+        mock_historical.side_effect = fetch
+
+        service = MarketDataService()
+        data = service.get_batch_historical(["NVDA", "MSFT", "GOOGL"], days=30)
+
+        assert list(data.keys()) == ["NVDA", "MSFT", "GOOGL"]
+        assert data["GOOGL"] == [{"close": 5.0}]
+
+    @patch.object(MarketDataService, "get_historical_data")
+    def test_historical_closes_oldest_first(self, mock_historical):
+        """Test close arrays are reversed to ascending date order"""
+        mock_historical.return_value = [
+            {"date": "2024-12-20", "close": 875.50},
+            {"date": "2024-12-19", "close": 870.25},
+        ]
+
+        service = MarketDataService()
+        closes = service.get_historical_closes("NVDA", days=2)
+
+        assert closes.dtype.name == "float64"
+        assert closes.tolist() == [870.25, 875.50]
+
 class TestGetTechnicalIndicators:
     """Tests for get_technical_indicators() method"""
 
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_rsi_from_alphavantage(self, mock_get, mock_settings, mock_alphavantage_rsi_response):
         """Test RSI fetch from Alpha Vantage"""
         mock_settings.ALPHA_VANTAGE_API_KEY = "test_key"
@@ -354,7 +399,7 @@ class TestGetQuote:
 
     @patch.object(MarketDataService, "get_current_price")
     @patch("app.services.market_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_quote_success(
         self, mock_get, mock_settings, mock_price, mock_finnhub_success_response
     ):
@@ -3,9 +3,22 @@ Unit Tests for Sentiment Data Service
 Tests Reddit and News sentiment with mocked API responses
 """
 
+import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from app.services.sentiment_data import SentimentDataService, sentiment_service
+from app.services.sentiment_data import SentimentDataService, get_sentiment_service, _TokenBucket
+
+
+def _json_response(payload, status_code=200):
+    """Mock HTTP response carrying a JSON body"""
+    return Mock(status_code=status_code, content=json.dumps(payload).encode())
+
+
+@pytest.fixture(autouse=True)
+def fresh_reddit_limiter():
+    """Give each test a full Reddit rate-limit bucket"""
+    with patch("app.services.sentiment_data._reddit_limiter", _TokenBucket(60, 60.0)):
+        yield
 
 
 class TestRedditSentiment:
@@ -48,6 +61,117 @@ class TestRedditSentiment:
         assert result["source"] == "reddit"
         assert result["mentions"] > 0
 
+    def test_reddit_calls_serialized_across_threads(self):
+        """Test concurrent requests never use the PRAW client at the same time"""
+        import threading
+        import time
+
+        active = []
+        overlaps = []
+
+        def search(*args, **kwargs):
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.05)
+            active.pop()
+            return []
+
+        mock_reddit = MagicMock()
+        mock_reddit.subreddit.return_value.search.side_effect = search
+
+        service = SentimentDataService()
+        service.reddit = mock_reddit
+
+        threads = [
+            threading.Thread(target=service.get_reddit_sentiment, args=(ticker, False))
+            for ticker in ["NVDA", "AMD", "TSM"]
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == [1, 1, 1]
+
+    def test_reddit_top_posts_highest_scores(self):
+        """Test top posts are the 5 highest-scoring, not the first 5 seen"""
+        submissions = []
+        for score in [60, 70, 80, 90, 100, 40, 500, 300]:
+            post = Mock()
+            post.title = f"NVDA post {score}"
+            post.selftext = ""
+            post.score = score
+            post.upvote_ratio = 0.8
+            post.subreddit.display_name = "stocks"
+            submissions.append(post)
+
+        mock_reddit = MagicMock()
+        mock_reddit.subreddit.return_value.search.return_value = submissions
+
+        service = SentimentDataService()
+        service.reddit = mock_reddit
+        result = service.get_reddit_sentiment("NVDA", use_cache=False)
+
+        assert [p["score"] for p in result["top_posts"]] == [500, 300, 100, 90, 80]
+        assert all(p["subreddit"] == "stocks" for p in result["top_posts"])
+
+    def test_reddit_reads_submission_fields_once(self):
+        """Test each lazy submission attribute is read once per post"""
+        reads = []
+
+        class Submission:
+            def __getattr__(self, name):
+                reads.append(name)
+                return {"title": "NVDA to the moon", "selftext": "", "score": 120,
+                        "upvote_ratio": 0.9, "subreddit": Mock(display_name="stocks")}[name]
+
+        mock_reddit = MagicMock()
+        mock_reddit.subreddit.return_value.search.return_value = [Submission()]
+
+        service = SentimentDataService()
+        service.reddit = mock_reddit
+        result = service.get_reddit_sentiment("NVDA", use_cache=False)
+
+        assert result["top_posts"][0]["score"] == 120
+        assert sorted(reads) == ["score", "selftext", "subreddit", "title", "upvote_ratio"]
+
+    def test_reddit_single_multireddit_search(self, mock_reddit_submissions):
+        """Test all subreddits are searched with one "+"-joined query"""
+        mock_reddit = MagicMock()
+        mock_reddit.subreddit.return_value.search.return_value = mock_reddit_submissions
+
+        service = SentimentDataService()
+        service.reddit = mock_reddit
+        result = service.get_reddit_sentiment("NVDA", use_cache=False)
+
+        mock_reddit.subreddit.assert_called_once_with("wallstreetbets+stocks+investing+stockmarket")
+        mock_reddit.subreddit.return_value.search.assert_called_once_with(
+            "NVDA", time_filter="day", limit=100
+        )
+        assert result["mentions"] == len(mock_reddit_submissions)
+        assert [p["subreddit"] for p in result["top_posts"]] == ["wallstreetbets", "stocks"]
+
+    def test_reddit_search_error(self):
+        """Test a failed Reddit search returns an empty result"""
+        mock_reddit = MagicMock()
+        mock_reddit.subreddit.return_value.search.side_effect = Exception("403 Forbidden")
+
+        service = SentimentDataService()
+        service.reddit = mock_reddit
+        result = service.get_reddit_sentiment("NVDA", use_cache=False)
+
+        assert result["mentions"] == 0
+        assert result["top_posts"] == []
+
+    def test_classify_sentiments(self):
+        """Test bucket counts use inclusive +/-0.05 thresholds"""
+        import numpy as np
+
+        service = SentimentDataService()
+        counts = service._classify_sentiments(np.array([0.05, 0.8, -0.05, -0.3, 0.0, 0.049]))
+
+        assert counts == (2, 2, 2)
+
     def test_analyze_reddit_post_positive(self, mock_reddit_submission):
         """Test sentiment analysis of positive Reddit post with VADER"""
         mock_reddit_submission.title = "NVDA to the moon! Amazing growth, strong buy!"
@@ -98,6 +222,18 @@ class TestRedditSentiment:
         # High engagement should boost sentiment (engagement bonus +0.1)
         assert sentiment >= 0.0, f"Expected non-negative sentiment with high engagement"
 
+    def test_score_reddit_posts_batch(self, mock_reddit_submissions):
+        """Test batch scoring matches scoring posts one at a time"""
+        mock_reddit_submissions[1].score = -5
+
+        service = SentimentDataService()
+        scores = service._score_reddit_posts(mock_reddit_submissions)
+
+        assert len(scores) == 3
+        for submission, score in zip(mock_reddit_submissions, scores):
+            assert score == pytest.approx(service._analyze_reddit_post(submission))
+            assert -1.0 <= score <= 1.0
+
 
 class TestNewsSentiment:
     """Tests for get_news_sentiment() method"""
@@ -115,12 +251,12 @@ class TestNewsSentiment:
         assert result["sentiment_score"] == 0.0
 
     @patch("app.services.sentiment_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_news_success(self, mock_get, mock_settings, mock_newsapi_success_response):
         """Test successful news sentiment retrieval"""
         mock_settings.NEWS_API_KEY = "test_key"
 
-        mock_get.return_value = Mock(status_code=200, json=lambda: mock_newsapi_success_response)
+        mock_get.return_value = _json_response(mock_newsapi_success_response)
 
         service = SentimentDataService()
         result = service.get_news_sentiment("NVDA")
@@ -130,12 +266,34 @@ class TestNewsSentiment:
         assert len(result["headlines"]) <= 10
 
     @patch("app.services.sentiment_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
+    def test_news_missing_article_fields(self, mock_get, mock_settings):
+        """Test articles with null source/date and missing titles"""
+        mock_settings.NEWS_API_KEY = "test_key"
+        mock_settings.REDIS_URL = None
+
+        articles = [
+            {"title": "NVDA soars on great earnings", "source": None, "publishedAt": None},
+            {"title": None, "source": {"name": "Reuters"}},
+            {"title": "NVDA reports results", "source": {"id": None, "name": "Reuters"}},
+        ]
+        mock_get.return_value = _json_response({"articles": articles})
+
+        service = SentimentDataService()
+        result = service.get_news_sentiment("NVDA")
+
+        assert result["article_count"] == 3
+        assert [h["source"] for h in result["headlines"]] == ["Unknown", "Reuters"]
+        assert result["headlines"][0]["published"] == ""
+        assert result["headlines"][0]["sentiment"] == round(result["headlines"][0]["sentiment"], 3)
+
+    @patch("app.services.sentiment_data.settings")
+    @patch("requests.Session.get")
     def test_news_empty_results(self, mock_get, mock_settings, mock_newsapi_empty_response):
         """Test handling of empty news results"""
         mock_settings.NEWS_API_KEY = "test_key"
 
-        mock_get.return_value = Mock(status_code=200, json=lambda: mock_newsapi_empty_response)
+        mock_get.return_value = _json_response(mock_newsapi_empty_response)
 
         service = SentimentDataService()
         result = service.get_news_sentiment("NVDA")
@@ -144,7 +302,7 @@ class TestNewsSentiment:
         assert result["sentiment_score"] == 0.0
 
     @patch("app.services.sentiment_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_news_api_error(self, mock_get, mock_settings):
         """Test handling of NewsAPI error"""
         mock_settings.NEWS_API_KEY = "test_key"
@@ -157,7 +315,7 @@ class TestNewsSentiment:
         assert result["article_count"] == 0
 
     @patch("app.services.sentiment_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_news_rate_limit(self, mock_get, mock_settings):
         """Test handling of NewsAPI rate limit"""
         mock_settings.NEWS_API_KEY = "test_key"
@@ -219,6 +377,31 @@ class TestAnalyzeHeadline:
             assert -0.3 <= sentiment <= 0.3, f"Expected neutral for: {headline}, got {sentiment}"
 
 
+    def test_keyword_counts_match_substring_scan(self):
+        """Test the compiled keyword scan counts like per-keyword `in` checks"""
+        from app.services.sentiment_data import (
+            NEWS_NEGATIVE_KEYWORDS,
+            NEWS_POSITIVE_KEYWORDS,
+            _NEWS_NEGATIVE_RE,
+            _NEWS_POSITIVE_RE,
+            _count_keywords,
+        )
+
+        texts = [
+            "stocks surge and surge again on record growth",
+            "lawsuit warning: layoffs cut deep, shares plunge and fall",
+            "breakthrough rally despite concern",
+            "nothing to see here",
+        ]
+
+        for text in texts:
+            assert _count_keywords(_NEWS_POSITIVE_RE, text) == sum(
+                1 for kw in NEWS_POSITIVE_KEYWORDS if kw in text
+            )
+            assert _count_keywords(_NEWS_NEGATIVE_RE, text) == sum(
+                1 for kw in NEWS_NEGATIVE_KEYWORDS if kw in text
+            )
+
 class TestAggregateSentiment:
     """Tests for aggregate_sentiment() method"""
 
@@ -250,6 +433,19 @@ class TestAggregateSentiment:
         assert result["sentiment_label"] == "bullish"
         assert result["total_mentions"] == 70
 
+    @patch.object(SentimentDataService, "get_reddit_sentiment")
+    @patch.object(SentimentDataService, "get_news_sentiment")
+    def test_aggregate_shares_timestamp(self, mock_news, mock_reddit):
+        """Test both sources and the combined result get one timestamp"""
+        mock_reddit.return_value = {"source": "reddit", "mentions": 0}
+        mock_news.return_value = {"source": "news", "article_count": 0}
+
+        service = SentimentDataService()
+        result = service.aggregate_sentiment("NVDA", use_cache=False)
+
+        mock_reddit.assert_called_once_with("NVDA", False, result["timestamp"])
+        mock_news.assert_called_once_with("NVDA", False, result["timestamp"])
+
     @patch.object(SentimentDataService, "get_reddit_sentiment")
     @patch.object(SentimentDataService, "get_news_sentiment")
     def test_aggregate_bearish(self, mock_news, mock_reddit):
@@ -335,6 +531,73 @@ class TestAggregateSentiment:
         assert result["combined_sentiment"] == 0.8
 
 
+    def test_aggregate_fetches_sources_concurrently(self):
+        """Test Reddit and News are fetched at the same time"""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def reddit(ticker, use_cache=True, timestamp=None):
+            barrier.wait()
+            return {"source": "reddit", "mentions": 10, "sentiment_score": 0.5}
+
+        def news(ticker, use_cache=True, timestamp=None):
+            barrier.wait()
+            return {"source": "news", "article_count": 5, "sentiment_score": 0.5}
+
+        service = SentimentDataService()
+        with patch.object(service, "get_reddit_sentiment", side_effect=reddit), \
+                patch.object(service, "get_news_sentiment", side_effect=news):
+            result = service.aggregate_sentiment("NVDA", use_cache=False)
+
+        assert result["total_mentions"] == 15
+        assert result["combined_sentiment"] == 0.5
+
+    @patch.object(SentimentDataService, "aggregate_sentiment")
+    def test_aggregate_async(self, mock_aggregate):
+        """Test async aggregation delegates to the sync implementation"""
+        import asyncio
+
+        mock_aggregate.return_value = {"ticker": "NVDA", "combined_sentiment": 0.2}
+
+        service = SentimentDataService()
+        result = asyncio.run(service.aggregate_sentiment_async("NVDA", use_cache=False))
+
+        assert result["combined_sentiment"] == 0.2
+        mock_aggregate.assert_called_once_with("NVDA", False)
+
+    def test_endpoints_fetch_off_event_loop(self):
+        """Test sentiment endpoints run blocking fetches in worker threads"""
+        import asyncio
+        import threading
+        from app.api.endpoints import sentiment as endpoints
+
+        main_thread = threading.current_thread()
+        calls = []
+
+        def record(name):
+            def fetch(*args, **kwargs):
+                calls.append((name, threading.current_thread() is main_thread))
+                return {}
+            return fetch
+
+        service = Mock()
+        service.get_reddit_sentiment.side_effect = record("reddit")
+        service.get_news_sentiment.side_effect = record("news")
+        service.get_trending_tickers.side_effect = record("trending")
+
+        async def call_all():
+            await endpoints.get_reddit_sentiment("nvda")
+            await endpoints.get_news_sentiment("nvda")
+            await endpoints.get_trending_tickers(subreddit="stocks", limit=5)
+
+        with patch.object(endpoints, "get_sentiment_service", return_value=service):
+            asyncio.run(call_all())
+
+        assert calls == [("reddit", False), ("news", False), ("trending", False)]
+        service.get_reddit_sentiment.assert_called_once_with("NVDA")
+        service.get_trending_tickers.assert_called_once_with(subreddit="stocks", limit=5)
+
 class TestTrendingTickers:
     """Tests for get_trending_tickers() method"""
 
@@ -348,6 +611,36 @@ class TestTrendingTickers:
 
         assert result == []
 
+    def test_trending_counts_and_excludes(self):
+        """Test trending tickers are counted, filtered and ranked"""
+        titles = [
+            "NVDA and AMD earnings THE week",
+            "Why NVDA is up, CEO says",
+            "AMD vs NVDA: I am buying",
+        ]
+        mock_sub = MagicMock()
+        mock_sub.hot.return_value = [Mock(title=title) for title in titles]
+
+        service = SentimentDataService()
+        service.reddit = MagicMock()
+        service.reddit.subreddit.return_value = mock_sub
+
+        result = service.get_trending_tickers(limit=2)
+
+        assert result == [
+            {"ticker": "NVDA", "mentions": 3},
+            {"ticker": "AMD", "mentions": 2},
+        ]
+
+    def test_ticker_pattern_skips_excluded_words(self):
+        """Test the compiled ticker pattern never yields excluded words"""
+        from app.services.sentiment_data import _TICKER_EXCLUDE, _TICKER_RE
+
+        title = "I think THE CEO of NVDA AND AMD said THEM USA IPOX FDA"
+
+        assert _TICKER_RE.findall(title) == ["NVDA", "AMD", "THEM", "IPOX"]
+        assert not set(_TICKER_RE.findall(" ".join(_TICKER_EXCLUDE)))
+
     def test_ticker_extraction_pattern(self):
         """Test that ticker extraction regex works correctly"""
         import re
@@ -392,7 +685,7 @@ class TestEdgeCases:
     """Tests for edge cases and error handling"""
 
     @patch("app.services.sentiment_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_news_timeout(self, mock_get, mock_settings):
         """Test handling of request timeout"""
         import requests
@@ -408,7 +701,7 @@ class TestEdgeCases:
         assert result["sentiment_score"] == 0.0
 
     @patch("app.services.sentiment_data.settings")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_news_connection_error(self, mock_get, mock_settings):
         """Test handling of connection error"""
         import requests
@@ -422,6 +715,73 @@ class TestEdgeCases:
 
         assert result["article_count"] == 0
 
+    def test_http_session_configuration(self):
+        """Test the NewsAPI session sends a User-Agent and leaves retries to us"""
+        service = SentimentDataService()
+
+        assert service.session.headers["User-Agent"].startswith("alpha-machine/")
+        assert service.session.get_adapter("https://newsapi.org").max_retries.total == 0
+
+    @patch("app.services.sentiment_data.time.sleep")
+    def test_retry_backoff_jitter(self, mock_sleep):
+        """Test server errors are retried with jittered backoff"""
+        from app.services.sentiment_data import _make_request_with_retry
+
+        session = Mock()
+        session.get.side_effect = [Mock(status_code=503), Mock(status_code=503), Mock(status_code=200)]
+
+        with patch("app.services.sentiment_data.random.uniform", return_value=2.5) as mock_uniform:
+            response = _make_request_with_retry("https://example.com", {}, session=session)
+
+        assert response.status_code == 200
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.5]
+        mock_uniform.assert_called_with(1.0, 7.5)
+
+    @patch("app.services.sentiment_data.time.sleep")
+    def test_retry_after_beyond_budget(self, mock_sleep):
+        """Test a Retry-After longer than the budget gives up instead of sleeping"""
+        from app.services.sentiment_data import _make_request_with_retry
+
+        session = Mock()
+        session.get.return_value = Mock(status_code=429, headers={"Retry-After": "60"})
+
+        response = _make_request_with_retry(
+            "https://example.com", {}, session=session, total_timeout=20.0
+        )
+
+        assert response.status_code == 429
+        assert session.get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("app.services.sentiment_data.time.sleep")
+    @patch("app.services.sentiment_data.time.monotonic")
+    def test_token_bucket_waits_when_empty(self, mock_monotonic, mock_sleep):
+        """Test the rate limiter bursts to capacity, then waits for a refill"""
+        clock = [100.0]
+        mock_monotonic.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda wait: clock.__setitem__(0, clock[0] + wait)
+
+        bucket = _TokenBucket(2, 60.0)
+        bucket.acquire()
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_sleep.assert_called_once_with(pytest.approx(30.0))
+
+    def test_reddit_search_uses_limiter(self, mock_reddit_submissions):
+        """Test the Reddit search takes a token from the shared limiter"""
+        mock_reddit = MagicMock()
+        mock_reddit.subreddit.return_value.search.return_value = mock_reddit_submissions
+
+        service = SentimentDataService()
+        service.reddit = mock_reddit
+
+        with patch("app.services.sentiment_data._reddit_limiter") as mock_limiter:
+            service.get_reddit_sentiment("NVDA", use_cache=False)
+
+        mock_limiter.acquire.assert_called_once()
+
     def test_empty_title_handling(self):
         """Test handling of articles with empty titles"""
         service = SentimentDataService()
@@ -451,6 +811,18 @@ class TestVADERSentiment:
             assert "compound" in scores
             assert -1.0 <= scores["compound"] <= 1.0
 
+    def test_vader_prefers_native_binding(self):
+        """Test the Rust-backed VADER binding is used when installed"""
+        import sys
+        from app.services import sentiment_data
+
+        native = MagicMock()
+        with patch.dict(sys.modules, {"vader_sentimental": native}), \
+                patch.object(sentiment_data, "_vader_analyzer", None):
+            analyzer = sentiment_data.get_vader_analyzer()
+
+        assert analyzer is native.SentimentIntensityAnalyzer.return_value
+
     def test_vader_positive_text(self):
         """Test VADER returns positive score for positive text"""
         service = SentimentDataService()
@@ -471,6 +843,37 @@ class TestVADERSentiment:
         else:
             pytest.skip("VADER not available")
 
+    def test_vader_skipped_without_lexicon_words(self):
+        """Test texts without VADER lexicon words skip the analyzer"""
+        service = SentimentDataService()
+        if not service.vader:
+            pytest.skip("VADER not available")
+
+        texts = ["Weekly thread: NVDA, AMD", "NVDA earnings look great!"]
+        with patch.object(
+            service.vader, "polarity_scores", wraps=service.vader.polarity_scores
+        ) as spy:
+            scores = service._vader_compounds(texts)
+
+        assert scores[0] == 0.0
+        assert scores[1] > 0.0
+        spy.assert_called_once_with("NVDA earnings look great!")
+
+    def test_vader_scores_memoized(self):
+        """Test repeated texts are scored by VADER only once"""
+        service = SentimentDataService()
+        if not service.vader:
+            pytest.skip("VADER not available")
+
+        headline = "NVDA soars on great earnings"
+        with patch.object(
+            service.vader, "polarity_scores", wraps=service.vader.polarity_scores
+        ) as spy:
+            scores = service._score_headlines([headline, headline, headline])
+
+        assert scores[0] == scores[1] == scores[2] > 0.0
+        spy.assert_called_once_with(headline)
+
     def test_vader_with_reddit_selftext(self, mock_reddit_submission):
         """Test VADER analyzes selftext in addition to title"""
         mock_reddit_submission.title = "NVDA discussion"
@@ -488,9 +891,9 @@ class TestVADERSentiment:
 class TestRedisCaching:
     """Tests for Redis caching functionality"""
 
-    @patch("redis.from_url")
+    @patch.object(SentimentDataService, "_redis")
     @patch("app.services.sentiment_data.settings")
-    def test_cache_hit(self, mock_settings, mock_redis_from_url):
+    def test_cache_hit(self, mock_settings, mock_redis_client):
         """Test cache hit returns cached data"""
         mock_settings.REDIS_URL = "redis://localhost:6379/0"
         mock_settings.REDDIT_CLIENT_ID = None
@@ -500,7 +903,7 @@ class TestRedisCaching:
         # Mock Redis returning cached data
         mock_redis = MagicMock()
         mock_redis.get.return_value = '{"cached": true, "combined_sentiment": 0.5}'
-        mock_redis_from_url.return_value = mock_redis
+        mock_redis_client.return_value = mock_redis
 
         service = SentimentDataService()
         cached = service._get_cached_sentiment("NVDA")
@@ -510,9 +913,9 @@ class TestRedisCaching:
         assert cached["combined_sentiment"] == 0.5
         mock_redis.get.assert_called_once_with("sentiment:NVDA")
 
-    @patch("redis.from_url")
+    @patch.object(SentimentDataService, "_redis")
     @patch("app.services.sentiment_data.settings")
-    def test_cache_miss(self, mock_settings, mock_redis_from_url):
+    def test_cache_miss(self, mock_settings, mock_redis_client):
         """Test cache miss returns None"""
         mock_settings.REDIS_URL = "redis://localhost:6379/0"
         mock_settings.REDDIT_CLIENT_ID = None
@@ -521,23 +924,23 @@ class TestRedisCaching:
         # Mock Redis returning None (cache miss)
         mock_redis = MagicMock()
         mock_redis.get.return_value = None
-        mock_redis_from_url.return_value = mock_redis
+        mock_redis_client.return_value = mock_redis
 
         service = SentimentDataService()
         cached = service._get_cached_sentiment("NVDA")
 
         assert cached is None
 
-    @patch("redis.from_url")
+    @patch.object(SentimentDataService, "_redis")
     @patch("app.services.sentiment_data.settings")
-    def test_cache_write(self, mock_settings, mock_redis_from_url):
+    def test_cache_write(self, mock_settings, mock_redis_client):
         """Test sentiment data is cached after fetch"""
         mock_settings.REDIS_URL = "redis://localhost:6379/0"
         mock_settings.REDDIT_CLIENT_ID = None
         mock_settings.REDDIT_CLIENT_SECRET = None
 
         mock_redis = MagicMock()
-        mock_redis_from_url.return_value = mock_redis
+        mock_redis_client.return_value = mock_redis
 
         service = SentimentDataService()
         test_data = {"ticker": "NVDA", "combined_sentiment": 0.5}
@@ -549,6 +952,278 @@ class TestRedisCaching:
         assert call_args[0][0] == "sentiment:NVDA"
         assert call_args[0][1] == 1800  # TTL
 
+    def test_cache_serialization_round_trip(self):
+        """Test cached payloads round-trip, including NumPy scalars"""
+        import numpy as np
+        from app.services.sentiment_data import _json_dumps, _json_loads
+
+        data = {"ticker": "NVDA", "combined_sentiment": np.float64(0.5), "headlines": []}
+
+        assert _json_loads(_json_dumps(data)) == {
+            "ticker": "NVDA",
+            "combined_sentiment": 0.5,
+            "headlines": [],
+        }
+
+    @patch.object(SentimentDataService, "get_news_sentiment_batch")
+    @patch.object(SentimentDataService, "get_reddit_sentiment")
+    @patch.object(SentimentDataService, "_redis")
+    @patch("app.services.sentiment_data.settings")
+    def test_aggregate_bulk_batches_cache(self, mock_settings, mock_redis_client,
+                                          mock_reddit, mock_news_batch):
+        """Test bulk aggregation uses one MGET, one news batch and one pipeline"""
+        mock_settings.REDIS_URL = "redis://localhost:6379/0"
+        mock_settings.REDDIT_CLIENT_ID = None
+        mock_settings.REDDIT_CLIENT_SECRET = None
+
+        mock_redis = MagicMock()
+        mock_redis.mget.return_value = ['{"ticker": "NVDA", "combined_sentiment": 0.4}', None]
+        mock_redis_client.return_value = mock_redis
+        mock_reddit.return_value = {"mentions": 0, "sentiment_score": 0.0}
+        mock_news_batch.return_value = {
+            "AMD": {"article_count": 4, "sentiment_score": -0.2},
+        }
+
+        service = SentimentDataService()
+        result = service.aggregate_sentiment_bulk(["NVDA", "AMD", "NVDA"])
+
+        assert list(result) == ["NVDA", "AMD"]
+        assert result["NVDA"]["from_cache"] is True
+        assert result["AMD"]["combined_sentiment"] == -0.2
+        mock_redis.mget.assert_called_once_with(["sentiment:NVDA", "sentiment:AMD"])
+        timestamp = result["AMD"]["timestamp"]
+        mock_reddit.assert_called_once_with("AMD", use_cache=False, timestamp=timestamp)
+        mock_news_batch.assert_called_once_with(["AMD"], False, timestamp)
+
+        pipe = mock_redis.pipeline.return_value.__enter__.return_value
+        pipe.setex.assert_called_once()
+        assert pipe.setex.call_args[0][:2] == ("sentiment:AMD", 1800)
+        pipe.execute.assert_called_once()
+
+    @patch.object(SentimentDataService, "get_news_sentiment_batch")
+    @patch("app.services.sentiment_data.settings")
+    def test_aggregate_bulk_searches_reddit_on_calling_thread(self, mock_settings,
+                                                              mock_news_batch):
+        """Test bulk aggregation never shares the PRAW client across threads"""
+        import threading
+
+        mock_settings.REDIS_URL = None
+        mock_settings.REDDIT_CLIENT_ID = None
+        mock_settings.REDDIT_CLIENT_SECRET = None
+
+        main_thread = threading.current_thread()
+        calls = []
+
+        def reddit(ticker, use_cache=True, timestamp=None):
+            calls.append((ticker, threading.current_thread() is main_thread))
+            return {"mentions": 0, "sentiment_score": 0.0}
+
+        mock_news_batch.side_effect = lambda tickers, use_cache, timestamp: {
+            ticker: {"article_count": 0, "sentiment_score": 0.0} for ticker in tickers
+        }
+
+        service = SentimentDataService()
+        with patch.object(service, "get_reddit_sentiment", side_effect=reddit):
+            result = service.aggregate_sentiment_bulk(["NVDA", "AMD", "TSM"], use_cache=False)
+
+        assert list(result) == ["NVDA", "AMD", "TSM"]
+        assert calls == [("NVDA", True), ("AMD", True), ("TSM", True)]
+
+    @patch("app.services.sentiment_data.settings")
+    @patch("requests.Session.get")
+    def test_news_batch_single_request(self, mock_get, mock_settings):
+        """Test batched news makes one OR query and routes articles by ticker"""
+        mock_settings.NEWS_API_KEY = "test_key"
+        mock_settings.REDIS_URL = None
+
+        articles = [
+            {"title": "NVDA and AMD rally on AI demand", "source": {"name": "Reuters"}},
+            {"title": "Chip stocks gain", "description": "AMD leads the sector"},
+            {"title": "NVDAX fund launches", "source": {"name": "Bloomberg"}},
+        ]
+        mock_get.return_value = _json_response({"articles": articles})
+
+        service = SentimentDataService()
+        result = service.get_news_sentiment_batch(["NVDA", "AMD", "INTC"])
+
+        mock_get.assert_called_once()
+        params = mock_get.call_args[1]["params"]
+        assert params["q"] == "NVDA OR AMD OR INTC"
+        assert params["pageSize"] == 100
+        assert result["NVDA"]["article_count"] == 1
+        assert result["AMD"]["article_count"] == 2
+        assert result["INTC"]["article_count"] == 0
+        assert result["INTC"]["ticker"] == "INTC"
+
+    @patch("app.tasks.data_tasks.SessionLocal")
+    @patch("app.services.sentiment_data.settings")
+    @patch("requests.Session.get")
+    def test_sentiment_task_batches_news(self, mock_get, mock_settings, mock_session):
+        """Test the sentiment task fetches news for the watchlist in one request"""
+        from app.tasks.data_tasks import fetch_sentiment_task
+
+        mock_settings.NEWS_API_KEY = "test_key"
+        mock_settings.REDIS_URL = None
+        mock_settings.REDDIT_CLIENT_ID = None
+        mock_settings.REDDIT_CLIENT_SECRET = None
+        mock_session.return_value.query.return_value.filter.return_value.all.return_value = [
+            Mock(ticker="NVDA"), Mock(ticker="AMD"),
+        ]
+        mock_get.return_value = _json_response({"articles": [
+            {"title": "NVDA and AMD rally on AI demand", "source": {"name": "Reuters"}},
+        ]})
+
+        with patch("app.tasks.data_tasks.get_sentiment_service",
+                   return_value=SentimentDataService()):
+            result = fetch_sentiment_task()
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args[1]["params"]["q"] == "NVDA OR AMD"
+        assert result["successful"] == 2
+
+    @patch("requests.Session.get")
+    @patch.object(SentimentDataService, "_redis")
+    @patch("app.services.sentiment_data.settings")
+    def test_news_batch_skips_cached(self, mock_settings, mock_redis_client, mock_get):
+        """Test cached tickers are left out of the batched NewsAPI query"""
+        mock_settings.REDIS_URL = "redis://localhost:6379/0"
+        mock_settings.NEWS_API_KEY = "test_key"
+        mock_settings.REDDIT_CLIENT_ID = None
+        mock_settings.REDDIT_CLIENT_SECRET = None
+
+        mock_redis = MagicMock()
+        mock_redis.get.side_effect = lambda key: (
+            b'{"source": "news", "article_count": 12}' if key == "sentiment:news:NVDA" else None
+        )
+        mock_redis_client.return_value = mock_redis
+        mock_get.return_value = _json_response({"articles": []})
+
+        service = SentimentDataService()
+        result = service.get_news_sentiment_batch(["NVDA", "AMD"])
+
+        assert result["NVDA"]["article_count"] == 12
+        assert mock_get.call_args[1]["params"]["q"] == "AMD"
+        assert mock_redis.setex.call_args[0][:2] == ("sentiment:news:AMD", 300)
+
+    @patch("redis.ConnectionPool.from_url")
+    @patch("app.services.sentiment_data.settings")
+    def test_redis_pool_shared(self, mock_settings, mock_pool_from_url):
+        """Test Redis clients share one pool per REDIS_URL"""
+        mock_settings.REDIS_URL = "redis://localhost:6379/0"
+        mock_settings.REDDIT_CLIENT_ID = None
+        mock_settings.REDDIT_CLIENT_SECRET = None
+
+        with patch.object(SentimentDataService, "_redis_pool", None):
+            first = SentimentDataService._redis()
+            second = SentimentDataService._redis()
+
+            assert first.connection_pool is second.connection_pool
+            mock_pool_from_url.assert_called_once_with(
+                "redis://localhost:6379/0", max_connections=32
+            )
+
+    @patch.object(SentimentDataService, "_redis")
+    @patch("app.services.sentiment_data.settings")
+    def test_cache_write_empty_result_short_ttl(self, mock_settings, mock_redis_client):
+        """Test results with no mentions are cached with the short TTL"""
+        mock_settings.REDIS_URL = "redis://localhost:6379/0"
+        mock_settings.REDDIT_CLIENT_ID = None
+        mock_settings.REDDIT_CLIENT_SECRET = None
+
+        mock_redis = MagicMock()
+        mock_redis_client.return_value = mock_redis
+
+        service = SentimentDataService()
+        service._cache_sentiment("ZZZZ", {"ticker": "ZZZZ", "total_mentions": 0})
+
+        assert mock_redis.setex.call_args[0][1] == 300
+
+    @patch("requests.Session.get")
+    @patch.object(SentimentDataService, "_redis")
+    @patch("app.services.sentiment_data.settings")
+    def test_news_cache_hit(self, mock_settings, mock_redis_client, mock_get):
+        """Test cached news sentiment skips NewsAPI"""
+        mock_settings.REDIS_URL = "redis://localhost:6379/0"
+        mock_settings.NEWS_API_KEY = "test_key"
+        mock_settings.REDDIT_CLIENT_ID = None
+        mock_settings.REDDIT_CLIENT_SECRET = None
+
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = b'{"source": "news", "article_count": 12}'
+        mock_redis_client.return_value = mock_redis
+
+        service = SentimentDataService()
+        result = service.get_news_sentiment("NVDA")
+
+        assert result["article_count"] == 12
+        mock_redis.get.assert_called_once_with("sentiment:news:NVDA")
+        mock_get.assert_not_called()
+
+    @patch("requests.Session.get")
+    @patch.object(SentimentDataService, "_redis")
+    @patch("app.services.sentiment_data.settings")
+    def test_news_cache_write(self, mock_settings, mock_redis_client, mock_get,
+                              mock_newsapi_success_response, mock_newsapi_empty_response):
+        """Test news results are cached, empty ones with the short TTL"""
+        mock_settings.REDIS_URL = "redis://localhost:6379/0"
+        mock_settings.NEWS_API_KEY = "test_key"
+        mock_settings.REDDIT_CLIENT_ID = None
+        mock_settings.REDDIT_CLIENT_SECRET = None
+
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = None
+        mock_redis_client.return_value = mock_redis
+
+        service = SentimentDataService()
+
+        mock_get.return_value = _json_response(mock_newsapi_success_response)
+        service.get_news_sentiment("NVDA")
+        assert mock_redis.setex.call_args[0][:2] == ("sentiment:news:NVDA", 300)
+
+        mock_get.return_value = _json_response(mock_newsapi_empty_response)
+        service.get_news_sentiment("ZZZZ")
+        assert mock_redis.setex.call_args[0][:2] == ("sentiment:news:ZZZZ", 300)
+
+    @patch("requests.Session.get")
+    @patch.object(SentimentDataService, "_redis")
+    @patch("app.services.sentiment_data.settings")
+    def test_news_error_not_cached(self, mock_settings, mock_redis_client, mock_get):
+        """Test NewsAPI errors are not cached"""
+        mock_settings.REDIS_URL = "redis://localhost:6379/0"
+        mock_settings.NEWS_API_KEY = "test_key"
+        mock_settings.REDDIT_CLIENT_ID = None
+        mock_settings.REDDIT_CLIENT_SECRET = None
+
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = None
+        mock_redis_client.return_value = mock_redis
+        mock_get.return_value = Mock(status_code=401)
+
+        service = SentimentDataService()
+        service.get_news_sentiment("NVDA")
+
+        mock_redis.setex.assert_not_called()
+
+    @patch.object(SentimentDataService, "_redis")
+    @patch("app.services.sentiment_data.settings")
+    def test_reddit_cache_write(self, mock_settings, mock_redis_client, mock_reddit_submissions):
+        """Test complete Reddit results are cached with the Reddit TTL"""
+        mock_settings.REDIS_URL = "redis://localhost:6379/0"
+        mock_settings.REDDIT_CLIENT_ID = None
+        mock_settings.REDDIT_CLIENT_SECRET = None
+
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = None
+        mock_redis_client.return_value = mock_redis
+
+        service = SentimentDataService()
+        service.reddit = MagicMock()
+        service.reddit.subreddit.return_value.search.return_value = mock_reddit_submissions
+        service.get_reddit_sentiment("NVDA")
+
+        mock_redis.get.assert_called_once_with("sentiment:reddit:NVDA")
+        assert mock_redis.setex.call_args[0][:2] == ("sentiment:reddit:NVDA", 180)
+
     @patch("app.services.sentiment_data.settings")
     def test_cache_disabled_without_redis_url(self, mock_settings):
         """Test caching is disabled when REDIS_URL not set"""
@@ -562,9 +1237,9 @@ class TestRedisCaching:
         cached = service._get_cached_sentiment("NVDA")
         assert cached is None
 
-    @patch("redis.from_url")
+    @patch.object(SentimentDataService, "_redis")
     @patch("app.services.sentiment_data.settings")
-    def test_aggregate_uses_cache(self, mock_settings, mock_redis_from_url):
+    def test_aggregate_uses_cache(self, mock_settings, mock_redis_client):
         """Test aggregate_sentiment uses cached data when available"""
         mock_settings.REDIS_URL = "redis://localhost:6379/0"
         mock_settings.REDDIT_CLIENT_ID = None
@@ -583,7 +1258,7 @@ class TestRedisCaching:
 
         mock_redis = MagicMock()
         mock_redis.get.return_value = '{"ticker": "NVDA", "combined_sentiment": 0.75, "sentiment_label": "bullish", "total_mentions": 100}'
-        mock_redis_from_url.return_value = mock_redis
+        mock_redis_client.return_value = mock_redis
 
         service = SentimentDataService()
         result = service.aggregate_sentiment("NVDA", use_cache=True)
@@ -618,6 +1293,21 @@ class TestRedisCaching:
         assert result["from_cache"] is False
 
 
+class TestSentimentServiceSingleton:
+    """Tests for the lazily created shared service"""
+
+    def test_get_sentiment_service_lazy_singleton(self):
+        """Test the service is created on first use and then reused"""
+        from app.services import sentiment_data
+
+        with patch.object(sentiment_data, "_sentiment_service", None), \
+                patch.object(sentiment_data, "SentimentDataService") as mock_cls:
+            first = get_sentiment_service()
+            second = get_sentiment_service()
+
+        assert first is second is mock_cls.return_value
+        mock_cls.assert_called_once_with()
+
 class TestPredictorAgentSentiment:
     """Tests for sentiment analysis in PredictorAgent"""
 
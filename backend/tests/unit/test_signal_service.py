@@ -4,9 +4,14 @@ Tests for Signal Service - CRUD operations and risk calculations
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+from dataclasses import replace
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from app.models.agent_analysis import AgentAnalysis
+from app.models.signal import Signal
+from app.services import signal_service as signal_service_module
+from app.services.signal_ranker import signal_ranker
 from app.services.signal_service import SignalService, get_signal_service
 from app.agents.signal_generator import ConsensusSignal, PositionSize
 from app.agents.base_agent import AgentSignal, SignalType
@@ -15,6 +20,13 @@ from app.agents.base_agent import AgentSignal, SignalType
 class TestSignalService:
     """Tests for SignalService class"""
 
+    @pytest.fixture(autouse=True)
+    def clear_signal_caches(self):
+        """Statistics are cached per process; start each test empty"""
+        signal_service_module._clear_signal_caches()
+        yield
+        signal_service_module._clear_signal_caches()
+
     @pytest.fixture
     def mock_db(self):
         """Create a mock database session"""
@@ -104,6 +116,12 @@ class TestSignalService:
         target = signal_service._calculate_target_price(entry, SignalType.SELL)
         assert target == 75.0
 
+    def test_calculate_target_price_strong_sell(self, signal_service):
+        """Target price for STRONG_SELL signal is 25% below entry"""
+        entry = 100.0
+        target = signal_service._calculate_target_price(entry, SignalType.STRONG_SELL)
+        assert target == 75.0
+
     def test_calculate_target_price_hold(self, signal_service):
         """Target price for HOLD signal equals entry price"""
         entry = 100.0
@@ -211,54 +229,226 @@ class TestSignalService:
         """STRONG_SELL maps to SELL"""
         assert signal_service._map_signal_type(SignalType.STRONG_SELL) == "SELL"
 
+    def test_signal_type_column_codec(self):
+        """signal_type is stored as SMALLINT and read back as a string"""
+        column_type = Signal.__table__.c.signal_type.type
+        assert column_type.impl.__class__.__name__ == "SmallInteger"
+        for name in ("HOLD", "BUY", "SELL"):
+            code = column_type.process_bind_param(name, None)
+            assert isinstance(code, int)
+            assert column_type.process_result_value(code, None) == name
+        assert column_type.process_bind_param("UNKNOWN", None) is None
+
     # ===================
     # Save Signal Tests
     # ===================
 
     def test_save_signal_creates_record(self, signal_service, mock_db, sample_consensus):
-        """save_signal creates a Signal record"""
-        # Mock the Signal class
-        with patch("app.services.signal_service.Signal") as MockSignal:
-            mock_signal = Mock()
-            mock_signal.id = 1
-            mock_signal.entry_price = Decimal("100.00")
-            mock_signal.stop_loss = Decimal("90.00")
-            mock_signal.target_price = Decimal("125.00")
-            mock_signal.position_size = 100
-            MockSignal.return_value = mock_signal
-
-            with patch("app.services.signal_service.AgentAnalysis"):
-                result = signal_service.save_signal(
-                    consensus=sample_consensus,
-                    entry_price=100.0,
-                    portfolio_value=100000.0,
-                )
-
-                # Verify Signal was created
-                MockSignal.assert_called_once()
-                mock_db.add.assert_called()
-                mock_db.commit.assert_called_once()
+        """save_signal inserts a Signal record with RETURNING"""
+        created = datetime(2026, 1, 5, 15, 30)
+        mock_db.execute.return_value.one.return_value = (1, created)
+
+        result = signal_service.save_signal(
+            consensus=sample_consensus,
+            entry_price=100.0,
+            portfolio_value=100000.0,
+        )
+
+        # Signal insert, then the agent analyses insert; no flush or refresh
+        assert mock_db.execute.call_count == 2
+        stmt = mock_db.execute.call_args_list[0][0][0]
+        assert stmt.table.name == "signals"
+        mock_db.commit.assert_called_once()
+        mock_db.flush.assert_not_called()
+        mock_db.refresh.assert_not_called()
+
+        assert result.id == 1
+        assert result.timestamp == created
+        assert result.ticker == "NVDA"
+        assert result.entry_price == Decimal("100.0")
+        assert result.status == "PENDING"
+        assert mock_db.execute.call_args_list[0][0][1]["status"] == "PENDING"
 
     def test_save_signal_calculates_risk_params(self, signal_service, mock_db, sample_consensus):
         """save_signal calculates correct risk parameters"""
-        with patch("app.services.signal_service.Signal") as MockSignal:
-            mock_signal = Mock()
-            mock_signal.id = 1
-            MockSignal.return_value = mock_signal
-
-            with patch("app.services.signal_service.AgentAnalysis"):
-                signal_service.save_signal(
-                    consensus=sample_consensus,
-                    entry_price=100.0,
-                    portfolio_value=100000.0,
-                )
-
-                # Check Signal was created with correct parameters
-                call_kwargs = MockSignal.call_args[1]
-                assert call_kwargs["ticker"] == "NVDA"
-                assert call_kwargs["signal_type"] == "BUY"
-                assert float(call_kwargs["stop_loss"]) == 90.0
-                assert float(call_kwargs["target_price"]) == 125.0
+        mock_db.execute.return_value.one.return_value = (1, datetime.now())
+
+        signal_service.save_signal(
+            consensus=sample_consensus,
+            entry_price=100.0,
+            portfolio_value=100000.0,
+        )
+
+        # Check Signal was inserted with correct parameters
+        values = mock_db.execute.call_args_list[0][0][1]
+        assert values["ticker"] == "NVDA"
+        assert values["signal_type"] == "BUY"
+        assert float(values["stop_loss"]) == 90.0
+        assert float(values["target_price"]) == 125.0
+        assert values["composite_score"] == pytest.approx(
+            values["confidence"] / 5.0 * 0.25
+        )
+
+    def test_save_signal_stores_agent_summary(self, signal_service, mock_db, sample_consensus):
+        """save_signal stores agent count and agreement on the signal row"""
+        mock_db.execute.return_value.one.return_value = (1, datetime.now())
+        sample_consensus.agent_signals[1].signal = SignalType.HOLD
+
+        signal_service.save_signal(
+            consensus=sample_consensus,
+            entry_price=100.0,
+            portfolio_value=100000.0,
+        )
+
+        values = mock_db.execute.call_args_list[0][0][1]
+        assert values["agent_count"] == 2
+        assert values["agent_agreement"] == 0.5
+
+    def test_to_decimal_rounds_to_cents(self):
+        """Prices are stored as exact two-place Decimals"""
+        from app.services.signal_service import _to_decimal
+
+        assert _to_decimal(123.456) == Decimal("123.46")
+        assert str(_to_decimal(90.0)) == "90.00"
+        assert _to_decimal(-12.344) == Decimal("-12.34")
+        assert _to_decimal(99.99) is _to_decimal(99.99)
+
+    def test_save_agent_analyses_single_insert(self, signal_service, mock_db, sample_consensus):
+        """Agent analyses are written with one bulk INSERT"""
+        signal_service._save_agent_analyses(7, sample_consensus.agent_signals)
+
+        mock_db.execute.assert_called_once()
+        stmt, rows = mock_db.execute.call_args[0]
+        assert stmt.table.name == "agent_analysis"
+        assert [row["agent_name"] for row in rows] == ["TestAgent1", "TestAgent2"]
+        assert rows[0] == {
+            "signal_id": 7,
+            "agent_name": "TestAgent1",
+            "recommendation": "BUY",
+            "confidence": 5,
+            "reasoning": "Test reasoning 1",
+            "data_used": {},
+        }
+        mock_db.add.assert_not_called()
+
+    def test_save_signals_bulk(self, signal_service, mock_db, sample_consensus):
+        """save_signals_bulk writes all signals and analyses with two INSERTs"""
+        sell = replace(sample_consensus, ticker="AMD", signal=SignalType.SELL)
+        created = datetime(2026, 1, 5, 15, 30)
+        mock_db.execute.return_value.all.return_value = [(1, created), (2, created)]
+
+        signals = signal_service.save_signals_bulk(
+            [sample_consensus, sell], [100.0, 50.0], portfolio_value=100000.0
+        )
+
+        assert mock_db.execute.call_count == 2
+        signal_stmt, rows = mock_db.execute.call_args_list[0][0]
+        assert signal_stmt.table.name == "signals"
+        assert [row["ticker"] for row in rows] == ["NVDA", "AMD"]
+        assert (rows[0]["stop_loss"], rows[0]["target_price"]) == (Decimal("90"), Decimal("125"))
+        assert (rows[1]["stop_loss"], rows[1]["target_price"]) == (Decimal("55"), Decimal("37.5"))
+
+        analysis_stmt, analyses = mock_db.execute.call_args_list[1][0]
+        assert analysis_stmt.table.name == "agent_analysis"
+        assert [row["signal_id"] for row in analyses] == [1, 1, 2, 2]
+        mock_db.commit.assert_called_once()
+
+        assert [(s.id, s.ticker, s.signal_type, s.status) for s in signals] == [
+            (1, "NVDA", "BUY", "PENDING"),
+            (2, "AMD", "SELL", "PENDING"),
+        ]
+
+    def test_save_signals_bulk_triggers_one_alert(self, signal_service, mock_db, sample_consensus):
+        """save_signals_bulk sends eligible signals in a single alert task"""
+        hold = replace(sample_consensus, ticker="AMD", signal=SignalType.HOLD)
+        mock_db.execute.return_value.all.return_value = [(i, datetime.now()) for i in (1, 2, 3)]
+
+        with patch("app.tasks.telegram_tasks.send_signal_alerts_task") as alerts_task, patch(
+            "app.services.signal_service.settings"
+        ) as mock_settings:
+            mock_settings.TELEGRAM_BOT_TOKEN = "token"
+            mock_settings.TELEGRAM_CHAT_ID = "chat"
+            signal_service.save_signals_bulk(
+                [sample_consensus, hold, sample_consensus], [100.0, 50.0, 10.0]
+            )
+
+        alerts_task.delay.assert_called_once()
+        alerts = alerts_task.delay.call_args[0][0]
+        assert [alert["ticker"] for alert in alerts] == ["NVDA", "NVDA"]
+
+    def test_save_signals_bulk_matches_save_signal(
+        self, signal_service, mock_db, sample_consensus
+    ):
+        """Bulk rows match the values save_signal would insert"""
+        mock_db.execute.return_value.one.return_value = (1, datetime.now())
+        signal_service.save_signal(sample_consensus, entry_price=123.45)
+        single = mock_db.execute.call_args_list[0][0][1]
+
+        mock_db.execute.reset_mock()
+        mock_db.execute.return_value.all.return_value = [(1, datetime.now())]
+        signal_service.save_signals_bulk([sample_consensus], [123.45])
+
+        assert mock_db.execute.call_args_list[0][0][1] == [single]
+
+    def test_save_signals_bulk_empty(self, signal_service, mock_db):
+        """save_signals_bulk does nothing for an empty batch"""
+        assert signal_service.save_signals_bulk([], []) == []
+        mock_db.execute.assert_not_called()
+        mock_db.commit.assert_not_called()
+
+    def test_copy_signals_streams_rows(self, signal_service, mock_db):
+        """copy_signals writes each row through COPY FROM STDIN"""
+        cursor = MagicMock()
+        driver_connection = MagicMock()
+        driver_connection.cursor.return_value.__enter__.return_value = cursor
+        mock_db.connection.return_value.connection.driver_connection = driver_connection
+        copy = cursor.copy.return_value.__enter__.return_value
+        opened = datetime(2025, 6, 2, 9, 30)
+
+        rows = (
+            {
+                "ticker": ticker,
+                "signal_type": "BUY",
+                "confidence": 4,
+                "entry_price": 100.0,
+                "target_price": 125.0,
+                "stop_loss": 90.0,
+                "timestamp": opened,
+            }
+            for ticker in ("NVDA", "AMD")
+        )
+        count = signal_service.copy_signals(rows)
+
+        assert count == 2
+        assert cursor.copy.call_args[0][0].startswith("COPY signals (")
+        first = copy.write_row.call_args_list[0][0][0]
+        assert first == (
+            "NVDA", 1, 4, 100.0, 125.0, 90.0,
+            pytest.approx(4 / 5.0 * 0.25), None, "PENDING", opened,
+        )
+        mock_db.commit.assert_called_once()
+
+    def test_copy_signals_scores_stored_prices(self, signal_service, mock_db):
+        """copy_signals rounds prices to cents before scoring them"""
+        cursor = MagicMock()
+        driver_connection = MagicMock()
+        driver_connection.cursor.return_value.__enter__.return_value = cursor
+        mock_db.connection.return_value.connection.driver_connection = driver_connection
+        copy = cursor.copy.return_value.__enter__.return_value
+
+        signal_service.copy_signals([{
+            "ticker": "NVDA",
+            "signal_type": "BUY",
+            "confidence": 3,
+            "entry_price": 100.004,
+            "target_price": 117.456,
+            "stop_loss": None,
+            "timestamp": datetime(2025, 6, 2, 9, 30),
+        }])
+
+        row = copy.write_row.call_args[0][0]
+        assert row[3:6] == (100.0, 117.46, None)
+        assert row[6] == signal_ranker.composite_score(3, 100.0, 117.46, None)
 
     # ===================
     # Get Signals Tests
@@ -268,14 +458,14 @@ class TestSignalService:
         """get_signal returns signal by ID"""
         mock_signal = Mock()
         mock_signal.id = 1
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_signal
+        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = mock_signal
 
         result = signal_service.get_signal(1)
         assert result == mock_signal
 
     def test_get_signal_not_found(self, signal_service, mock_db):
         """get_signal returns None when not found"""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = None
 
         result = signal_service.get_signal(999)
         assert result is None
@@ -295,50 +485,166 @@ class TestSignalService:
         # Verify filters were applied
         assert mock_query.filter.call_count >= 3
 
+    def test_get_signals_include_analyses(self, signal_service, mock_db):
+        """get_signals eager-loads agent analyses only when asked"""
+        mock_query = MagicMock()
+        mock_db.query.return_value = mock_query
+        for method in ("options", "filter", "order_by", "offset", "limit"):
+            getattr(mock_query, method).return_value = mock_query
+
+        signal_service.get_signals()
+        mock_query.options.assert_not_called()
+
+        signal_service.get_signals(include_analyses=True)
+        mock_query.options.assert_called_once()
+
+    def test_list_endpoint_includes_agent_analyses(self, mock_db):
+        """GET /signals returns agent analyses for the dashboard modal"""
+        import asyncio
+        from app.api.endpoints.signals import list_signals
+
+        analysis = Mock()
+        analysis.agent_name = "TestAgent1"
+        analysis.recommendation = "BUY"
+        analysis.confidence = 4
+        analysis.reasoning = "Test reasoning"
+        analysis.data_used = {}
+        analysis.timestamp = datetime(2024, 1, 1, 10, 0, 0)
+        mock_signal = MagicMock()
+        mock_signal.timestamp = datetime(2024, 1, 1, 10, 0, 0)
+        mock_signal.agent_analyses = [analysis]
+
+        service = SignalService(mock_db)
+        with patch(
+            "app.api.endpoints.signals.get_signal_service", return_value=service
+        ), patch.object(service, "get_signals", return_value=[mock_signal]) as get_signals:
+            response = asyncio.run(list_signals(
+                ticker=None, signal_type=None, status=None,
+                days=30, limit=50, offset=0, db=mock_db,
+            ))
+
+        assert get_signals.call_args[1]["include_analyses"] is True
+        assert response["signals"][0]["agent_analyses"][0]["agent_name"] == "TestAgent1"
+
+    def test_get_signals_summary_selects_columns(self, signal_service, mock_db):
+        """get_signals_summary selects summary columns with SQL filters"""
+        mock_db.execute.return_value.all.return_value = []
+
+        rows = signal_service.get_signals_summary(signal_type="buy", days=14, limit=500)
+
+        assert rows == []
+        stmt = mock_db.execute.call_args[0][0]
+        columns = [column.name for column in stmt.selected_columns]
+        assert "notes" not in columns
+        assert columns[:3] == ["id", "ticker", "signal_type"]
+        sql = str(stmt)
+        assert "signals.signal_type = " in sql
+        assert "ORDER BY signals.timestamp DESC" in sql
+        assert stmt.compile().params["signal_type_1"] == "BUY"
+
     # ===================
     # Update Status Tests
     # ===================
 
+    @staticmethod
+    def _updated_row(**fields):
+        """Row returned by UPDATE ... RETURNING"""
+        row = Mock()
+        row._mapping = {"id": 1, "ticker": "NVDA", **fields}
+        return row
+
+    @staticmethod
+    def _update_values(mock_db):
+        """Column values from the executed UPDATE statement"""
+        stmt = mock_db.execute.call_args[0][0]
+        return {col.name: param.value for col, param in stmt._values.items()}
+
     def test_update_signal_status_approved(self, signal_service, mock_db):
-        """update_signal_status updates to APPROVED"""
-        mock_signal = Mock()
-        mock_signal.id = 1
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_signal
+        """update_signal_status updates to APPROVED in one statement"""
+        mock_db.execute.return_value.one_or_none.return_value = self._updated_row(
+            status="APPROVED"
+        )
 
-        result = signal_service.update_signal_status(1, "APPROVED")
+        result = signal_service.update_signal_status(1, "approved")
 
-        assert mock_signal.status == "APPROVED"
+        assert self._update_values(mock_db) == {"status": "APPROVED"}
+        assert result.id == 1
+        assert result.status == "APPROVED"
+        mock_db.execute.assert_called_once()
+        mock_db.query.assert_not_called()
+        mock_db.refresh.assert_not_called()
         mock_db.commit.assert_called_once()
 
+    def test_status_endpoint_returns_agent_analyses(self, mock_db):
+        """PATCH /status reloads the updated signal with its analyses"""
+        import asyncio
+        from app.api.endpoints.signals import update_signal_status
+
+        analysis = AgentAnalysis(
+            id=7, signal_id=1, agent_name="TestAgent1", recommendation="BUY",
+            confidence=4, reasoning="Test reasoning", data_used={},
+            timestamp=datetime(2024, 1, 1, 10, 0, 0),
+        )
+        reloaded = MagicMock()
+        reloaded.timestamp = datetime(2024, 1, 1, 10, 0, 0)
+        reloaded.agent_analyses = [analysis]
+
+        service = SignalService(mock_db)
+        with patch(
+            "app.api.endpoints.signals.get_signal_service", return_value=service
+        ), patch.object(
+            service, "update_signal_status", return_value=Mock()
+        ), patch.object(service, "get_signal", return_value=reloaded) as get_signal:
+            response = asyncio.run(update_signal_status(
+                signal_id=1, status="approved", pnl=None, notes=None, db=mock_db,
+            ))
+
+        get_signal.assert_called_once_with(1)
+        assert response["agent_analyses"][0]["agent_name"] == "TestAgent1"
+
     def test_update_signal_status_executed(self, signal_service, mock_db):
         """update_signal_status sets executed_at timestamp"""
-        mock_signal = Mock()
-        mock_signal.id = 1
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_signal
+        mock_db.execute.return_value.one_or_none.return_value = self._updated_row()
 
-        result = signal_service.update_signal_status(1, "EXECUTED")
+        signal_service.update_signal_status(1, "EXECUTED")
 
-        assert mock_signal.status == "EXECUTED"
-        assert mock_signal.executed_at is not None
+        values = self._update_values(mock_db)
+        assert values["status"] == "EXECUTED"
+        assert values["executed_at"] is not None
 
     def test_update_signal_status_closed_with_pnl(self, signal_service, mock_db):
         """update_signal_status sets pnl when closing"""
-        mock_signal = Mock()
-        mock_signal.id = 1
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_signal
+        mock_db.execute.return_value.one_or_none.return_value = self._updated_row()
 
-        result = signal_service.update_signal_status(1, "CLOSED", pnl=1500.50)
+        signal_service.update_signal_status(1, "CLOSED", pnl=1500.50)
 
-        assert mock_signal.status == "CLOSED"
-        assert mock_signal.closed_at is not None
-        assert mock_signal.pnl == Decimal("1500.50")
+        values = self._update_values(mock_db)
+        assert values["status"] == "CLOSED"
+        assert values["closed_at"] is not None
+        assert values["pnl"] == Decimal("1500.50")
 
     def test_update_signal_status_not_found(self, signal_service, mock_db):
         """update_signal_status returns None when signal not found"""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_db.execute.return_value.one_or_none.return_value = None
 
         result = signal_service.update_signal_status(999, "APPROVED")
         assert result is None
+        mock_db.commit.assert_not_called()
+
+    def test_update_signal_status_without_returning(self, signal_service, mock_db):
+        """update_signal_status falls back to load and commit without RETURNING"""
+        mock_db.get_bind.return_value.dialect.update_returning = False
+        mock_signal = Mock()
+        mock_signal.id = 1
+        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = mock_signal
+
+        result = signal_service.update_signal_status(1, "CLOSED", pnl=10.0)
+
+        assert result is mock_signal
+        assert mock_signal.status == "CLOSED"
+        assert mock_signal.pnl == Decimal("10.00")
+        mock_db.execute.assert_not_called()
+        mock_db.commit.assert_called_once()
 
     # ===================
     # Statistics Tests
@@ -346,7 +652,7 @@ class TestSignalService:
 
     def test_get_statistics_empty(self, signal_service, mock_db):
         """get_statistics returns zeros when no signals"""
-        mock_db.query.return_value.filter.return_value.all.return_value = []
+        mock_db.query.return_value.filter.return_value.group_by.return_value.all.return_value = []
 
         stats = signal_service.get_statistics(days=30)
 
@@ -355,26 +661,99 @@ class TestSignalService:
 
     def test_get_statistics_with_signals(self, signal_service, mock_db):
         """get_statistics calculates correct values"""
-        # Create mock signals
-        mock_signals = [
-            Mock(signal_type="BUY", status="PENDING", pnl=None),
-            Mock(signal_type="BUY", status="CLOSED", pnl=Decimal("100")),
-            Mock(signal_type="SELL", status="CLOSED", pnl=Decimal("-50")),
-            Mock(signal_type="HOLD", status="PENDING", pnl=None),
+        # Rows of (signal_type, status, count) from the GROUP BY query
+        mock_db.query.return_value.filter.return_value.group_by.return_value.all.return_value = [
+            ("BUY", "PENDING", 1),
+            ("BUY", "CLOSED", 1),
+            ("SELL", "CLOSED", 1),
+            ("HOLD", "PENDING", 1),
         ]
-        mock_db.query.return_value.filter.return_value.all.return_value = mock_signals
+        # Closed signals: count, winners, average P&L
+        mock_db.query.return_value.filter.return_value.one.return_value = (2, 1, Decimal("25"))
 
         stats = signal_service.get_statistics(days=30)
 
         assert stats["total_signals"] == 4
         assert stats["by_type"]["BUY"] == 2
         assert stats["by_type"]["HOLD"] == 1
+        assert stats["by_status"] == {"PENDING": 2, "CLOSED": 2}
         assert stats["closed_signals"] == 2
         # 1 winner (100) / 2 closed = 50% win rate
         assert stats["win_rate"] == 0.5
         # (100 + -50) / 2 = 25 avg pnl
         assert stats["average_pnl"] == 25.0
 
+    def test_get_statistics_no_closed_signals(self, signal_service, mock_db):
+        """get_statistics has no win rate without closed signals"""
+        mock_db.query.return_value.filter.return_value.group_by.return_value.all.return_value = [
+            ("BUY", "PENDING", 3),
+        ]
+        mock_db.query.return_value.filter.return_value.one.return_value = (0, None, None)
+
+        stats = signal_service.get_statistics(days=30)
+
+        assert stats["closed_signals"] == 0
+        assert stats["win_rate"] is None
+        assert stats["average_pnl"] is None
+
+    def test_get_statistics_cached(self, signal_service, mock_db):
+        """get_statistics reuses results within the TTL, per window size"""
+        mock_db.query.return_value.filter.return_value.group_by.return_value.all.return_value = []
+
+        first = signal_service.get_statistics(days=30)
+        assert signal_service.get_statistics(days=30) is first
+        assert mock_db.query.call_count == 1
+
+        signal_service.get_statistics(days=7)
+        assert mock_db.query.call_count == 2
+
+    def test_get_statistics_expires(self, signal_service, mock_db):
+        """get_statistics queries again once the TTL has passed"""
+        mock_db.query.return_value.filter.return_value.group_by.return_value.all.return_value = []
+
+        with patch("app.services.signal_service.time.monotonic", side_effect=[0.0, 61.0]):
+            signal_service.get_statistics(days=30)
+            signal_service.get_statistics(days=30)
+
+        assert mock_db.query.call_count == 2
+
+    def test_save_signal_clears_statistics_cache(
+        self, signal_service, mock_db, sample_consensus
+    ):
+        """save_signal invalidates cached statistics"""
+        mock_db.query.return_value.filter.return_value.group_by.return_value.all.return_value = []
+        mock_db.execute.return_value.one.return_value = (1, datetime.now())
+
+        signal_service.get_statistics(days=30)
+        signal_service.save_signal(
+            consensus=sample_consensus,
+            entry_price=100.0,
+            portfolio_value=100000.0,
+        )
+        signal_service.get_statistics(days=30)
+
+        assert mock_db.query.call_count == 2
+
+    def test_get_statistics_skips_cache_after_concurrent_clear(
+        self, signal_service, mock_db
+    ):
+        """Stats computed while signals were written are not cached"""
+        mock_db.query.return_value.filter.return_value.group_by.return_value.all.return_value = []
+        compute = signal_service._compute_statistics
+
+        def compute_during_write(days):
+            stats = compute(days)
+            signal_service_module._clear_signal_caches()
+            return stats
+
+        with patch.object(
+            signal_service, "_compute_statistics", side_effect=compute_during_write
+        ):
+            signal_service.get_statistics(days=30)
+
+        signal_service.get_statistics(days=30)
+        assert mock_db.query.call_count == 2
+
     # ===================
     # Signal to Dict Tests
     # ===================
@@ -396,6 +775,8 @@ class TestSignalService:
         mock_signal.closed_at = None
         mock_signal.pnl = None
         mock_signal.notes = "Test signal"
+        mock_signal.agent_count = 4
+        mock_signal.agent_agreement = 0.75
         mock_signal.agent_analyses = []
 
         result = signal_service.signal_to_dict(mock_signal)
@@ -406,6 +787,25 @@ class TestSignalService:
         assert result["entry_price"] == 100.0
         assert result["target_price"] == 125.0
         assert result["stop_loss"] == 90.0
+        assert result["agent_count"] == 4
+        assert result["agent_agreement"] == 0.75
+
+    def test_signal_to_dict_analyses_only_when_requested(self, signal_service):
+        """signal_to_dict skips the agent_analyses relationship by default"""
+        analysis = Mock()
+        analysis.agent_name = "TestAgent1"
+        analysis.recommendation = "BUY"
+        analysis.confidence = 4
+        analysis.reasoning = "Test reasoning"
+        analysis.data_used = {}
+        analysis.timestamp = datetime(2024, 1, 1, 10, 0, 0)
+        mock_signal = MagicMock()
+        mock_signal.timestamp = datetime(2024, 1, 1, 10, 0, 0)
+        mock_signal.agent_analyses = [analysis]
+
+        assert signal_service.signal_to_dict(mock_signal)["agent_analyses"] == []
+        detail = signal_service.signal_to_dict(mock_signal, include_analyses=True)
+        assert detail["agent_analyses"][0]["agent_name"] == "TestAgent1"
 
 
 class TestGetSignalService:
@@ -413,6 +813,16 @@ class TestGetSignalService:
 
     def test_returns_signal_service(self):
         """get_signal_service returns SignalService instance"""
-        mock_db = Mock()
+        mock_db = Mock(info={})
         service = get_signal_service(mock_db)
         assert isinstance(service, SignalService)
+
+    def test_reuses_service_per_session(self):
+        """get_signal_service caches one instance per session"""
+        db_a = Mock(info={})
+        db_b = Mock(info={})
+
+        service = get_signal_service(db_a)
+        assert get_signal_service(db_a) is service
+        assert get_signal_service(db_b) is not service
+        assert get_signal_service(db_b).db is db_b
@@ -0,0 +1,326 @@
+"""
+Tests for Telegram Bot Service - message formatting and delivery
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.services.telegram_bot import TelegramBotService
+
+
+class TestTelegramBotService:
+    """Tests for TelegramBotService"""
+
+    @pytest.fixture
+    def telegram_service(self):
+        """Create a TelegramBotService with a token and chat configured"""
+        with patch("app.services.telegram_bot.settings") as mock_settings:
+            mock_settings.TELEGRAM_BOT_TOKEN = "test-token"
+            mock_settings.TELEGRAM_CHAT_ID = "12345"
+            yield TelegramBotService()
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        """Rate limiter waits are recorded instead of slept"""
+        with patch("app.services.telegram_bot.time.sleep") as sleep, patch(
+            "app.services.telegram_bot.asyncio.sleep", new=AsyncMock()
+        ):
+            yield sleep
+
+    @pytest.fixture
+    def mock_client(self, telegram_service):
+        """Replace the shared sync HTTP client"""
+        client = Mock()
+        client.post.return_value.json.return_value = {"ok": True}
+        telegram_service._client = client
+        return client
+
+    # ===================
+    # Formatting Tests
+    # ===================
+
+    def test_confidence_stars(self, telegram_service):
+        """Stars accept 0-1 confidence or the 1-5 scale"""
+        assert telegram_service._confidence_stars(0.8) == "⭐⭐⭐⭐"
+        assert telegram_service._confidence_stars(5) == "⭐⭐⭐⭐⭐"
+        assert telegram_service._confidence_stars(0.1) == ""
+
+    def test_daily_summary_lists_top_15(self, telegram_service, mock_client):
+        """Daily summary lists the 15 most confident signals, highest first"""
+        signals = [
+            {"ticker": f"T{i}", "signal_type": "BUY", "confidence": i / 20}
+            for i in range(20)
+        ]
+
+        assert telegram_service.send_daily_summary_sync(signals)
+
+        text = mock_client.post.call_args[1]["json"]["text"]
+        assert text.count("🟢 <b>T") == 15
+        assert text.index("<b>T19</b>") < text.index("<b>T18</b>")
+        assert "<b>T4</b>" not in text
+        assert "BUY: 20" in text
+
+    def test_signal_alert_missing_prices(self, telegram_service, mock_client):
+        """Alerts show N/A for prices that are not set"""
+        assert telegram_service.send_signal_alert_sync(
+            {"ticker": "NVDA", "signal_type": "BUY", "confidence": 0.8, "entry_price": 101.5}
+        )
+
+        text = mock_client.post.call_args[1]["json"]["text"]
+        assert "<b>Entry Price:</b> $101.50" in text
+        assert "<b>Target:</b> N/A" in text
+        assert "<b>Stop Loss:</b> N/A" in text
+
+    def test_daily_summary_empty(self, telegram_service):
+        """An empty day gets the no-signals summary"""
+        text = telegram_service._format_daily_summary([])
+
+        assert "No signals generated today." in text
+        assert "{" not in text
+
+    def test_start_command_includes_chat_id(self, telegram_service):
+        """/start shows the caller's chat id"""
+        telegram_service.send_message = AsyncMock(return_value=True)
+
+        result = asyncio.run(telegram_service.process_webhook(
+            {"message": {"text": "/start", "chat": {"id": 777}}}
+        ))
+
+        assert result == "start_handled"
+        assert "<code>777</code>" in telegram_service.send_message.call_args[0][0]
+
+    def test_signals_command_without_entry_price(self, telegram_service):
+        """/signals lists signals that have no entry price"""
+        signal = Mock(ticker="NVDA", signal_type="BUY", confidence=4, entry_price=None)
+        telegram_service.send_message = AsyncMock(return_value=True)
+        with patch("app.core.database.SessionLocal"), patch(
+            "app.services.signal_service.SignalService"
+        ) as service_cls:
+            service_cls.return_value.get_signals.return_value = [signal]
+            result = asyncio.run(telegram_service.process_webhook(
+                {"message": {"text": "/signals", "chat": {"id": 12345}}}
+            ))
+
+        assert result == "signals_sent"
+        assert "(80%) @ N/A" in telegram_service.send_message.call_args[0][0]
+
+    def test_status_command_single_query(self, telegram_service):
+        """/status fetches all counts in one query and closes the session"""
+        telegram_service.send_message = AsyncMock(return_value=True)
+        with patch("app.core.database.SessionLocal") as session_cls:
+            db = session_cls.return_value
+            db.execute.return_value.one.return_value._mapping = {
+                "total_signals": 120, "today_signals": 7, "active_stocks": 12,
+            }
+            result = asyncio.run(telegram_service.process_webhook(
+                {"message": {"text": "/status", "chat": {"id": 12345}}}
+            ))
+
+        assert result == "status_sent"
+        db.execute.assert_called_once()
+        db.close.assert_called_once()
+        text = telegram_service.send_message.call_args[0][0]
+        assert "<b>Total Signals:</b> 120" in text
+        assert "<b>Today's Signals:</b> 7" in text
+        assert "<b>Active Stocks:</b> 12" in text
+
+    def test_status_command_closes_session_on_error(self, telegram_service):
+        """/status closes the session when the query fails"""
+        telegram_service.send_message = AsyncMock(return_value=True)
+        with patch("app.core.database.SessionLocal") as session_cls:
+            db = session_cls.return_value
+            db.execute.side_effect = Exception("connection lost")
+            result = asyncio.run(telegram_service.process_webhook(
+                {"message": {"text": "/status", "chat": {"id": 12345}}}
+            ))
+
+        assert result == "status_error"
+        db.close.assert_called_once()
+
+    def test_watchlist_command_uses_projection(self, telegram_service):
+        """/watchlist lists ticker and tier rows and marks core tiers"""
+        telegram_service.send_message = AsyncMock(return_value=True)
+        with patch("app.core.database.SessionLocal") as session_cls:
+            db = session_cls.return_value
+            db.execute.return_value.all.return_value = [("NVDA", 1), ("PLTR", 3), ("AMD", None)]
+            result = asyncio.run(telegram_service.process_webhook(
+                {"message": {"text": "/watchlist", "chat": {"id": 12345}}}
+            ))
+
+        assert result == "watchlist_sent"
+        db.close.assert_called_once()
+        stmt = db.execute.call_args[0][0]
+        assert [c.name for c in stmt.selected_columns] == ["ticker", "tier"]
+        text = telegram_service.send_message.call_args[0][0]
+        assert "• <b>NVDA</b> ⭐" in text
+        assert "• <b>PLTR</b> \n" in text
+        assert "Total: 3 stocks" in text
+
+    # ===================
+    # Sync Delivery Tests
+    # ===================
+
+    def test_send_message_sync_reuses_client(self, telegram_service):
+        """Consecutive sync sends share one HTTP client"""
+        with patch("app.services.telegram_bot.httpx.Client") as client_cls:
+            client_cls.return_value.post.return_value.json.return_value = {"ok": True}
+
+            assert telegram_service.send_message_sync("one")
+            assert telegram_service.send_message_sync("two")
+
+        client_cls.assert_called_once()
+        assert client_cls.return_value.post.call_count == 2
+
+    def test_send_message_sync_payload(self, telegram_service, mock_client):
+        """send_message_sync posts HTML text to the default chat"""
+        assert telegram_service.send_message_sync("hello")
+
+        url = mock_client.post.call_args[0][0]
+        assert url == "https://api.telegram.org/bottest-token/sendMessage"
+        assert mock_client.post.call_args[1]["json"] == {
+            "chat_id": "12345",
+            "text": "hello",
+            "parse_mode": "HTML",
+        }
+
+    def test_send_message_sync_api_error(self, telegram_service, mock_client):
+        """send_message_sync returns False when the API rejects the message"""
+        mock_client.post.return_value.json.return_value = {"ok": False}
+        assert telegram_service.send_message_sync("hello") is False
+
+    # ===================
+    # Rate Limit Tests
+    # ===================
+
+    def test_send_slots_spaced_per_chat(self, telegram_service):
+        """Sends to one chat are spaced by CHAT_SEND_INTERVAL"""
+        with patch("app.services.telegram_bot.time.monotonic", return_value=100.0):
+            waits = [telegram_service._reserve_send_slot("1") for _ in range(3)]
+
+        assert waits == pytest.approx([0.0, 1.0, 2.0])
+
+    def test_send_slots_global_interval(self, telegram_service):
+        """Sends to different chats only respect the global interval"""
+        with patch("app.services.telegram_bot.time.monotonic", return_value=100.0):
+            waits = [telegram_service._reserve_send_slot(str(chat)) for chat in range(3)]
+
+        assert waits == pytest.approx([0.0, 1 / 30, 2 / 30])
+
+    def test_send_message_sync_waits_for_slot(self, telegram_service, mock_client, no_sleep):
+        """A second message to the same chat waits before sending"""
+        telegram_service.send_message_sync("one")
+        telegram_service.send_message_sync("two")
+
+        no_sleep.assert_called_once()
+        assert no_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.1)
+
+    def test_send_message_sync_retries_after_429(self, telegram_service, mock_client, no_sleep):
+        """A 429 response is retried once after retry_after seconds"""
+        mock_client.post.return_value.json.side_effect = [
+            {"ok": False, "error_code": 429, "parameters": {"retry_after": 3}},
+            {"ok": True},
+        ]
+
+        assert telegram_service.send_message_sync("hello")
+        assert mock_client.post.call_count == 2
+        assert 3.0 in [call[0][0] for call in no_sleep.call_args_list]
+
+    def test_send_message_sync_gives_up_after_second_429(self, telegram_service, mock_client):
+        """send_message_sync fails if the retry is also rate limited"""
+        mock_client.post.return_value.json.return_value = {
+            "ok": False, "error_code": 429, "parameters": {"retry_after": 1},
+        }
+
+        assert telegram_service.send_message_sync("hello") is False
+        assert mock_client.post.call_count == 2
+
+    # ===================
+    # Batched Alert Tests
+    # ===================
+
+    @staticmethod
+    def _alert(ticker, signal_type="BUY"):
+        return {
+            "ticker": ticker,
+            "signal_type": signal_type,
+            "confidence": 0.8,
+            "entry_price": 100.0,
+            "target_price": 125.0,
+            "stop_loss": 90.0,
+        }
+
+    def test_send_signal_alerts_single_uses_regular_alert(self, telegram_service, mock_client):
+        """One signal is sent with the regular alert format"""
+        assert telegram_service.send_signal_alerts_sync([self._alert("NVDA")])
+
+        text = mock_client.post.call_args[1]["json"]["text"]
+        assert "SIGNAL ALERT</b>" in text
+        assert "<b>NVDA</b>" in text
+
+    def test_send_signal_alerts_combined(self, telegram_service, mock_client):
+        """Several signals go out as one combined message"""
+        alerts = [self._alert("NVDA"), self._alert("AMD", "SELL"), self._alert("TSLA")]
+
+        assert telegram_service.send_signal_alerts_sync(alerts)
+
+        mock_client.post.assert_called_once()
+        text = mock_client.post.call_args[1]["json"]["text"]
+        assert "(3 signals)" in text
+        assert "🔴 <b>AMD</b> - <b>SELL</b>" in text
+        assert "$125.00" in text
+
+    def test_send_signal_alerts_split_by_batch_size(self, telegram_service, mock_client):
+        """Large bursts are split into ALERT_BATCH_SIZE messages"""
+        alerts = [self._alert(f"T{i}") for i in range(telegram_service.ALERT_BATCH_SIZE + 1)]
+
+        assert telegram_service.send_signal_alerts_sync(alerts)
+        assert mock_client.post.call_count == 2
+
+    # ===================
+    # Async Delivery Tests
+    # ===================
+
+    def test_send_message_reuses_async_client(self, telegram_service):
+        """Async sends on one event loop share one AsyncClient"""
+        with patch("app.services.telegram_bot.httpx.AsyncClient") as client_cls:
+            client_cls.return_value.is_closed = False
+            client_cls.return_value.aclose = AsyncMock()
+            client_cls.return_value.post = AsyncMock()
+            client_cls.return_value.post.return_value.json = Mock(return_value={"ok": True})
+
+            async def send_twice():
+                return [
+                    await telegram_service.send_message("one"),
+                    await telegram_service.send_message("two"),
+                ]
+
+            assert asyncio.run(send_twice()) == [True, True]
+            assert client_cls.call_count == 1
+
+            # A new event loop gets its own client and the old one is closed
+            assert asyncio.run(telegram_service.send_message("three"))
+            assert client_cls.call_count == 2
+            client_cls.return_value.aclose.assert_awaited_once()
+
+    def test_aclose_closes_clients(self, telegram_service):
+        """aclose closes both shared clients and forgets them"""
+        async_client = Mock(is_closed=False, aclose=AsyncMock())
+        sync_client = Mock()
+        telegram_service._async_client = async_client
+        telegram_service._client = sync_client
+
+        asyncio.run(telegram_service.aclose())
+
+        async_client.aclose.assert_awaited_once()
+        sync_client.close.assert_called_once()
+        assert telegram_service._async_client is None
+        assert telegram_service._client is None
+
+    def test_close_telegram_service_without_instance(self):
+        """Shutdown is a no-op when the service was never created"""
+        from app.services import telegram_bot
+
+        with patch.object(telegram_bot, "_telegram_service", None):
+            asyncio.run(telegram_bot.close_telegram_service())
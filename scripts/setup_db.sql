@@ -17,11 +17,15 @@ CREATE TABLE IF NOT EXISTS signals (
     id SERIAL PRIMARY KEY,
     timestamp TIMESTAMP NOT NULL DEFAULT NOW(),
     ticker VARCHAR(10) NOT NULL,
-    signal_type VARCHAR(10) NOT NULL, -- BUY, SELL, HOLD
+    signal_type SMALLINT NOT NULL -- HOLD=0, BUY=1, SELL=2 (SIGNAL_TYPE_CODES)
+        CONSTRAINT ck_signals_signal_type CHECK (signal_type IN (0, 1, 2)),
     confidence INTEGER NOT NULL, -- 1-5 (number of agents agreeing)
     entry_price DECIMAL(10,2),
     target_price DECIMAL(10,2),
     stop_loss DECIMAL(10,2),
+    composite_score DOUBLE PRECISION, -- SignalRanker score, set on write
+    agent_count INTEGER, -- Number of agent analyses, set on write
+    agent_agreement DOUBLE PRECISION, -- Fraction of agents agreeing with signal_type
     position_size INTEGER, -- Number of shares
     status VARCHAR(20) DEFAULT 'PENDING', -- PENDING, APPROVED, EXECUTED, CLOSED
     executed_at TIMESTAMP,
@@ -163,6 +167,10 @@ CREATE TABLE IF NOT EXISTS system_config (
 CREATE INDEX IF NOT EXISTS idx_signals_ticker ON signals(ticker);
 CREATE INDEX IF NOT EXISTS idx_signals_timestamp ON signals(timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_signals_status ON signals(status);
+CREATE INDEX IF NOT EXISTS ix_signals_composite_score ON signals(composite_score);
+CREATE INDEX IF NOT EXISTS idx_signals_timestamp_ticker_type_status
+    ON signals(timestamp DESC, ticker, signal_type, status);
+CREATE INDEX IF NOT EXISTS idx_signals_pending ON signals(timestamp DESC) WHERE status = 'PENDING';
 CREATE INDEX IF NOT EXISTS idx_agent_analysis_signal ON agent_analysis(signal_id);
 CREATE INDEX IF NOT EXISTS idx_market_data_ticker_time ON market_data(ticker, timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_sentiment_ticker_time ON sentiment_data(ticker, timestamp DESC);
@@ -175,6 +183,11 @@ CREATE INDEX IF NOT EXISTS idx_agent_weights_history_agent ON agent_weights_hist
 CREATE INDEX IF NOT EXISTS idx_learning_log_date ON learning_log(date DESC);
 CREATE INDEX IF NOT EXISTS idx_learning_log_event_type ON learning_log(event_type);
 CREATE INDEX IF NOT EXISTS idx_learning_log_agent ON learning_log(agent_name);
+CREATE INDEX IF NOT EXISTS idx_learning_log_event_type_date ON learning_log(event_type, date);
+-- One REGIME_SHIFT row per date and shift; log_regime_shift relies on it for ON CONFLICT
+CREATE UNIQUE INDEX IF NOT EXISTS uix_learning_log_regime_shift
+    ON learning_log(date, event_type, metric_name)
+    WHERE event_type = 'REGIME_SHIFT';
 CREATE INDEX IF NOT EXISTS idx_system_config_key ON system_config(config_key);
 
 -- Seed initial watchlist with AI stocks